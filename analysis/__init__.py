@@ -0,0 +1,5 @@
+"""
+분석 패키지
+
+이 패키지는 AI 트레이딩 시스템의 기술적 지표 및 데이터 분석 관련 모듈을 포함합니다.
+"""
@@ -0,0 +1,431 @@
+"""
+재귀 계산 백엔드 모듈
+
+EMA, Wilder 평활(RSI, ADX), Parabolic SAR, 이동 분위수처럼 앞의 결과에 의존하는 순차 계산 커널과
+커널 구현(백엔드)을 선택하는 레지스트리를 제공합니다.
+numba가 설치되어 있으면 JIT 백엔드를, 없으면 numpy 백엔드를 자동으로 선택하며,
+set_backend() 또는 use_backend()로 백엔드를 직접 지정할 수 있습니다. 모든 백엔드의 결과는 같습니다.
+
+지표 모듈(indicators, rolling, transforms)은 kernel()로 현재 백엔드의 커널을 가져옵니다.
+    kernel("ema")(values, k, start, seed, out)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+
+import numpy as np
+
+def window_statistic(window, size, value, mode, q):
+    """
+    정렬된 구간의 통계값
+    
+    mode 0: q 분위수 (np.quantile 선형 보간과 같은 계산), 1: 중앙값 (np.median과 같은 계산),
+    2: value의 백분위 순위 (같은 값은 평균 순위, 0 ~ 100)
+    """
+    if mode == 2:
+        less = bisect_left(window, value, 0, size)
+        equal = bisect_right(window, value, 0, size) - less
+        return (less + (equal + 1) / 2) / size * 100
+    if mode == 1:
+        middle = size // 2
+        if size % 2:
+            return window[middle]
+        return (window[middle-1] + window[middle]) / 2
+    
+    position = q * (size - 1)
+    lower = int(position)
+    upper = min(lower + 1, size - 1)
+    fraction = position - lower
+    diff = window[upper] - window[lower]
+    if fraction >= 0.5:
+        return window[upper] - diff * (1 - fraction)
+    return window[lower] + diff * fraction
+
+def _numpy_ema(values, k, start, seed, out):
+    """
+    EMA 재귀 커널 (numpy 백엔드)
+    
+    배열 원소 접근 대신 파이썬 float 리스트로 반복하여 원소 단위 루프보다 빠르며,
+    연산 순서가 같으므로 결과는 기존 루프와 비트 단위로 같습니다.
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        k (float): 평활 계수
+        start (int): 시작 위치
+        seed (float): 시작 위치의 값
+        out (numpy.ndarray): 결과를 저장할 배열 (start 이후만 기록)
+    """
+    decay = 1 - k
+    previous = float(seed)
+    smoothed = [previous]
+    for value in values[start+1:].tolist():
+        previous = value * k + previous * decay
+        smoothed.append(previous)
+    out[start:] = smoothed
+
+def _numpy_wilder(values, period, start, seed, out, sum_form):
+    """
+    Wilder 평활 재귀 커널 (numpy 백엔드)
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        period (int): 평활 기간
+        start (int): 시작 위치
+        seed (float): 시작 위치의 값
+        out (numpy.ndarray): 결과를 저장할 배열 (start 이후만 기록)
+        sum_form (bool): 합계 형태 평활 여부
+    """
+    previous = float(seed)
+    smoothed = [previous]
+    
+    if sum_form:
+        for value in values[start+1:].tolist():
+            previous = previous - (previous / period) + value
+            smoothed.append(previous)
+    else:
+        weight = period - 1
+        for value in values[start+1:].tolist():
+            previous = (previous * weight + value) / period
+            smoothed.append(previous)
+    
+    out[start:] = smoothed
+
+def _numpy_parabolic_sar(high_data, low_data, af_start, af_increment, af_max, out):
+    """
+    Parabolic SAR 상태 기계 커널 (numpy 백엔드)
+    
+    Args:
+        high_data (numpy.ndarray): float64 고가 데이터
+        low_data (numpy.ndarray): float64 저가 데이터
+        af_start (float): 초기 가속 계수
+        af_increment (float): 가속 계수 증가분
+        af_max (float): 최대 가속 계수
+        out (numpy.ndarray): SAR를 저장할 배열
+        
+    Returns:
+        tuple: (마지막 추세, 마지막 EP, 마지막 AF)
+    """
+    high = high_data.tolist()
+    low = low_data.tolist()
+    
+    # 초기값 설정
+    trend = 1  # 1: 상승, -1: 하락
+    ep = high[0]  # Extreme Point
+    af = af_start  # Acceleration Factor
+    
+    # 첫 번째 SAR
+    previous = low[0]
+    sar = [previous]
+    
+    for i in range(1, len(out)):
+        # 이전 SAR
+        value = previous + af * (ep - previous)
+        
+        # 추세 전환 확인
+        if trend == 1:  # 상승 추세
+            # SAR가 현재 또는 이전 저가보다 높으면 추세 전환
+            if value > low[i] or value > low[i-1]:
+                trend = -1
+                value = max(high[i], high[i-1])
+                ep = low[i]
+                af = af_start
+            elif high[i] > ep:
+                # 상승 추세 유지
+                ep = high[i]
+                af = min(af + af_increment, af_max)
+        else:  # 하락 추세
+            # SAR가 현재 또는 이전 고가보다 낮으면 추세 전환
+            if value < high[i] or value < high[i-1]:
+                trend = 1
+                value = min(low[i], low[i-1])
+                ep = high[i]
+                af = af_start
+            elif low[i] < ep:
+                # 하락 추세 유지
+                ep = low[i]
+                af = min(af + af_increment, af_max)
+        
+        sar.append(value)
+        previous = value
+    
+    out[:] = sar
+    return trend, ep, af
+
+def _numpy_sorted_window(values, period, mode, q, out):
+    """
+    정렬 구간 커널 (numpy 백엔드)
+    
+    최근 period개 값을 정렬된 리스트로 유지하며, 새 값 삽입과 오래된 값 제거 위치를
+    이진 탐색(O(log period))으로 찾습니다. 구간에 NaN이 있으면 NaN입니다.
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        period (int): 구간 길이
+        mode (int): 0 분위수, 1 중앙값, 2 백분위 순위
+        q (float): 분위수 (0 ~ 1, mode 0에서만 사용)
+        out (numpy.ndarray): 결과를 저장할 배열
+    """
+    window = []
+    nan_count = 0
+    items = values.tolist()
+    result = [np.nan] * len(items)
+    
+    for i, value in enumerate(items):
+        if value != value:
+            nan_count += 1
+        else:
+            insort(window, value)
+        if i >= period:
+            old = items[i-period]
+            if old != old:
+                nan_count -= 1
+            else:
+                del window[bisect_left(window, old)]
+        if i >= period - 1 and nan_count == 0:
+            result[i] = window_statistic(window, len(window), value, mode, q)
+    
+    out[:] = result
+
+def _numpy_kernels():
+    """numpy 백엔드 커널"""
+    return {
+        "ema": _numpy_ema,
+        "wilder": _numpy_wilder,
+        "parabolic_sar": _numpy_parabolic_sar,
+        "sorted_window": _numpy_sorted_window,
+    }
+
+def _numba_kernels():
+    """
+    numba JIT 백엔드 커널
+    
+    numpy 백엔드와 같은 연산 순서로 컴파일하므로 결과가 같습니다.
+    (Python의 max/min과 같은 NaN 처리를 위해 비교식을 직접 사용)
+    
+    Raises:
+        ImportError: numba가 설치되어 있지 않은 경우
+    """
+    import numba
+    
+    @numba.njit(cache=True)
+    def ema(values, k, start, seed, out):
+        decay = 1 - k
+        out[start] = seed
+        for i in range(start + 1, len(values)):
+            out[i] = values[i] * k + out[i-1] * decay
+    
+    @numba.njit(cache=True)
+    def wilder(values, period, start, seed, out, sum_form):
+        out[start] = seed
+        previous = seed
+        if sum_form:
+            for i in range(start + 1, len(values)):
+                previous = previous - (previous / period) + values[i]
+                out[i] = previous
+        else:
+            weight = period - 1
+            for i in range(start + 1, len(values)):
+                previous = (previous * weight + values[i]) / period
+                out[i] = previous
+    
+    @numba.njit(cache=True)
+    def parabolic_sar(high, low, af_start, af_increment, af_max, out):
+        trend = 1
+        ep = high[0]
+        af = af_start
+        out[0] = low[0]
+        for i in range(1, len(out)):
+            value = out[i-1] + af * (ep - out[i-1])
+            if trend == 1:
+                if value > low[i] or value > low[i-1]:
+                    trend = -1
+                    value = high[i-1] if high[i-1] > high[i] else high[i]
+                    ep = low[i]
+                    af = af_start
+                elif high[i] > ep:
+                    ep = high[i]
+                    af = af_max if af_max < af + af_increment else af + af_increment
+            else:
+                if value < high[i] or value < high[i-1]:
+                    trend = 1
+                    value = low[i-1] if low[i-1] < low[i] else low[i]
+                    ep = high[i]
+                    af = af_start
+                elif low[i] < ep:
+                    ep = low[i]
+                    af = af_max if af_max < af + af_increment else af + af_increment
+            out[i] = value
+        return trend, ep, af
+    
+    @numba.njit(cache=True)
+    def search(window, size, value, right):
+        lo, hi = 0, size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if window[mid] < value or (right and window[mid] == value):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    @numba.njit(cache=True)
+    def sorted_window(values, period, mode, q, out):
+        window = np.empty(period + 1)
+        size = 0
+        nan_count = 0
+        for i in range(len(values)):
+            value = values[i]
+            if value != value:
+                nan_count += 1
+            else:
+                position = search(window, size, value, True)
+                for j in range(size, position, -1):
+                    window[j] = window[j-1]
+                window[position] = value
+                size += 1
+            if i >= period:
+                old = values[i-period]
+                if old != old:
+                    nan_count -= 1
+                else:
+                    position = search(window, size, old, False)
+                    for j in range(position, size - 1):
+                        window[j] = window[j+1]
+                    size -= 1
+            
+            if i < period - 1 or nan_count > 0:
+                out[i] = np.nan
+            elif mode == 2:
+                less = search(window, size, value, False)
+                equal = search(window, size, value, True) - less
+                out[i] = (less + (equal + 1) / 2) / size * 100
+            elif mode == 1:
+                middle = size // 2
+                if size % 2:
+                    out[i] = window[middle]
+                else:
+                    out[i] = (window[middle-1] + window[middle]) / 2
+            else:
+                position = q * (size - 1)
+                lower = int(position)
+                upper = min(lower + 1, size - 1)
+                fraction = position - lower
+                diff = window[upper] - window[lower]
+                if fraction >= 0.5:
+                    out[i] = window[upper] - diff * (1 - fraction)
+                else:
+                    out[i] = window[lower] + diff * fraction
+    
+    return {
+        "ema": ema,
+        "wilder": wilder,
+        "parabolic_sar": parabolic_sar,
+        "sorted_window": sorted_window,
+    }
+
+# 재귀 계산 백엔드 {이름: (우선순위, 커널 생성 함수)}
+_BACKEND_FACTORIES = {}
+_backend_kernels = {}
+_backend_errors = {}
+_selected_backend = None  # None이면 자동 선택
+
+def register_backend(name, factory, priority=0):
+    """
+    재귀 계산 백엔드 등록
+    
+    Args:
+        name (str): 백엔드 이름
+        factory (callable): "ema", "wilder", "parabolic_sar", "sorted_window" 커널 딕셔너리를 반환하는 함수
+                            (사용할 수 없으면 ImportError 발생)
+        priority (int): 자동 선택 우선순위 (클수록 우선)
+    """
+    _BACKEND_FACTORIES[name] = (priority, factory)
+    _backend_kernels.pop(name, None)
+    _backend_errors.pop(name, None)
+
+def _load_backend(name):
+    """백엔드 커널 로드 (사용할 수 없으면 None)"""
+    if name in _backend_kernels:
+        return _backend_kernels[name]
+    if name in _backend_errors:
+        return None
+    
+    try:
+        kernels = _BACKEND_FACTORIES[name][1]()
+    except ImportError as e:
+        _backend_errors[name] = str(e)
+        return None
+    
+    _backend_kernels[name] = kernels
+    return kernels
+
+def available_backends():
+    """
+    사용 가능한 백엔드 목록
+    
+    Returns:
+        list: 우선순위 순서의 백엔드 이름
+    """
+    names = sorted(_BACKEND_FACTORIES, key=lambda name: -_BACKEND_FACTORIES[name][0])
+    return [name for name in names if _load_backend(name) is not None]
+
+def set_backend(name=None):
+    """
+    재귀 계산 백엔드 지정
+    
+    Args:
+        name (str): 백엔드 이름 (None이면 자동 선택)
+        
+    Raises:
+        ValueError: 등록되지 않았거나 사용할 수 없는 백엔드인 경우
+    """
+    global _selected_backend
+    
+    if name is not None:
+        if name not in _BACKEND_FACTORIES:
+            raise ValueError(f"등록되지 않은 백엔드입니다: {name}")
+        if _load_backend(name) is None:
+            raise ValueError(f"사용할 수 없는 백엔드입니다: {name} ({_backend_errors[name]})")
+    
+    _selected_backend = name
+
+def get_backend():
+    """
+    현재 백엔드 이름
+    
+    Returns:
+        str: 지정된 백엔드, 또는 자동 선택된 백엔드
+    """
+    if _selected_backend is not None:
+        return _selected_backend
+    return available_backends()[0]
+
+@contextmanager
+def use_backend(name):
+    """
+    with 블록 안에서만 백엔드 지정 (벤치마크용)
+    
+    Args:
+        name (str): 백엔드 이름 (None이면 자동 선택)
+    """
+    previous = _selected_backend
+    set_backend(name)
+    try:
+        yield
+    finally:
+        set_backend(previous)
+
+def kernel(name):
+    """
+    현재 백엔드의 커널
+    
+    Args:
+        name (str): 커널 이름 ("ema", "wilder", "parabolic_sar", "sorted_window")
+        
+    Returns:
+        callable: 커널 함수
+    """
+    return _load_backend(get_backend())[name]
+
+register_backend("numpy", _numpy_kernels, priority=0)
+register_backend("numba", _numba_kernels, priority=10)
@@ -0,0 +1,249 @@
+"""
+지표 결과 캐시 모듈
+
+같은 데이터에 대한 지표 재계산을 피하기 위한 프로세스 전역 LRU 캐시를 제공합니다.
+키는 (종목코드, 시간단위, 함수, 파라미터, 데이터 지문)이며, 결과 배열의 바이트 크기 합이
+상한을 넘으면 가장 오래 사용하지 않은 결과부터 제거합니다.
+
+봉이 추가되거나 이력이 교체되면 데이터 지문이 바뀌므로 이전 결과는 사용되지 않고,
+같은 (종목코드, 시간단위, 함수, 파라미터)의 이전 결과는 새 결과 저장 시 함께 제거됩니다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+def data_fingerprint(*inputs):
+    """
+    입력 데이터 지문 계산
+
+    Args:
+        *inputs: 입력 데이터 (배열 또는 리스트)
+
+    Returns:
+        tuple: (길이 목록, 내용 해시)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    lengths = []
+    for values in inputs:
+        array = np.ascontiguousarray(values)
+        lengths.append(len(array))
+        digest.update(str(array.dtype).encode())
+        digest.update(array.tobytes())
+    return tuple(lengths), digest.hexdigest()
+
+def _freeze(value):
+    """파라미터 값을 해시 가능한 형태로 변환"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    return value
+
+def _function_name(function):
+    """함수 식별 이름"""
+    if isinstance(function, str):
+        return function
+    return f"{function.__module__}.{function.__qualname__}"
+
+def _result_nbytes(result):
+    """결과 배열의 바이트 크기"""
+    if isinstance(result, tuple):
+        return sum(_result_nbytes(item) for item in result)
+    if isinstance(result, np.ndarray):
+        return result.nbytes
+    return 0
+
+def _make_readonly(result):
+    """캐시된 결과가 호출자에 의해 수정되지 않도록 읽기 전용으로 설정"""
+    if isinstance(result, tuple):
+        for item in result:
+            _make_readonly(item)
+    elif isinstance(result, np.ndarray):
+        result.flags.writeable = False
+
+class IndicatorCache:
+    """
+    지표 결과 LRU 캐시 클래스
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        초기화
+
+        Args:
+            max_bytes (int): 캐시할 결과 배열의 최대 바이트 크기 합
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (result, nbytes)
+        self._latest = {}  # (code, timeframe, function, params) -> key
+        self._lock = threading.RLock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(code, timeframe, function, params, fingerprint):
+        """
+        캐시 키 생성
+
+        Args:
+            code (str): 종목코드
+            timeframe (str): 시간단위 (예: "day", "minute:1")
+            function: 지표 함수 또는 이름
+            params (dict): 지표 파라미터
+            fingerprint: data_fingerprint() 결과
+
+        Returns:
+            tuple: 캐시 키
+        """
+        return (code, timeframe, _function_name(function), _freeze(params or {}), fingerprint)
+
+    def get(self, key):
+        """
+        캐시 조회
+
+        Args:
+            key (tuple): 캐시 키
+
+        Returns:
+            결과 (없으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, result):
+        """
+        캐시 저장
+
+        Args:
+            key (tuple): 캐시 키
+            result: 지표 결과 (배열 또는 배열 튜플)
+        """
+        nbytes = _result_nbytes(result)
+        if nbytes > self.max_bytes:
+            return
+
+        _make_readonly(result)
+
+        with self._lock:
+            # 같은 지표의 이전 데이터 결과 제거 (봉 추가, 이력 교체)
+            series_key = key[:4]
+            previous = self._latest.get(series_key)
+            if previous is not None and previous != key:
+                self._remove(previous)
+
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = (result, nbytes)
+            self._latest[series_key] = key
+            self.current_bytes += nbytes
+
+            while self.current_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key):
+        """항목 제거 (잠금 상태에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.current_bytes -= entry[1]
+        if self._latest.get(key[:4]) == key:
+            del self._latest[key[:4]]
+
+    def compute(self, code, timeframe, function, inputs, **params):
+        """
+        캐시된 결과 반환, 없으면 계산 후 저장
+
+        Args:
+            code (str): 종목코드
+            timeframe (str): 시간단위
+            function (callable): 지표 함수 (function(*inputs, **params))
+            inputs (list): 입력 데이터 목록
+            **params: 지표 파라미터
+
+        Returns:
+            지표 결과 (읽기 전용 배열 또는 배열 튜플)
+        """
+        key = self.make_key(code, timeframe, function, params, data_fingerprint(*inputs))
+        result = self.get(key)
+        if result is None:
+            result = function(*inputs, **params)
+            self.put(key, result)
+        return result
+
+    def invalidate(self, code=None, timeframe=None):
+        """
+        캐시 무효화
+
+        Args:
+            code (str, optional): 종목코드 (없으면 전체)
+            timeframe (str, optional): 시간단위 (없으면 전체)
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (code is None or key[0] == code) and (timeframe is None or key[1] == timeframe)
+            ]
+            for key in keys:
+                self._remove(key)
+
+    def clear(self):
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._latest.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: 항목 수, 바이트 크기, 적중/실패/제거 횟수
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+# 프로세스 전역 캐시
+indicator_cache = IndicatorCache()
+
+def cached_indicator(code, timeframe, function, inputs, **params):
+    """
+    전역 캐시를 사용한 지표 계산
+
+    Args:
+        code (str): 종목코드
+        timeframe (str): 시간단위
+        function (callable): 지표 함수
+        inputs (list): 입력 데이터 목록
+        **params: 지표 파라미터
+
+    Returns:
+        지표 결과 (읽기 전용 배열 또는 배열 튜플)
+    """
+    return indicator_cache.compute(code, timeframe, function, inputs, **params)
@@ -0,0 +1,335 @@
+"""
+캔들 패턴 인식 모듈
+
+도지, 망치형, 장악형, 샛별형, 적삼병 등 전통적인 캔들 패턴을 (종목 × 봉) OHLC 행렬 전체에 대해
+한 번의 벡터 연산으로 판별합니다. 몸통/꼬리 길이 등 공통 특징은 한 번만 계산하고
+모든 패턴이 공유하며, 여러 봉 패턴은 배열을 봉 방향으로 어긋나게 잘라(slice) 비교하므로 복사가 없습니다.
+
+결과는 (패턴 수, ...) 형태의 bool 배열이므로 analysis.cache의 지표 캐시에 그대로 저장됩니다.
+    cached_indicator(code, "day", candle_patterns, [open, high, low, close], patterns=("hammer", "doji"))
+
+판별 기준:
+    - 긴/짧은 몸통: 직전 trend_period개 봉의 평균 몸통 길이 대비
+    - 추세: 직전 봉 종가와 직전 봉까지의 trend_period 이동평균 비교 (하락 추세에서의 망치형 등)
+    준비 구간(종목별 첫 유효 봉부터 trend_period개 봉)은 모든 패턴이 False입니다.
+    이력 길이가 달라 앞쪽이 NaN으로 채워진(오른쪽 정렬) 행도 해당 종목만 1차원으로 판별한 결과와 같습니다.
+"""
+
+import numpy as np
+
+from .rolling import rolling_mean, _scratch
+from .universe import _first_valid_index
+
+# 패턴 이름: 방향 (1: 상승 반전/지속, -1: 하락, 0: 중립)
+PATTERNS = {
+    "doji": 0,
+    "dragonfly_doji": 1,
+    "gravestone_doji": -1,
+    "spinning_top": 0,
+    "hammer": 1,
+    "hanging_man": -1,
+    "inverted_hammer": 1,
+    "shooting_star": -1,
+    "bullish_marubozu": 1,
+    "bearish_marubozu": -1,
+    "bullish_engulfing": 1,
+    "bearish_engulfing": -1,
+    "bullish_harami": 1,
+    "bearish_harami": -1,
+    "piercing_line": 1,
+    "dark_cloud_cover": -1,
+    "tweezer_bottom": 1,
+    "tweezer_top": -1,
+    "morning_star": 1,
+    "evening_star": -1,
+    "three_white_soldiers": 1,
+    "three_black_crows": -1,
+}
+
+# 판별 기준 비율
+DOJI_BODY = 0.1          # 도지: 몸통 ≤ 고저폭 × 비율
+SMALL_SHADOW = 0.1       # 짧은 꼬리: 꼬리 ≤ 고저폭 × 비율
+LONG_SHADOW = 2.0        # 긴 꼬리: 꼬리 ≥ 몸통 × 배수
+MARUBOZU_SHADOW = 0.05   # 마루보즈: 양쪽 꼬리 ≤ 고저폭 × 비율
+SHORT_BODY = 0.5         # 짧은 몸통: 몸통 < 평균 몸통 × 비율
+TWEEZER_TOLERANCE = 0.05 # 족집게: 두 봉의 저가/고가 차이 ≤ 고저폭 × 비율
+
+# 여러 봉 패턴이 참조하는 최대 이전 봉 수
+MAX_LAG = 2
+
+class _Candles:
+    """
+    패턴 판별용 캔들 특징
+
+    각 특징은 전체 봉 배열로 한 번 계산하고, at(name, lag)은 판별 대상 봉 [MAX_LAG:]에 대해
+    lag개 이전 봉의 값을 가리키는 보기(view)를 반환합니다.
+    """
+
+    def __init__(self, open_data, high_data, low_data, close_data, trend_period, workspace=None):
+        self.open = np.asarray(open_data, dtype=np.float64)
+        self.high = np.asarray(high_data, dtype=np.float64)
+        self.low = np.asarray(low_data, dtype=np.float64)
+        self.close = np.asarray(close_data, dtype=np.float64)
+        self.length = self.close.shape[-1]
+        shape = self.close.shape
+
+        self.body = np.subtract(self.close, self.open, out=_scratch(workspace, "candle_body", shape))
+        self.body_size = np.abs(self.body, out=_scratch(workspace, "candle_body_size", shape))
+        self.range = np.subtract(self.high, self.low, out=_scratch(workspace, "candle_range", shape))
+        self.body_top = np.maximum(self.open, self.close, out=_scratch(workspace, "candle_body_top", shape))
+        self.body_bottom = np.minimum(self.open, self.close, out=_scratch(workspace, "candle_body_bottom", shape))
+        self.upper = np.subtract(self.high, self.body_top, out=_scratch(workspace, "candle_upper", shape))
+        self.lower = np.subtract(self.body_bottom, self.low, out=_scratch(workspace, "candle_lower", shape))
+        self.middle = np.add(self.open, self.close, out=_scratch(workspace, "candle_middle", shape))
+        self.middle *= 0.5
+
+        # 직전 trend_period개 봉 기준 (현재 봉 미포함)
+        self.average_body = self._previous(rolling_mean(self.body_size, trend_period,
+                                                        _scratch(workspace, "candle_average_body", shape), workspace),
+                                           workspace, "candle_previous_body")
+        average_close = rolling_mean(self.close, trend_period, _scratch(workspace, "candle_average_close", shape), workspace)
+        self.downtrend = self._previous(self.close < average_close, workspace, "candle_downtrend", np.bool_)
+        self.uptrend = self._previous(self.close > average_close, workspace, "candle_uptrend", np.bool_)
+
+    def _previous(self, values, workspace, name, dtype=np.float64):
+        """한 봉 뒤로 민 배열 (첫 봉은 NaN 또는 False)"""
+        shifted = _scratch(workspace, name, values.shape, dtype)
+        shifted[..., 0] = np.nan if dtype == np.float64 else False
+        shifted[..., 1:] = values[..., :-1]
+        return shifted
+
+    def at(self, name, lag=0):
+        """판별 대상 봉 기준 lag개 이전 봉의 특징"""
+        return getattr(self, name)[..., MAX_LAG-lag:self.length-lag]
+
+    def long_body(self, lag=0):
+        """평균보다 긴 몸통"""
+        return self.at("body_size", lag) > self.at("average_body", lag)
+
+    def short_body(self, lag=0):
+        """평균의 SHORT_BODY배보다 짧은 몸통"""
+        return self.at("body_size", lag) < self.at("average_body", lag) * SHORT_BODY
+
+    def bullish(self, lag=0):
+        """양봉"""
+        return self.at("body", lag) > 0
+
+    def bearish(self, lag=0):
+        """음봉"""
+        return self.at("body", lag) < 0
+
+    def doji(self):
+        """몸통이 고저폭의 DOJI_BODY 이하"""
+        price_range = self.at("range")
+        return (price_range > 0) & (self.at("body_size") <= price_range * DOJI_BODY)
+
+    def hammer_shape(self):
+        """긴 아래꼬리, 짧은 위꼬리"""
+        price_range = self.at("range")
+        return ((self.at("lower") >= self.at("body_size") * LONG_SHADOW) & (self.at("upper") <= price_range * SMALL_SHADOW)
+                & (self.at("body_size") > price_range * DOJI_BODY))
+
+    def inverted_shape(self):
+        """긴 위꼬리, 짧은 아래꼬리"""
+        price_range = self.at("range")
+        return ((self.at("upper") >= self.at("body_size") * LONG_SHADOW) & (self.at("lower") <= price_range * SMALL_SHADOW)
+                & (self.at("body_size") > price_range * DOJI_BODY))
+
+    def marubozu(self):
+        """양쪽 꼬리가 거의 없는 긴 몸통"""
+        limit = self.at("range") * MARUBOZU_SHADOW
+        return self.long_body() & (self.at("upper") <= limit) & (self.at("lower") <= limit)
+
+def _doji(c):
+    return c.doji()
+
+def _dragonfly_doji(c):
+    price_range = c.at("range")
+    return c.doji() & (c.at("upper") <= price_range * SMALL_SHADOW) & (c.at("lower") >= price_range * 0.6)
+
+def _gravestone_doji(c):
+    price_range = c.at("range")
+    return c.doji() & (c.at("lower") <= price_range * SMALL_SHADOW) & (c.at("upper") >= price_range * 0.6)
+
+def _spinning_top(c):
+    body_size = c.at("body_size")
+    return (c.short_body() & (c.at("upper") > body_size) & (c.at("lower") > body_size)
+            & (body_size > c.at("range") * DOJI_BODY))
+
+def _hammer(c):
+    return c.at("downtrend") & c.hammer_shape()
+
+def _hanging_man(c):
+    return c.at("uptrend") & c.hammer_shape()
+
+def _inverted_hammer(c):
+    return c.at("downtrend") & c.inverted_shape()
+
+def _shooting_star(c):
+    return c.at("uptrend") & c.inverted_shape()
+
+def _bullish_marubozu(c):
+    return c.bullish() & c.marubozu()
+
+def _bearish_marubozu(c):
+    return c.bearish() & c.marubozu()
+
+def _bullish_engulfing(c):
+    # 음봉 다음 양봉의 몸통이 직전 몸통을 감쌈
+    return (c.bearish(1) & c.bullish() & (c.at("open") <= c.at("close", 1)) & (c.at("close") >= c.at("open", 1))
+            & (c.at("body_size") > c.at("body_size", 1)))
+
+def _bearish_engulfing(c):
+    return (c.bullish(1) & c.bearish() & (c.at("open") >= c.at("close", 1)) & (c.at("close") <= c.at("open", 1))
+            & (c.at("body_size") > c.at("body_size", 1)))
+
+def _bullish_harami(c):
+    # 긴 음봉 안에 들어가는 작은 양봉
+    return (c.bearish(1) & c.long_body(1) & c.bullish()
+            & (c.at("body_top") < c.at("open", 1)) & (c.at("body_bottom") > c.at("close", 1)))
+
+def _bearish_harami(c):
+    return (c.bullish(1) & c.long_body(1) & c.bearish()
+            & (c.at("body_top") < c.at("close", 1)) & (c.at("body_bottom") > c.at("open", 1)))
+
+def _piercing_line(c):
+    # 긴 음봉 종가 아래에서 시작해 몸통 중간 위로 마감
+    return (c.bearish(1) & c.long_body(1) & c.bullish() & (c.at("open") < c.at("close", 1))
+            & (c.at("close") > c.at("middle", 1)) & (c.at("close") < c.at("open", 1)))
+
+def _dark_cloud_cover(c):
+    return (c.bullish(1) & c.long_body(1) & c.bearish() & (c.at("open") > c.at("close", 1))
+            & (c.at("close") < c.at("middle", 1)) & (c.at("close") > c.at("open", 1)))
+
+def _tweezer_bottom(c):
+    tolerance = c.at("range") * TWEEZER_TOLERANCE
+    return (c.at("downtrend", 1) & c.bearish(1) & c.bullish()
+            & (np.abs(c.at("low") - c.at("low", 1)) <= tolerance))
+
+def _tweezer_top(c):
+    tolerance = c.at("range") * TWEEZER_TOLERANCE
+    return (c.at("uptrend", 1) & c.bullish(1) & c.bearish()
+            & (np.abs(c.at("high") - c.at("high", 1)) <= tolerance))
+
+def _morning_star(c):
+    # 긴 음봉, 몸통이 아래로 떨어진 작은 봉, 첫 봉 몸통 중간 위로 마감하는 양봉
+    return (c.bearish(2) & c.long_body(2) & c.short_body(1) & (c.at("body_top", 1) < c.at("close", 2))
+            & c.bullish() & (c.at("close") > c.at("middle", 2)))
+
+def _evening_star(c):
+    return (c.bullish(2) & c.long_body(2) & c.short_body(1) & (c.at("body_bottom", 1) > c.at("close", 2))
+            & c.bearish() & (c.at("close") < c.at("middle", 2)))
+
+def _three_white_soldiers(c):
+    # 연속 세 양봉, 종가 상승, 시가는 직전 몸통 안, 위꼬리 짧음
+    result = c.bullish(2) & c.bullish(1) & c.bullish()
+    for lag in (1, 0):
+        result &= (c.at("close", lag) > c.at("close", lag + 1)) & (c.at("open", lag) > c.at("open", lag + 1))
+        result &= c.at("open", lag) <= c.at("close", lag + 1)
+    for lag in (2, 1, 0):
+        result &= c.at("upper", lag) <= c.at("body_size", lag) * 0.3
+    return result
+
+def _three_black_crows(c):
+    result = c.bearish(2) & c.bearish(1) & c.bearish()
+    for lag in (1, 0):
+        result &= (c.at("close", lag) < c.at("close", lag + 1)) & (c.at("open", lag) < c.at("open", lag + 1))
+        result &= c.at("open", lag) >= c.at("close", lag + 1)
+    for lag in (2, 1, 0):
+        result &= c.at("lower", lag) <= c.at("body_size", lag) * 0.3
+    return result
+
+# 패턴 이름: 판별 함수
+_RULES = {name: globals()[f"_{name}"] for name in PATTERNS}
+
+def candle_patterns(open_data, high_data, low_data, close_data, patterns=None, trend_period=10, tail=None,
+                    out=None, workspace=None):
+    """
+    캔들 패턴 판별
+
+    Args:
+        open_data (numpy.ndarray): 시가 데이터 (1차원 또는 종목 × 봉)
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        patterns (tuple): 판별할 패턴 이름 (None이면 PATTERNS 전체, 순서대로)
+        trend_period (int): 평균 몸통/추세 판단 기간
+        tail (int): 마지막 tail개 봉만 판별 (종목 스캔용, None이면 전체)
+        out (numpy.ndarray): 결과를 저장할 (패턴 수, ..., 봉 수) bool 배열
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: (패턴 수, ..., 봉 수) bool 배열 (tail이 있으면 봉 수는 tail)
+    """
+    patterns = tuple(PATTERNS) if patterns is None else tuple(patterns)
+    unknown = [name for name in patterns if name not in _RULES]
+    if unknown:
+        raise ValueError(f"지원하지 않는 캔들 패턴입니다: {', '.join(unknown)}")
+
+    close_data = np.asarray(close_data)
+    length = close_data.shape[-1]
+    count = length if tail is None else min(tail, length)
+    shape = (len(patterns),) + close_data.shape[:-1] + (count,)
+
+    if out is None:
+        out = np.zeros(shape, dtype=np.bool_)
+    elif out.shape != shape:
+        raise ValueError(f"out 배열의 형태가 맞지 않습니다: {out.shape} != {shape}")
+    else:
+        out.fill(False)
+
+    # 마지막 tail개 봉 판별에 필요한 구간만 사용 (평균 몸통/추세 + 이전 봉 참조)
+    start = max(length - count - trend_period - MAX_LAG, 0)
+    if length - start <= MAX_LAG or count == 0:
+        return out
+
+    inputs = [np.asarray(values)[..., start:] for values in (open_data, high_data, low_data, close_data)]
+    candles = _Candles(*inputs, trend_period, workspace)
+
+    # 판별 대상은 잘라낸 구간의 [MAX_LAG:] 봉이며, 그중 마지막 count개를 결과로 사용
+    evaluated = length - start - MAX_LAG
+    used = min(count, evaluated)
+    for row, name in enumerate(patterns):
+        out[row, ..., count-used:] = _RULES[name](candles)[..., evaluated-used:]
+
+    # 준비 구간 (평균 몸통/추세가 없는 봉, 종목별 첫 유효 봉 기준)
+    first_valid = _first_valid_index(close_data.reshape(-1, length)).reshape(close_data.shape[:-1])
+    warmup = np.asarray(first_valid + trend_period - (length - count))
+    if np.any(warmup > 0):
+        out &= np.arange(count) >= warmup[..., np.newaxis]
+
+    return out
+
+def pattern_directions(patterns=None):
+    """
+    패턴별 방향
+
+    Args:
+        patterns (tuple): 패턴 이름 (None이면 PATTERNS 전체)
+
+    Returns:
+        numpy.ndarray: int8 방향 배열 (1: 상승, -1: 하락, 0: 중립)
+    """
+    patterns = tuple(PATTERNS) if patterns is None else tuple(patterns)
+    return np.array([PATTERNS[name] for name in patterns], dtype=np.int8)
+
+def pattern_score(open_data, high_data, low_data, close_data, patterns=None, trend_period=10, tail=None, workspace=None):
+    """
+    캔들 패턴 점수 (발생한 패턴 방향의 합)
+
+    Args:
+        open_data (numpy.ndarray): 시가 데이터 (1차원 또는 종목 × 봉)
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        patterns (tuple): 사용할 패턴 이름 (None이면 PATTERNS 전체)
+        trend_period (int): 평균 몸통/추세 판단 기간
+        tail (int): 마지막 tail개 봉만 계산
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: int8 점수 (양수: 상승 패턴 우세, 음수: 하락 패턴 우세)
+    """
+    signals = candle_patterns(open_data, high_data, low_data, close_data, patterns, trend_period, tail, workspace=workspace)
+    directions = pattern_directions(patterns).reshape((-1,) + (1,) * (signals.ndim - 1))
+    return np.sum(signals * directions, axis=0, dtype=np.int8)
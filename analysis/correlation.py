@@ -0,0 +1,452 @@
+"""
+롤링 상관/회귀 분석 모듈
+
+종목 간 공분산, 상관계수, 시장(KOSPI) 대비 베타, 시간 대비 선형회귀 기울기/결정계수를
+이동 구간 합(rolling_sum)으로 계산합니다. 구간 길이와 무관하게 O(n)이며,
+analysis.indicators의 지표 함수와 같은 선택 인자(out, dtype, workspace)를 받고
+앞쪽 (period - 1)개 값은 NaN입니다.
+
+입력은 1차원 배열 또는 (종목 × 봉) 행렬이며, 시장 지수처럼 1차원 배열은 행렬의 각 행에 맞춰 계산됩니다.
+원 단위 가격처럼 정수값 데이터는 정수 누적합으로 구간 합을 오차 없이 계산하고,
+실수 데이터(수익률 등)는 행 평균을 뺀 뒤 계산하여 상쇄 오차를 줄입니다.
+
+종목 전체 상관행렬은 correlation_matrix()로 한 시점을, RollingCovarianceMatrix로
+봉이 추가될 때마다 O(종목 수²)로 갱신합니다.
+
+사용 예:
+    beta = rolling_beta(returns_matrix, kospi_returns, period=60)   # (종목 × 봉)
+    matrix = RollingCovarianceMatrix.from_history(returns_matrix, period=60)
+    matrix.append(latest_returns)
+    matrix.correlation()                                           # (종목 × 종목)
+"""
+
+import numpy as np
+
+from .indicators import _prepare_output, _empty_result, _float64_buffer, _store
+from .rolling import rolling_sum, _exact_int64, _scratch
+
+def _centered(values, workspace, name):
+    """
+    구간 합 계산용 입력 준비
+
+    정수값 데이터는 그대로(정수 누적합 사용), 실수 데이터는 행 평균을 뺀 값을 반환합니다.
+    공분산과 회귀 기울기는 평행 이동에 무관하므로 결과는 같습니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if _exact_int64(values, workspace) is not None:
+        return values
+
+    centered = _scratch(workspace, name, values.shape)
+    with np.errstate(invalid='ignore'):
+        np.subtract(values, np.nanmean(values, axis=-1, keepdims=True), out=centered)
+    return centered
+
+def _window_sums(x_values, y_values, period, workspace, prefix, names):
+    """
+    구간 합 계산
+
+    각 합은 입력의 원래 형태로 계산하므로 시장 지수처럼 1차원 입력의 합은 한 번만 계산합니다.
+
+    Args:
+        names (tuple): 계산할 합 ("x", "y", "xy", "xx", "yy")
+
+    Returns:
+        dict: {이름: 구간 합 배열} (앞쪽 period-1개는 NaN)
+    """
+    inputs = {"x": (x_values, x_values), "y": (y_values, y_values), "xy": (x_values, y_values),
+              "xx": (x_values, x_values), "yy": (y_values, y_values)}
+    sums = {}
+    for name in names:
+        left, right = inputs[name]
+        if len(name) == 1:
+            values = left
+        else:
+            shape = np.broadcast_shapes(left.shape, right.shape)
+            values = np.multiply(left, right, out=_scratch(workspace, f"{prefix}_product", shape))
+        sums[name] = rolling_sum(values, period, _scratch(workspace, f"{prefix}_s{name}", values.shape), workspace)
+    return sums
+
+def _comoment(sum_x, sum_y, sum_xy, period, out):
+    """n² × 공분산 = n·Σxy - Σx·Σy"""
+    np.multiply(sum_xy, period, out=out)
+    out -= sum_x * sum_y
+    return out
+
+def _comoments(x_data, y_data, period, workspace, prefix, variances=("x", "y")):
+    """
+    구간별 n²·공분산과 n²·분산
+
+    Args:
+        variances (tuple): 분산을 계산할 입력 ("x", "y")
+
+    Returns:
+        tuple: (공분산, x 분산 또는 None, y 분산 또는 None) - n²배 값, 앞쪽 period-1개는 NaN
+    """
+    x_values = _centered(x_data, workspace, f"{prefix}_x")
+    y_values = _centered(y_data, workspace, f"{prefix}_y")
+    names = ("x", "y", "xy") + tuple(name * 2 for name in variances)
+    sums = _window_sums(x_values, y_values, period, workspace, prefix, names)
+
+    covariance = _comoment(sums["x"], sums["y"], sums["xy"], period, sums["xy"])
+    result = [covariance]
+    for name in ("x", "y"):
+        if name not in variances:
+            result.append(None)
+            continue
+        # 반올림 오차로 인한 음수 분산 방지
+        var = _comoment(sums[name], sums[name], sums[name * 2], period, sums[name * 2])
+        result.append(np.maximum(var, 0.0, out=var))
+    return tuple(result)
+
+def rolling_covariance(x_data, y_data, period=20, out=None, dtype=None, workspace=None):
+    """
+    이동 구간 공분산 계산 (모공분산, ddof=0)
+
+    Args:
+        x_data (numpy.ndarray): 첫 번째 데이터 (1차원 또는 종목 × 봉)
+        y_data (numpy.ndarray): 두 번째 데이터 (x_data와 같은 형태 또는 1차원)
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 공분산 (앞쪽 period-1개는 NaN)
+    """
+    shape = np.broadcast_shapes(np.shape(x_data), np.shape(y_data))
+    (result,) = _prepare_output(shape, 1, out, dtype)
+
+    if shape[-1] < period or period < 1:
+        return _empty_result([result])
+
+    covariance, _, _ = _comoments(x_data, y_data, period, workspace, "cov", variances=())
+    covariance /= period * period
+    return _store(result, covariance)
+
+def rolling_correlation(x_data, y_data, period=20, out=None, dtype=None, workspace=None):
+    """
+    이동 구간 피어슨 상관계수 계산
+
+    한쪽의 구간 분산이 0이면(가격 변동 없음) 0입니다.
+
+    Args:
+        x_data (numpy.ndarray): 첫 번째 데이터 (1차원 또는 종목 × 봉)
+        y_data (numpy.ndarray): 두 번째 데이터 (x_data와 같은 형태 또는 1차원)
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 상관계수 (-1 ~ 1, 앞쪽 period-1개는 NaN)
+    """
+    shape = np.broadcast_shapes(np.shape(x_data), np.shape(y_data))
+    (result,) = _prepare_output(shape, 1, out, dtype)
+
+    if shape[-1] < period or period < 2:
+        return _empty_result([result])
+
+    covariance, x_var, y_var = _comoments(x_data, y_data, period, workspace, "corr")
+
+    scale = np.multiply(x_var, y_var, out=_scratch(workspace, "corr_scale", shape))
+    np.sqrt(scale, out=scale)
+    correlation = _float64_buffer(result, workspace, "correlation")
+    correlation.fill(0)
+    with np.errstate(invalid='ignore'):
+        np.divide(covariance, scale, out=correlation, where=scale > 0)
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+    correlation[np.isnan(scale)] = np.nan
+
+    return _store(result, correlation)
+
+def rolling_beta(data, market_data, period=60, out=None, dtype=None, workspace=None):
+    """
+    이동 구간 베타 계산
+
+    베타 = Cov(종목, 시장) / Var(시장). 일반적으로 종목과 지수(KOSPI 등)의 수익률을 입력합니다.
+    시장의 구간 분산이 0이면 0입니다.
+
+    Args:
+        data (numpy.ndarray): 종목 데이터 (1차원 또는 종목 × 봉)
+        market_data (numpy.ndarray): 시장 지수 데이터 (1차원, 봉 수는 data와 같음)
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 베타 (앞쪽 period-1개는 NaN)
+    """
+    shape = np.broadcast_shapes(np.shape(data), np.shape(market_data))
+    (result,) = _prepare_output(shape, 1, out, dtype)
+
+    if shape[-1] < period or period < 2:
+        return _empty_result([result])
+
+    covariance, _, market_var = _comoments(data, market_data, period, workspace, "beta", variances=("y",))
+
+    beta = _float64_buffer(result, workspace, "beta")
+    beta.fill(0)
+    with np.errstate(invalid='ignore'):
+        np.divide(covariance, market_var, out=beta, where=np.broadcast_to(market_var > 0, shape))
+    beta[np.isnan(covariance)] = np.nan
+
+    return _store(result, beta)
+
+def linear_regression(data, period=20, out=None, dtype=None, workspace=None):
+    """
+    이동 구간 선형회귀 (시간 대비) 기울기와 결정계수 계산
+
+    구간의 봉 순서(0, 1, ..., period-1)에 대한 최소제곱 직선의 기울기(봉당 변화량)와
+    결정계수 R²를 계산합니다. 구간 분산이 0이면 R²는 0입니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터 (1차원 또는 종목 × 봉)
+        period (int): 구간 길이
+        out (tuple): 결과를 저장할 (기울기, 결정계수) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        tuple: (기울기, 결정계수) - 앞쪽 period-1개는 NaN
+    """
+    shape = np.shape(data)
+    slope_result, r_squared_result = _prepare_output(shape, 2, out, dtype)
+
+    if shape[-1] < period or period < 2:
+        return _empty_result([slope_result, r_squared_result])
+
+    length = shape[-1]
+    values = _centered(data, workspace, "regression_y")
+
+    # Σ j·y (구간 내 순서 j) = Σ t·y - 구간 시작 위치 × Σ y (t는 전체 위치)
+    sum_y = rolling_sum(values, period, _scratch(workspace, "regression_sy", shape), workspace)
+    weighted = _scratch(workspace, "regression_ty", shape)
+    np.multiply(values, np.arange(length, dtype=np.float64), out=weighted)
+    sum_jy = rolling_sum(weighted, period, _scratch(workspace, "regression_sty", shape), workspace)
+    sum_jy[..., period-1:] -= sum_y[..., period-1:] * np.arange(length - period + 1, dtype=np.float64)
+
+    np.multiply(values, values, out=weighted)
+    sum_yy = rolling_sum(weighted, period, _scratch(workspace, "regression_syy", shape), workspace)
+
+    # n²·Cov(j, y), n²·Var(j) = n²(n²-1)/12, n²·Var(y)
+    covariance = _comoment(period * (period - 1) / 2, sum_y, sum_jy, period, sum_jy)
+    time_var = period * period * (period * period - 1) / 12
+    y_var = _comoment(sum_y, sum_y, sum_yy, period, sum_yy)
+    np.maximum(y_var, 0.0, out=y_var)
+
+    slope = _float64_buffer(slope_result, workspace, "regression_slope")
+    np.divide(covariance, time_var, out=slope)
+
+    r_squared = _float64_buffer(r_squared_result, workspace, "regression_r_squared")
+    with np.errstate(invalid='ignore'):
+        valid = y_var > 0
+    r_squared.fill(0)
+    np.multiply(covariance, slope, out=covariance)
+    np.divide(covariance, y_var, out=r_squared, where=valid)
+    np.minimum(r_squared, 1.0, out=r_squared)
+    r_squared[np.isnan(y_var)] = np.nan
+
+    return _store(slope_result, slope), _store(r_squared_result, r_squared)
+
+def _correlation_from_covariance(covariance):
+    """공분산 행렬을 상관 행렬로 변환 (분산이 0인 종목은 0, 자기 상관은 1)"""
+    std = np.sqrt(np.maximum(np.diagonal(covariance), 0.0))
+    scale = np.outer(std, std)
+    correlation = np.zeros_like(covariance)
+    with np.errstate(invalid='ignore'):
+        np.divide(covariance, scale, out=correlation, where=scale > 0)
+    np.clip(correlation, -1.0, 1.0, out=correlation)
+
+    diagonal = np.diagonal(correlation).copy()
+    diagonal[std > 0] = 1.0
+    np.fill_diagonal(correlation, diagonal)
+    correlation[np.isnan(covariance)] = np.nan
+    return correlation
+
+def correlation_matrix(data, period=None, end=None):
+    """
+    종목 전체 상관행렬 계산 (한 시점)
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 데이터 (수익률 등)
+        period (int): 구간 길이 (None이면 end까지 전체)
+        end (int): 구간 끝 위치 (미포함, None이면 마지막 봉까지)
+
+    Returns:
+        numpy.ndarray: (종목 × 종목) 상관행렬. 구간에 NaN이 있는 종목의 행/열은 NaN
+    """
+    values = np.asarray(data, dtype=np.float64)
+    end = values.shape[-1] if end is None else end
+    start = 0 if period is None else end - period
+    if start < 0 or end <= start:
+        return np.full((len(values), len(values)), np.nan)
+
+    window = values[:, start:end]
+    centered = window - window.mean(axis=1, keepdims=True)
+    covariance = centered @ centered.T
+    covariance /= end - start
+    return _correlation_from_covariance(covariance)
+
+class RollingCovarianceMatrix:
+    """
+    종목 전체 실시간 공분산/상관 행렬 클래스
+
+    최근 period개 봉의 종목별 합과 종목 쌍별 곱의 합(종목 수 × 종목 수)을 보관하고,
+    봉이 추가될 때마다 새 봉을 더하고 구간을 벗어난 봉을 빼는 rank-1 갱신으로
+    O(종목 수²)에 행렬을 갱신합니다 (매 봉 다시 계산하면 O(종목 수² × period)).
+    더하고 빼는 과정의 누적 오차는 refresh_interval개 봉마다 구간 전체로 다시 계산하여 제거합니다.
+    """
+
+    def __init__(self, size, period, refresh_interval=None):
+        """
+        초기화
+
+        Args:
+            size (int): 종목 수
+            period (int): 구간 길이
+            refresh_interval (int): 전체 재계산 간격 (None이면 period)
+        """
+        self.size = size
+        self.period = period
+        self.refresh_interval = refresh_interval or period
+        self.count = 0                                     # 지금까지 추가된 봉 개수
+        self.reference = np.full(size, np.nan)             # 종목별 기준값 (첫 유효값)
+        self.window = np.zeros((period, size))             # 기준값을 뺀 최근 period개 봉 (NaN은 0)
+        self.nan_window = np.zeros((period, size), dtype=np.bool_)
+        self.sums = np.zeros(size)
+        self.cross = np.zeros((size, size))
+        self.nan_counts = np.zeros(size, dtype=np.int64)
+        self._outer = np.empty((size, size))
+        self._update = np.empty((size, 2))
+        self._signed = np.empty((2, size))
+
+    def append(self, values):
+        """
+        봉 추가
+
+        Args:
+            values (numpy.ndarray): 종목별 새 값 (길이 size)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        missing = np.isnan(self.reference)
+        if missing.any():
+            # 아직 유효값이 없던 종목은 합계가 모두 0이므로 기준값을 새로 정해도 됨
+            self.reference[missing] = values[missing]
+
+        slot = self.count % self.period
+        centered = values - self.reference
+        nan_mask = np.isnan(centered)
+        centered[nan_mask] = 0
+
+        # 새 봉 추가와 오래된 봉 제거를 하나의 rank-2 갱신으로 계산: [new, old] · [new, -old]ᵀ
+        if self.count >= self.period:
+            old = self.window[slot]
+            self._update[:, 0] = centered
+            self._update[:, 1] = old
+            self._signed[0] = centered
+            np.negative(old, out=self._signed[1])
+            self.sums += centered - old
+            self.cross += np.dot(self._update, self._signed, out=self._outer)
+            self.nan_counts += nan_mask.astype(np.int64) - self.nan_window[slot]
+        else:
+            self.sums += centered
+            self.cross += np.multiply.outer(centered, centered, out=self._outer)
+            self.nan_counts += nan_mask
+
+        self.window[slot] = centered
+        self.nan_window[slot] = nan_mask
+        self.count += 1
+
+        if self.count % self.refresh_interval == 0:
+            self.refresh()
+
+    def extend(self, values):
+        """
+        여러 봉 추가
+
+        Args:
+            values (numpy.ndarray): (종목 × 봉) 데이터
+        """
+        for column in np.asarray(values, dtype=np.float64).T:
+            self.append(column)
+
+    def refresh(self):
+        """보관 중인 구간으로 합계 재계산"""
+        self.sums = self.window.sum(axis=0)
+        self.cross = self.window.T @ self.window
+        self.nan_counts = self.nan_window.sum(axis=0)
+
+    def covariance(self):
+        """
+        현재 구간의 공분산 행렬 (모공분산)
+
+        Returns:
+            numpy.ndarray: (종목 × 종목) 행렬. 구간이 채워지지 않았거나 NaN이 있는 종목은 NaN
+        """
+        if self.count < self.period:
+            return np.full((self.size, self.size), np.nan)
+
+        mean = self.sums / self.period
+        covariance = self.cross / self.period
+        covariance -= np.outer(mean, mean)
+
+        has_nan = self.nan_counts > 0
+        covariance[has_nan, :] = np.nan
+        covariance[:, has_nan] = np.nan
+        return covariance
+
+    def correlation(self):
+        """
+        현재 구간의 상관행렬
+
+        Returns:
+            numpy.ndarray: (종목 × 종목) 상관행렬
+        """
+        return _correlation_from_covariance(self.covariance())
+
+    def beta(self, market_index):
+        """
+        현재 구간의 종목별 베타
+
+        Args:
+            market_index (int): 시장 지수가 들어 있는 열 위치
+
+        Returns:
+            numpy.ndarray: 종목별 베타 (시장 분산이 0이면 0)
+        """
+        covariance = self.covariance()
+        market_var = covariance[market_index, market_index]
+        if not market_var > 0:
+            return np.where(np.isnan(covariance[:, market_index]), np.nan, 0.0)
+        return covariance[:, market_index] / market_var
+
+    @classmethod
+    def from_history(cls, data, period, refresh_interval=None):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            data (numpy.ndarray): (종목 × 봉) 데이터
+            period (int): 구간 길이
+            refresh_interval (int): 전체 재계산 간격
+
+        Returns:
+            RollingCovarianceMatrix: 초기화된 객체
+        """
+        values = np.asarray(data, dtype=np.float64)
+        matrix = cls(len(values), period, refresh_interval)
+        recent = values[:, -period:]
+
+        for column in recent.T:
+            matrix.append(column)
+
+        # 구간에 포함되지 않은 과거 봉 수만큼 위치를 옮김 (슬롯 순서 유지)
+        skipped = values.shape[1] - recent.shape[1]
+        if skipped:
+            shift = skipped % period
+            matrix.window = np.roll(matrix.window, shift, axis=0)
+            matrix.nan_window = np.roll(matrix.nan_window, shift, axis=0)
+            matrix.count += skipped
+            matrix.refresh()
+        return matrix
@@ -0,0 +1,389 @@
+"""
+다이버전스 탐지 모듈
+
+가격의 고점/저점(swing point)과 같은 봉의 보조지표(RSI, MACD 등) 값을 비교하여
+다이버전스를 (종목 × 봉) 행렬 전체에 대해 벡터 연산으로 탐지합니다.
+
+고점/저점은 앞뒤 order개 봉 안의 최고가/최저가이며, 이동 구간 최대/최소(rolling_max/rolling_min)
+한 번씩으로 판별합니다. 고점 뒤 order개 봉이 지나야 확정되므로 다이버전스 신호는
+두 번째 고점/저점이 확정된 봉(고점 위치 + order)에 표시되어 미래 데이터를 사용하지 않습니다.
+직전 고점/저점 위치는 봉 방향 누적 최대(np.maximum.accumulate)로 구하므로 종목별 반복이 없습니다.
+
+다이버전스 종류:
+    - bullish: 가격 저점 하락, 지표 저점 상승
+    - bearish: 가격 고점 상승, 지표 고점 하락
+    - hidden_bullish: 가격 저점 상승, 지표 저점 하락
+    - hidden_bearish: 가격 고점 하락, 지표 고점 상승
+
+실시간 데이터는 DivergenceState로 봉 하나씩 같은 결과를 계산합니다.
+
+사용 예:
+    signals = rsi_divergence(high_matrix, low_matrix, close_matrix)     # (종류 수, 종목 수, 봉 수)
+    state = DivergenceState.from_history(high, low, rsi_values)
+    state.append(bar_high, bar_low, bar_rsi)                            # 확정된 다이버전스 이름 튜플
+"""
+
+import numpy as np
+
+from . import universe
+from .rolling import rolling_max, rolling_min
+from .streaming import IndicatorState
+
+# 다이버전스 이름: 방향 (1: 상승, -1: 하락)
+DIVERGENCES = {
+    "bullish": 1,
+    "bearish": -1,
+    "hidden_bullish": 1,
+    "hidden_bearish": -1,
+}
+
+def swing_points(data, order=5, kind="high", workspace=None):
+    """
+    고점/저점 판별
+
+    앞쪽 order개 봉보다 높고(저점은 낮고) 뒤쪽 order개 봉 이상(저점은 이하)인 봉입니다.
+    같은 값이 이어지면 첫 봉만 고점/저점이 됩니다. 앞뒤 order개 봉이 없는 봉과
+    구간에 NaN이 있는 봉은 False입니다.
+
+    Args:
+        data (numpy.ndarray): 가격 데이터 (1차원 또는 종목 × 봉)
+        order (int): 비교할 앞뒤 봉 수
+        kind (str): "high"(고점) 또는 "low"(저점)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 고점/저점 위치의 bool 배열
+    """
+    if kind not in ("high", "low"):
+        raise ValueError(f"지원하지 않는 고점/저점 종류입니다: {kind}")
+
+    values = np.asarray(data, dtype=np.float64)
+    length = values.shape[-1]
+    result = np.zeros(values.shape, dtype=np.bool_)
+    if order < 1 or length < 2 * order + 1:
+        return result
+
+    # extremum[j] = values[j-order+1 : j+1]의 극값 → 왼쪽 구간은 j = i-1, 오른쪽 구간은 j = i+order
+    if kind == "high":
+        extremum = rolling_max(values, order, workspace=workspace)
+        before, after = np.greater, np.greater_equal
+    else:
+        extremum = rolling_min(values, order, workspace=workspace)
+        before, after = np.less, np.less_equal
+
+    center = values[..., order:length-order]
+    target = result[..., order:length-order]
+    before(center, extremum[..., order-1:length-order-1], out=target)
+    target &= after(center, extremum[..., 2*order:])
+    return result
+
+def _previous_swing(swings):
+    """
+    봉별 직전 고점/저점 위치 (해당 봉 제외, 없으면 -1)
+
+    Args:
+        swings (numpy.ndarray): 고점/저점 bool 배열
+
+    Returns:
+        numpy.ndarray: int64 위치 배열
+    """
+    positions = np.where(swings, np.arange(swings.shape[-1]), -1)
+    np.maximum.accumulate(positions, axis=-1, out=positions)
+    previous = np.empty_like(positions)
+    previous[..., 0] = -1
+    previous[..., 1:] = positions[..., :-1]
+    return previous
+
+def _compare_swings(price, indicator, swings, max_distance):
+    """
+    연속된 두 고점/저점의 가격/지표 비교
+
+    Returns:
+        tuple: (비교 대상 여부, 가격 상승 여부, 가격 하락 여부, 지표 상승 여부, 지표 하락 여부)
+    """
+    previous = _previous_swing(swings)
+    valid = swings & (previous >= 0)
+    if max_distance is not None:
+        valid &= np.arange(swings.shape[-1]) - previous <= max_distance
+
+    index = np.maximum(previous, 0)
+    previous_price = np.take_along_axis(price, index, axis=-1)
+    previous_indicator = np.take_along_axis(indicator, index, axis=-1)
+    return (valid, price > previous_price, price < previous_price,
+            indicator > previous_indicator, indicator < previous_indicator)
+
+def divergences(high_data, low_data, indicator_data, kinds=None, order=5, max_distance=60, out=None, workspace=None):
+    """
+    다이버전스 탐지
+
+    고가의 연속된 두 고점, 저가의 연속된 두 저점을 같은 봉의 지표 값과 비교합니다.
+    두 고점/저점 사이가 max_distance개 봉을 넘으면 비교하지 않습니다.
+
+    Args:
+        high_data (numpy.ndarray): 고가 데이터 (1차원 또는 종목 × 봉, 종가만 쓰려면 종가)
+        low_data (numpy.ndarray): 저가 데이터
+        indicator_data (numpy.ndarray): 지표 데이터 (rsi 값, MACD 라인/히스토그램 등)
+        kinds (tuple): 탐지할 다이버전스 이름 (None이면 DIVERGENCES 전체, 순서대로)
+        order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+        max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수 (None이면 제한 없음)
+        out (numpy.ndarray): 결과를 저장할 (종류 수, ..., 봉 수) bool 배열
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: (종류 수, ..., 봉 수) bool 배열 - 두 번째 고점/저점이 확정된 봉이 True
+    """
+    kinds = tuple(DIVERGENCES) if kinds is None else tuple(kinds)
+    unknown = [name for name in kinds if name not in DIVERGENCES]
+    if unknown:
+        raise ValueError(f"지원하지 않는 다이버전스입니다: {', '.join(unknown)}")
+
+    high = np.asarray(high_data, dtype=np.float64)
+    low = np.asarray(low_data, dtype=np.float64)
+    indicator = np.broadcast_to(np.asarray(indicator_data, dtype=np.float64), high.shape)
+    shape = (len(kinds),) + high.shape
+
+    if out is None:
+        out = np.zeros(shape, dtype=np.bool_)
+    elif out.shape != shape:
+        raise ValueError(f"out 배열의 형태가 맞지 않습니다: {out.shape} != {shape}")
+    else:
+        out.fill(False)
+
+    length = high.shape[-1]
+    if length <= order:
+        return out
+
+    comparisons = {}
+    if any(DIVERGENCES[name] < 0 for name in kinds):
+        comparisons["high"] = _compare_swings(high, indicator, swing_points(high, order, "high", workspace), max_distance)
+    if any(DIVERGENCES[name] > 0 for name in kinds):
+        comparisons["low"] = _compare_swings(low, indicator, swing_points(low, order, "low", workspace), max_distance)
+
+    for row, name in enumerate(kinds):
+        if name in ("bearish", "hidden_bearish"):
+            valid, price_up, price_down, indicator_up, indicator_down = comparisons["high"]
+        else:
+            valid, price_up, price_down, indicator_up, indicator_down = comparisons["low"]
+
+        if name == "bullish":
+            signal = valid & price_down & indicator_up
+        elif name == "bearish":
+            signal = valid & price_up & indicator_down
+        elif name == "hidden_bullish":
+            signal = valid & price_up & indicator_down
+        else:
+            signal = valid & price_down & indicator_up
+
+        # 고점/저점 확정 봉으로 이동
+        out[row, ..., order:] = signal[..., :length-order]
+
+    return out
+
+def divergence_directions(kinds=None):
+    """
+    다이버전스별 방향
+
+    Args:
+        kinds (tuple): 다이버전스 이름 (None이면 DIVERGENCES 전체)
+
+    Returns:
+        numpy.ndarray: int8 방향 배열 (1: 상승, -1: 하락)
+    """
+    kinds = tuple(DIVERGENCES) if kinds is None else tuple(kinds)
+    return np.array([DIVERGENCES[name] for name in kinds], dtype=np.int8)
+
+def divergence_score(high_data, low_data, indicator_data, kinds=None, order=5, max_distance=60, workspace=None):
+    """
+    다이버전스 점수 (발생한 다이버전스 방향의 합)
+
+    Args:
+        high_data (numpy.ndarray): 고가 데이터 (1차원 또는 종목 × 봉)
+        low_data (numpy.ndarray): 저가 데이터
+        indicator_data (numpy.ndarray): 지표 데이터
+        kinds (tuple): 사용할 다이버전스 이름 (None이면 DIVERGENCES 전체)
+        order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+        max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: int8 점수 (양수: 상승 다이버전스, 음수: 하락 다이버전스)
+    """
+    signals = divergences(high_data, low_data, indicator_data, kinds, order, max_distance, workspace=workspace)
+    directions = divergence_directions(kinds).reshape((-1,) + (1,) * (signals.ndim - 1))
+    return np.sum(signals * directions, axis=0, dtype=np.int8)
+
+def rsi_divergence(high_data, low_data, close_data, period=14, kinds=None, order=5, max_distance=60, workspace=None):
+    """
+    RSI 다이버전스 탐지
+
+    Args:
+        high_data (numpy.ndarray): 고가 데이터 (1차원 또는 종목 × 봉)
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터 (RSI 계산용)
+        period (int): RSI 기간
+        kinds (tuple): 탐지할 다이버전스 이름
+        order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+        max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: (종류 수, ..., 봉 수) bool 배열
+    """
+    close_data = np.asarray(close_data, dtype=np.float64)
+    indicator = universe.rsi(close_data, period).reshape(close_data.shape)
+    return divergences(high_data, low_data, indicator, kinds, order, max_distance, workspace=workspace)
+
+def macd_divergence(high_data, low_data, close_data, fast_period=12, slow_period=26, signal_period=9, line="histogram",
+                    kinds=None, order=5, max_distance=60, workspace=None):
+    """
+    MACD 다이버전스 탐지
+
+    Args:
+        high_data (numpy.ndarray): 고가 데이터 (1차원 또는 종목 × 봉)
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터 (MACD 계산용)
+        fast_period (int): 빠른 EMA 기간
+        slow_period (int): 느린 EMA 기간
+        signal_period (int): 시그널 EMA 기간
+        line (str): 비교할 값 ("macd": MACD 라인, "histogram": 히스토그램)
+        kinds (tuple): 탐지할 다이버전스 이름
+        order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+        max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: (종류 수, ..., 봉 수) bool 배열
+    """
+    if line not in ("macd", "histogram"):
+        raise ValueError(f"지원하지 않는 MACD 값입니다: {line}")
+
+    close_data = np.asarray(close_data, dtype=np.float64)
+    macd_line, _, histogram = universe.macd(close_data, fast_period, slow_period, signal_period)
+    indicator = (macd_line if line == "macd" else histogram).reshape(close_data.shape)
+    return divergences(high_data, low_data, indicator, kinds, order, max_distance, workspace=workspace)
+
+class DivergenceState(IndicatorState):
+    """
+    다이버전스 실시간 상태 클래스
+
+    최근 2 × order + 1개 봉만 보관하여, 봉이 추가될 때마다 order개 봉 전의 봉이
+    고점/저점인지 판별하고 직전 고점/저점과 비교합니다. divergences()와 같은 봉에서
+    같은 다이버전스를 반환합니다.
+    """
+
+    def __init__(self, kinds=None, order=5, max_distance=60):
+        """
+        초기화
+
+        Args:
+            kinds (tuple): 탐지할 다이버전스 이름 (None이면 DIVERGENCES 전체)
+            order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+            max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수 (None이면 제한 없음)
+        """
+        self.kinds = tuple(DIVERGENCES) if kinds is None else tuple(kinds)
+        unknown = [name for name in self.kinds if name not in DIVERGENCES]
+        if unknown:
+            raise ValueError(f"지원하지 않는 다이버전스입니다: {', '.join(unknown)}")
+        self.order = order
+        self.max_distance = max_distance
+        super().__init__()
+
+    def _initial_state(self):
+        # window: 최근 봉의 (고가, 저가, 지표), last_high/last_low: 직전 고점/저점 (위치, 가격, 지표)
+        return {"count": 0, "window": (), "last_high": None, "last_low": None}
+
+    def _empty_value(self):
+        return ()
+
+    def _compare(self, previous, index, price, indicator):
+        """직전 고점/저점과 비교 (가격 상승, 가격 하락, 지표 상승, 지표 하락)"""
+        if previous is None:
+            return None
+        if self.max_distance is not None and index - previous[0] > self.max_distance:
+            return None
+        return price > previous[1], price < previous[1], indicator > previous[2], indicator < previous[2]
+
+    def _step(self, state, high, low, indicator):
+        count = state["count"] + 1
+        window = (state["window"] + ((high, low, indicator),))[-(2 * self.order + 1):]
+        new_state = dict(state, count=count, window=window)
+
+        if self.order < 1 or len(window) < 2 * self.order + 1:
+            return new_state, ()
+
+        # order개 봉 전의 봉이 고점/저점인지 판별
+        index = count - 1 - self.order
+        center_high, center_low, center_indicator = window[self.order]
+        before, after = window[:self.order], window[self.order+1:]
+        is_high = all(center_high > bar[0] for bar in before) and all(center_high >= bar[0] for bar in after)
+        is_low = all(center_low < bar[1] for bar in before) and all(center_low <= bar[1] for bar in after)
+
+        signals = set()
+        if is_high:
+            compared = self._compare(state["last_high"], index, center_high, center_indicator)
+            if compared is not None:
+                price_up, price_down, indicator_up, indicator_down = compared
+                if price_up and indicator_down:
+                    signals.add("bearish")
+                if price_down and indicator_up:
+                    signals.add("hidden_bearish")
+            new_state["last_high"] = (index, center_high, center_indicator)
+        if is_low:
+            compared = self._compare(state["last_low"], index, center_low, center_indicator)
+            if compared is not None:
+                price_up, price_down, indicator_up, indicator_down = compared
+                if price_down and indicator_up:
+                    signals.add("bullish")
+                if price_up and indicator_down:
+                    signals.add("hidden_bullish")
+            new_state["last_low"] = (index, center_low, center_indicator)
+
+        return new_state, tuple(name for name in self.kinds if name in signals)
+
+    @property
+    def score(self):
+        """현재 봉 다이버전스 방향의 합"""
+        return sum(DIVERGENCES[name] for name in self.value)
+
+    @classmethod
+    def from_history(cls, high_data, low_data, indicator_data, kinds=None, order=5, max_distance=60):
+        """
+        과거 데이터로 초기화
+
+        고점/저점은 swing_points()로 한 번에 구하고 마지막 고점/저점과 최근 봉만 상태로 보관합니다.
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            indicator_data (numpy.ndarray): 지표 데이터
+            kinds (tuple): 탐지할 다이버전스 이름
+            order (int): 고점/저점 판별에 사용할 앞뒤 봉 수
+            max_distance (int): 비교할 두 고점/저점 사이 최대 봉 수
+
+        Returns:
+            DivergenceState: 초기화된 상태 객체
+        """
+        state = cls(kinds, order, max_distance)
+        high = np.asarray(high_data, dtype=np.float64)
+        low = np.asarray(low_data, dtype=np.float64)
+        indicator = np.asarray(indicator_data, dtype=np.float64)
+        length = len(high)
+
+        if length == 0:
+            return state
+
+        def last_swing(price, kind):
+            positions = np.flatnonzero(swing_points(price, order, kind))
+            if len(positions) == 0:
+                return None
+            position = int(positions[-1])
+            return position, float(price[position]), float(indicator[position])
+
+        window = tuple(zip(high[-2*order:].tolist(), low[-2*order:].tolist(), indicator[-2*order:].tolist()))
+        state._state = {
+            "count": length, "window": window if order >= 1 else (),
+            "last_high": last_swing(high, "high"), "last_low": last_swing(low, "low")
+        }
+        signals = divergences(high, low, indicator, state.kinds, order, max_distance)[:, -1]
+        state._value = tuple(name for name, signal in zip(state.kinds, signals) if signal)
+        return state
@@ -0,0 +1,309 @@
+"""
+증분 지표 계산 모듈
+
+새 봉이 추가될 때 전체 이력을 다시 계산하지 않고, 이전 결과와 작은 상태만으로
+추가된 봉의 지표 값만 계산하는 기능을 제공합니다.
+
+- 구간형 지표(이동평균, 볼린저밴드, 스토캐스틱, 일목균형표, CCI, Williams %R, MFI):
+  추가된 봉과 각 지표의 조회 구간(lookback)만큼의 과거 봉으로 꼬리 부분만 다시 계산
+- 재귀형 지표(EMA, RSI, MACD, OBV, ADX, Parabolic SAR, ATR, VWAP, 켈트너 채널):
+  analysis.streaming의 상태 객체를 이어받아 추가된 봉만 갱신 (일괄 계산과 비트 단위 동일)
+
+결과는 용량을 두 배씩 늘리는 버퍼에 저장하므로 한 봉 추가 비용은 이력 길이와 무관합니다.
+
+사용 예:
+    rsi_inc = IncrementalIndicator("rsi", period=14)
+    rsi_inc.extend(close)          # 첫 호출: 전체 계산
+    rsi_inc.extend(close_with_new) # 이후: 추가된 봉만 계산
+    rsi_inc.values
+"""
+
+import numpy as np
+
+from . import indicators
+from .streaming import (
+    EMAState, RSIState, MACDState, OBVState, ADXState, ParabolicSARState, ATRState, VWAPState, KeltnerState
+)
+
+# 지표별 증분 계산 방식
+#   lookback: 새 봉 계산에 필요한 직전 봉 수
+#   rewrite: 새 봉 추가 시 값이 바뀌는 기존 결과의 끝부분 길이
+#   min_length: 일괄 계산 함수가 값을 내기 시작하는 최소 데이터 길이
+INCREMENTAL_SPECS = {
+    "moving_average": {
+        "kind": "window",
+        "lookback": lambda p: p.get("period", 20) - 1,
+        "min_length": lambda p: p.get("period", 20),
+    },
+    "bollinger_bands": {
+        "kind": "window",
+        "lookback": lambda p: p.get("period", 20) - 1,
+        "min_length": lambda p: p.get("period", 20),
+    },
+    "stochastic": {
+        "kind": "window",
+        "lookback": lambda p: p.get("k_period", 14) + p.get("d_period", 3) - 2,
+        "min_length": lambda p: p.get("k_period", 14) + p.get("d_period", 3),
+    },
+    "ichimoku_cloud": {
+        "kind": "window",
+        "lookback": lambda p: max(p.get("tenkan_period", 9), p.get("kijun_period", 26), p.get("senkou_span_b_period", 52))
+        + p.get("displacement", 26) - 1,
+        "rewrite": lambda p: p.get("displacement", 26),  # 후행스팬
+        "min_length": lambda p: max(p.get("tenkan_period", 9), p.get("kijun_period", 26), p.get("senkou_span_b_period", 52))
+        + p.get("displacement", 26),
+    },
+    "commodity_channel_index": {
+        "kind": "window",
+        "lookback": lambda p: p.get("period", 20) - 1,
+        "min_length": lambda p: p.get("period", 20),
+    },
+    "williams_r": {
+        "kind": "window",
+        "lookback": lambda p: p.get("period", 14) - 1,
+        "min_length": lambda p: p.get("period", 14),
+    },
+    "money_flow_index": {
+        "kind": "window",
+        "lookback": lambda p: p.get("period", 14),
+        "min_length": lambda p: p.get("period", 14) + 1,
+    },
+    "exponential_moving_average": {
+        "kind": "stream", "state": EMAState,
+        "min_length": lambda p: p.get("period", 20),
+    },
+    "rsi": {
+        "kind": "stream", "state": RSIState,
+        "min_length": lambda p: p.get("period", 14) + 1,
+    },
+    "macd": {
+        "kind": "stream", "state": MACDState,
+        "min_length": lambda p: p.get("slow_period", 26) + p.get("signal_period", 9),
+    },
+    "on_balance_volume": {
+        "kind": "stream", "state": OBVState,
+        "min_length": lambda p: 2,
+    },
+    "average_directional_index": {
+        "kind": "stream", "state": ADXState,
+        "min_length": lambda p: p.get("period", 14) * 2,
+    },
+    "parabolic_sar": {
+        "kind": "stream", "state": ParabolicSARState,
+        "min_length": lambda p: 2,
+    },
+    "average_true_range": {
+        "kind": "stream", "state": ATRState,
+        "min_length": lambda p: p.get("period", 14) + 1,
+    },
+    "vwap": {
+        "kind": "stream", "state": VWAPState,
+        "min_length": lambda p: 1,
+    },
+    "keltner_channels": {
+        "kind": "stream", "state": KeltnerState,
+        "min_length": lambda p: max(p.get("ema_period", 20), p.get("atr_period", 10) + 1),
+    },
+}
+
+class GrowableArray:
+    """
+    용량을 두 배씩 늘리는 1차원 버퍼 (기본 float64)
+
+    끝에 값을 추가하는 비용이 분할 상환 O(추가 개수)입니다.
+    기록할 값을 버퍼 자료형으로 안전하게 변환할 수 없으면 (예: 더 긴 문자열) 자료형을 넓힙니다.
+    """
+
+    def __init__(self, capacity=1024, dtype=np.float64):
+        """
+        초기화
+
+        Args:
+            capacity (int): 초기 용량
+            dtype: 자료형
+        """
+        self._data = np.empty(max(capacity, 1), dtype=dtype)
+        self.length = 0
+
+    def _reserve(self, length, dtype=None):
+        """용량 확보 (dtype을 지정하면 자료형 변경)"""
+        if length > len(self._data) or dtype is not None:
+            capacity = len(self._data)
+            while capacity < length:
+                capacity *= 2
+            data = np.empty(capacity, dtype=self._data.dtype if dtype is None else dtype)
+            data[:self.length] = self._data[:self.length]
+            self._data = data
+
+    def assign(self, values):
+        """
+        전체 값 교체
+
+        Args:
+            values (numpy.ndarray): 새 값
+        """
+        self.length = 0
+        self._reserve(len(values))
+        self._data[:len(values)] = values
+        self.length = len(values)
+
+    def write(self, start, values):
+        """
+        start 위치부터 값 기록 (끝을 넘으면 길이 증가)
+
+        Args:
+            start (int): 시작 위치 (<= 현재 길이)
+            values (numpy.ndarray): 기록할 값
+        """
+        end = start + len(values)
+        values = np.asarray(values)
+        if not np.can_cast(values.dtype, self._data.dtype):
+            self._reserve(end, np.result_type(self._data.dtype, values.dtype) if self.length else values.dtype)
+        self._reserve(end)
+        self._data[start:end] = values
+        self.length = max(self.length, end)
+
+    def view(self):
+        """
+        현재 값 (버퍼의 뷰)
+
+        Returns:
+            numpy.ndarray: 길이 length의 뷰 (다음 기록 전까지 유효)
+        """
+        return self._data[:self.length]
+
+class IncrementalIndicator:
+    """
+    증분 지표 계산 클래스
+
+    이전 결과와 상태를 보관하고, extend()에 전달된 데이터 중 새로 추가된 봉만 계산합니다.
+    데이터가 줄었거나 마지막으로 계산한 봉의 값이 바뀐 경우(이력 교체)에는 전체를 다시 계산합니다.
+    그 이전 봉만 수정된 경우는 감지하지 않으므로 reset()을 호출해야 합니다.
+    """
+
+    def __init__(self, indicator, **params):
+        """
+        초기화
+
+        Args:
+            indicator (str): analysis.indicators의 지표 함수 이름
+            **params: 지표 파라미터
+        """
+        if indicator not in INCREMENTAL_SPECS:
+            raise ValueError(f"증분 계산을 지원하지 않는 지표입니다: {indicator}")
+
+        self.indicator = indicator
+        self.params = params
+        self.function = getattr(indicators, indicator)
+
+        spec = INCREMENTAL_SPECS[indicator]
+        self.kind = spec["kind"]
+        self.state_class = spec.get("state")
+        self.lookback = spec["lookback"](params) if "lookback" in spec else 0
+        self.rewrite = spec["rewrite"](params) if "rewrite" in spec else 0
+        self.min_length = spec["min_length"](params)
+
+        self.reset()
+
+    def reset(self):
+        """결과와 상태 초기화"""
+        self.length = 0
+        self.state = None
+        self.last_inputs = None
+        self.buffers = None
+        self.is_tuple = False
+
+    def _store_all(self, output):
+        """일괄 계산 결과 저장"""
+        self.is_tuple = isinstance(output, tuple)
+        outputs = output if self.is_tuple else (output,)
+        if self.buffers is None or len(self.buffers) != len(outputs):
+            self.buffers = [GrowableArray(len(outputs[0]) * 2) for _ in outputs]
+        for buffer, values in zip(self.buffers, outputs):
+            buffer.assign(values)
+
+    def _recompute(self, inputs):
+        """전체 재계산"""
+        self._store_all(self.function(*inputs, **self.params))
+
+        if self.kind == "stream" and len(inputs[0]) >= self.min_length:
+            self.state = self.state_class.from_history(*inputs, **self.params)
+        else:
+            self.state = None
+
+    def _is_continuation(self, inputs):
+        """이전에 계산한 데이터에 봉만 추가된 것인지 확인"""
+        if self.last_inputs is None or len(inputs[0]) < self.length:
+            return False
+        index = self.length - 1
+        return all(
+            values[index] == last or (np.isnan(last) and np.isnan(values[index]))
+            for values, last in zip(inputs, self.last_inputs)
+        )
+
+    def extend(self, *inputs):
+        """
+        새로 추가된 봉의 지표 계산
+
+        Args:
+            *inputs (numpy.ndarray): 지표 함수와 같은 순서의 전체 입력 데이터 (기존 봉 + 추가 봉)
+
+        Returns:
+            numpy.ndarray or tuple: 전체 지표 값 (values와 동일)
+        """
+        inputs = [np.asarray(values, dtype=np.float64) for values in inputs]
+        length = len(inputs[0])
+
+        if length == 0:
+            self.reset()
+            self._store_all(self.function(*inputs, **self.params))
+        elif self.length < self.min_length or not self._is_continuation(inputs):
+            # 첫 계산, 이력 교체, 또는 아직 일괄 계산이 값을 내지 않는 구간
+            self._recompute(inputs)
+        elif length > self.length:
+            if self.kind == "stream":
+                self._extend_stream(inputs)
+            else:
+                self._extend_window(inputs)
+
+        self.length = length
+        self.last_inputs = [values[length-1] for values in inputs] if length else None
+        return self.values
+
+    def _extend_stream(self, inputs):
+        """재귀형 지표: 상태 객체로 추가 봉만 갱신"""
+        start = self.length
+        new_values = [self.state.append(*[values[i] for values in inputs]) for i in range(start, len(inputs[0]))]
+
+        if self.is_tuple:
+            for j, buffer in enumerate(self.buffers):
+                buffer.write(start, np.array([value[j] for value in new_values]))
+        else:
+            self.buffers[0].write(start, np.array(new_values, dtype=np.float64))
+
+    def _extend_window(self, inputs):
+        """구간형 지표: 조회 구간만큼의 과거 봉과 추가 봉으로 꼬리 부분만 재계산"""
+        length = len(inputs[0])
+        write_start = max(self.length - self.rewrite, 0)
+        slice_start = max(min(write_start - self.lookback, length - self.min_length), 0)
+
+        output = self.function(*[values[slice_start:] for values in inputs], **self.params)
+        outputs = output if self.is_tuple else (output,)
+
+        offset = write_start - slice_start
+        for buffer, values in zip(self.buffers, outputs):
+            buffer.write(write_start, values[offset:])
+
+    @property
+    def values(self):
+        """
+        전체 지표 값
+
+        Returns:
+            numpy.ndarray or tuple: 버퍼의 뷰 (다음 extend() 전까지 유효)
+        """
+        if self.buffers is None:
+            return None
+        if self.is_tuple:
+            return tuple(buffer.view() for buffer in self.buffers)
+        return self.buffers[0].view()
@@ -2,62 +2,209 @@
 기술적 지표 계산 모듈
 
 이 모듈은 주식 차트에 사용되는 다양한 기술적 지표를 계산하는 함수를 제공합니다.
+
+모든 지표 함수는 다음 선택 인자를 받습니다.
+- out: 결과를 저장할 배열 (결과가 여러 개면 배열 튜플)
+- dtype: out이 없을 때 새로 할당할 결과 배열의 자료형 (예: np.float32, 기본 float64)
+- workspace: 임시 배열을 재사용하는 analysis.rolling.Workspace
+
+내부 계산은 항상 float64로 수행하며, float32 결과는 float64 결과를 반올림한 값입니다.
+
+EMA, Wilder 평활(RSI, ADX), Parabolic SAR, 이동 분위수처럼 순차 계산이 필요한 부분은
+analysis.backend의 백엔드 커널로 계산합니다. numba가 설치되어 있으면 JIT 백엔드를, 없으면 numpy 백엔드를
+자동으로 선택하며, set_backend() 또는 use_backend()로 백엔드를 직접 지정할 수 있습니다 (이 모듈에서도 사용 가능).
+모든 백엔드의 결과는 같습니다.
 """
 
 import numpy as np
 import pandas as pd
 
-def moving_average(data, period=20):
+from .backend import available_backends, get_backend, kernel, register_backend, set_backend, use_backend
+from .rolling import (
+    rolling_sum, rolling_mean, rolling_mean_bank, rolling_mean_var, rolling_max, rolling_min,
+    _exact_int64, _scratch
+)
+
+def _prepare_output(shape, count, out, dtype):
+    """
+    결과 배열 준비
+
+    Args:
+        shape (int or tuple): 결과 배열 형태
+        count (int): 결과 배열 개수
+        out: 결과를 저장할 배열 (결과가 여러 개면 배열 튜플, None이면 새로 할당)
+        dtype: 새로 할당할 배열의 자료형 (None이면 float64)
+
+    Returns:
+        list: 결과 배열 목록
+    """
+    shape = (shape,) if np.ndim(shape) == 0 else tuple(shape)
+
+    if out is None:
+        dtype = np.float64 if dtype is None else dtype
+        return [np.empty(shape, dtype=dtype) for _ in range(count)]
+
+    arrays = [out] if count == 1 else list(out)
+    if len(arrays) != count or any(array.shape != shape for array in arrays):
+        raise ValueError(f"out 배열의 개수 또는 형태가 결과({count}개, {shape})와 맞지 않습니다.")
+
+    return arrays
+
+def _empty_result(arrays):
+    """
+    결과 배열을 NaN으로 채워 반환
+
+    Args:
+        arrays (list): 결과 배열 목록
+
+    Returns:
+        numpy.ndarray or tuple: NaN 결과
+    """
+    for array in arrays:
+        array.fill(np.nan)
+    return arrays[0] if len(arrays) == 1 else tuple(arrays)
+
+def _float64_buffer(result, workspace, name):
+    """
+    float64 계산 버퍼 준비
+
+    결과 배열이 float64이면 그대로, 아니면 (float32 결과 등) 임시 float64 배열을 반환합니다.
+
+    Args:
+        result (numpy.ndarray): 결과 배열
+        workspace (Workspace): 임시 배열 저장소
+        name (str): 임시 배열 이름
+
+    Returns:
+        numpy.ndarray: float64 배열
+    """
+    if result.dtype == np.float64:
+        return result
+    return _scratch(workspace, name, result.shape)
+
+def _store(result, values):
+    """
+    계산 버퍼의 값을 결과 배열에 저장
+
+    Args:
+        result (numpy.ndarray): 결과 배열
+        values (numpy.ndarray): 계산 버퍼
+
+    Returns:
+        numpy.ndarray: 결과 배열
+    """
+    if values is not result:
+        result[...] = values
+    return result
+
+def _zeros(workspace, name, length):
+    """
+    0으로 채운 임시 float64 배열
+
+    Args:
+        workspace (Workspace): 임시 배열 저장소
+        name (str): 임시 배열 이름
+        length (int): 배열 길이
+
+    Returns:
+        numpy.ndarray: 0 배열
+    """
+    array = _scratch(workspace, name, length)
+    array.fill(0)
+    return array
+
+def _wilder_filter(values, period, start, seed, out, kind="mean"):
+    """
+    Wilder 평활 재귀 필터
+    
+    out[start] = seed에서 시작해 이후 값을 재귀식으로 계산합니다.
+    
+    - kind="mean": out[i] = (out[i-1] * (period-1) + values[i]) / period (RSI, ADX)
+    - kind="sum": out[i] = out[i-1] - out[i-1] / period + values[i] (ADX의 TR, DM 평활)
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        period (int): 평활 기간
+        start (int): 시작 위치
+        seed (float): 시작 위치의 값
+        out (numpy.ndarray): 결과를 저장할 배열 (start 이후만 기록)
+        kind (str): "mean" 또는 "sum"
+        
+    Returns:
+        numpy.ndarray: out 배열
+    """
+    kernel("wilder")(values, period, start, float(seed), out, kind == "sum")
+    return out
+
+def moving_average(data, period=20, out=None, dtype=None, workspace=None):
     """
     이동평균선 계산
     
     Args:
         data (numpy.ndarray): 가격 데이터
         period (int): 이동평균 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         numpy.ndarray: 이동평균 데이터
     """
-    if len(data) < period:
-        return np.array([np.nan] * len(data))
-        
-    ma = np.zeros_like(data)
-    for i in range(len(data)):
-        if i < period - 1:
-            ma[i] = np.nan
-        else:
-            ma[i] = np.mean(data[max(0, i-period+1):i+1])
+    (result,) = _prepare_output(np.shape(data), 1, out, dtype)
+    return rolling_mean(data, period, result, workspace)
+
+def moving_average_bank(data, periods=(5, 10, 20, 60, 120), out=None, dtype=None, workspace=None):
+    """
+    여러 기간의 이동평균선을 한 번에 계산
+    
+    모든 기간이 하나의 누적합 계산을 공유하므로 기간마다 moving_average()를
+    호출하는 것보다 빠르며, 결과는 기간별 moving_average()와 같습니다.
     
-    return ma
+    Args:
+        data (numpy.ndarray): 가격 데이터
+        periods (list): 이동평균 기간 목록
+        out (numpy.ndarray): 결과를 저장할 (기간 수, 데이터 길이) 배열 (선택)
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: (기간 수, 데이터 길이) 형태의 이동평균 데이터
+    """
+    if out is None and dtype is not None:
+        out = np.empty((len(periods),) + np.shape(data), dtype=dtype)
+    return rolling_mean_bank(data, periods, out, workspace)
 
-def exponential_moving_average(data, period=20):
+def exponential_moving_average(data, period=20, out=None, dtype=None, workspace=None):
     """
     지수 이동평균선 계산
     
     Args:
         data (numpy.ndarray): 가격 데이터
         period (int): 이동평균 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         numpy.ndarray: 지수 이동평균 데이터
     """
+    (result,) = _prepare_output(len(data), 1, out, dtype)
+    
     if len(data) < period:
-        return np.array([np.nan] * len(data))
+        return _empty_result([result])
         
-    ema = np.zeros_like(data)
-    ema[period-1] = np.mean(data[:period])
+    values = np.asarray(data, dtype=np.float64)
+    ema = _float64_buffer(result, workspace, "ema")
     
+    # 첫 값은 기간 평균, 이후 재귀 계산
     k = 2 / (period + 1)
+    kernel("ema")(values, k, period - 1, float(np.mean(values[:period])), ema)
     
-    for i in range(period, len(data)):
-        ema[i] = data[i] * k + ema[i-1] * (1-k)
-    
-    for i in range(period-1):
-        ema[i] = np.nan
+    ema[:period-1] = np.nan
     
-    return ema
+    return _store(result, ema)
 
-def bollinger_bands(data, period=20, std_dev=2):
+def bollinger_bands(data, period=20, std_dev=2, out=None, dtype=None, workspace=None):
     """
     볼린저 밴드 계산
     
@@ -65,121 +212,192 @@ def bollinger_bands(data, period=20, std_dev=2):
         data (numpy.ndarray): 가격 데이터
         period (int): 이동평균 기간
         std_dev (float): 표준편차 배수
+        out (tuple): 결과를 저장할 (중간선, 상단선, 하단선) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         tuple: (중간선, 상단선, 하단선)
     """
+    arrays = _prepare_output(len(data), 3, out, dtype)
+    
     if len(data) < period:
-        empty = np.array([np.nan] * len(data))
-        return empty, empty, empty
+        return _empty_result(arrays)
         
-    # 중간선 (이동평균)
-    middle = moving_average(data, period)
+    # 중간선 (이동평균)과 분산 (모분산)
+    middle = _float64_buffer(arrays[0], workspace, "bollinger_middle")
+    var = _scratch(workspace, "bollinger_var", len(data))
+    rolling_mean_var(data, period, (middle, var), workspace)
+    
+    return _bollinger_from_mean_var(middle, var, std_dev, arrays, workspace)
+
+def _bollinger_from_mean_var(middle, var, std_dev, out=None, workspace=None):
+    """
+    이동평균과 분산으로 볼린저 밴드 계산
     
-    # 표준편차
-    std = np.zeros_like(data)
-    for i in range(len(data)):
-        if i < period - 1:
-            std[i] = np.nan
-        else:
-            std[i] = np.std(data[max(0, i-period+1):i+1])
+    Args:
+        middle (numpy.ndarray): 이동평균 (중간선)
+        var (numpy.ndarray): 이동 구간 모분산
+        std_dev (float): 표준편차 배수
+        out (tuple): 결과를 저장할 (중간선, 상단선, 하단선) 배열 (None이면 중간선은 middle 그대로)
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        tuple: (중간선, 상단선, 하단선)
+    """
+    # 표준편차 × 배수
+    band = np.sqrt(var, out=_scratch(workspace, "bollinger_band", np.shape(var)))
+    np.multiply(std_dev, band, out=band)
     
     # 상단선, 하단선
-    upper = middle + std_dev * std
-    lower = middle - std_dev * std
+    if out is None:
+        return middle, middle + band, middle - band
+    
+    middle_out, upper, lower = out
+    np.add(middle, band, out=upper)
+    np.subtract(middle, band, out=lower)
     
-    return middle, upper, lower
+    return _store(middle_out, middle), upper, lower
 
-def macd(data, fast_period=12, slow_period=26, signal_period=9):
+def macd(data, fast_period=12, slow_period=26, signal_period=9, out=None, dtype=None, workspace=None):
     """
     MACD (Moving Average Convergence Divergence) 계산
     
+    시그널 라인은 MACD 라인이 유효해진 봉(max(fast_period, slow_period) - 1)부터 EMA를 계산합니다.
+    MACD 라인 앞부분의 NaN을 EMA 초기값에 포함하면 시그널 라인과 히스토그램이 전부 NaN이 됩니다.
+    데이터가 slow_period + signal_period개 미만이면 결과는 모두 NaN입니다.
+    
     Args:
         data (numpy.ndarray): 가격 데이터
         fast_period (int): 빠른 EMA 기간
         slow_period (int): 느린 EMA 기간
         signal_period (int): 시그널 EMA 기간
+        out (tuple): 결과를 저장할 (MACD 라인, 시그널 라인, 히스토그램) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         tuple: (MACD 라인, 시그널 라인, 히스토그램)
     """
+    arrays = _prepare_output(len(data), 3, out, dtype)
+    
     if len(data) < slow_period + signal_period:
-        empty = np.array([np.nan] * len(data))
-        return empty, empty, empty
+        return _empty_result(arrays)
         
     # 빠른 EMA, 느린 EMA
-    fast_ema = exponential_moving_average(data, fast_period)
-    slow_ema = exponential_moving_average(data, slow_period)
+    fast_ema = exponential_moving_average(data, fast_period, out=_scratch(workspace, "macd_fast_ema", len(data)))
+    slow_ema = exponential_moving_average(data, slow_period, out=_scratch(workspace, "macd_slow_ema", len(data)))
+    
+    return _macd_from_ema(fast_ema, slow_ema, fast_period, slow_period, signal_period, arrays, workspace)
+
+def _macd_from_ema(fast_ema, slow_ema, fast_period, slow_period, signal_period, out=None, workspace=None):
+    """
+    빠른/느린 EMA로 MACD 계산
+    
+    Args:
+        fast_ema (numpy.ndarray): 빠른 EMA
+        slow_ema (numpy.ndarray): 느린 EMA
+        fast_period (int): 빠른 EMA 기간
+        slow_period (int): 느린 EMA 기간
+        signal_period (int): 시그널 EMA 기간
+        out (tuple): 결과를 저장할 (MACD 라인, 시그널 라인, 히스토그램) 배열
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        tuple: (MACD 라인, 시그널 라인, 히스토그램)
+    """
+    macd_out, signal_out, histogram = _prepare_output(len(fast_ema), 3, out, None)
     
     # MACD 라인
-    macd_line = fast_ema - slow_ema
+    macd_line = _float64_buffer(macd_out, workspace, "macd_line")
+    np.subtract(fast_ema, slow_ema, out=macd_line)
     
-    # 시그널 라인
-    signal_line = exponential_moving_average(macd_line, signal_period)
+    # 시그널 라인 (MACD 라인이 유효한 구간부터 계산)
+    start = max(fast_period, slow_period) - 1
+    signal_line = _float64_buffer(signal_out, workspace, "macd_signal")
+    signal_line[:start] = np.nan
+    exponential_moving_average(macd_line[start:], signal_period, out=signal_line[start:])
     
     # 히스토그램
-    histogram = macd_line - signal_line
+    np.subtract(macd_line, signal_line, out=histogram)
     
-    return macd_line, signal_line, histogram
+    return _store(macd_out, macd_line), _store(signal_out, signal_line), histogram
 
-def rsi(data, period=14):
+def _rsi_averages(data, period, workspace=None):
     """
-    RSI (Relative Strength Index) 계산
+    RSI 평균 상승폭/하락폭 계산 (Wilder 평활)
     
     Args:
-        data (numpy.ndarray): 가격 데이터
+        data (numpy.ndarray): 가격 데이터 (길이 > period)
         period (int): RSI 기간
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
-        numpy.ndarray: RSI 데이터
+        tuple: (평균 상승, 평균 하락) - 인덱스 period부터 유효
     """
-    if len(data) < period + 1:
-        return np.array([np.nan] * len(data))
-        
+    data = np.asarray(data, dtype=np.float64)
+    length = len(data)
+    
     # 가격 변화
-    delta = np.zeros_like(data)
-    delta[1:] = data[1:] - data[:-1]
+    delta = _scratch(workspace, "rsi_delta", length)
+    np.subtract(data[1:], data[:-1], out=delta[1:])
     delta[0] = 0
     
     # 상승, 하락 구분
-    gain = np.zeros_like(delta)
-    loss = np.zeros_like(delta)
+    gain = _zeros(workspace, "rsi_gain", length)
+    loss = _zeros(workspace, "rsi_loss", length)
     
-    gain[delta > 0] = delta[delta > 0]
-    loss[delta < 0] = -delta[delta < 0]
+    np.copyto(gain, delta, where=delta > 0)
+    np.negative(delta, out=loss, where=delta < 0)
     
     # 평균 상승, 평균 하락
-    avg_gain = np.zeros_like(data)
-    avg_loss = np.zeros_like(data)
+    avg_gain = _zeros(workspace, "rsi_avg_gain", length)
+    avg_loss = _zeros(workspace, "rsi_avg_loss", length)
     
-    # 첫 번째 평균
-    avg_gain[period] = np.mean(gain[1:period+1])
-    avg_loss[period] = np.mean(loss[1:period+1])
+    # 첫 번째 평균 이후 Wilder 평활
+    _wilder_filter(gain, period, period, np.mean(gain[1:period+1]), avg_gain)
+    _wilder_filter(loss, period, period, np.mean(loss[1:period+1]), avg_loss)
     
-    # 나머지 평균
-    for i in range(period+1, len(data)):
-        avg_gain[i] = (avg_gain[i-1] * (period-1) + gain[i]) / period
-        avg_loss[i] = (avg_loss[i-1] * (period-1) + loss[i]) / period
+    return avg_gain, avg_loss
+
+def rsi(data, period=14, out=None, dtype=None, workspace=None):
+    """
+    RSI (Relative Strength Index) 계산
     
-    # RSI 계산
-    rs = np.zeros_like(data)
-    rsi_values = np.zeros_like(data)
+    Args:
+        data (numpy.ndarray): 가격 데이터
+        period (int): RSI 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: RSI 데이터
+    """
+    (result,) = _prepare_output(len(data), 1, out, dtype)
     
-    for i in range(period, len(data)):
-        if avg_loss[i] == 0:
-            rs[i] = 100
-        else:
-            rs[i] = avg_gain[i] / avg_loss[i]
+    if len(data) < period + 1:
+        return _empty_result([result])
         
-        rsi_values[i] = 100 - (100 / (1 + rs[i]))
+    # 평균 상승, 평균 하락
+    avg_gain, avg_loss = _rsi_averages(data, period, workspace)
+    
+    # RSI 계산 (평균 하락이 0이면 RS = 100)
+    rs = _scratch(workspace, "rsi_rs", len(data))
+    no_loss = avg_loss == 0
+    np.divide(avg_gain, avg_loss, out=rs, where=~no_loss)
+    rs[no_loss] = 100
+    
+    rs += 1
+    np.divide(100, rs, out=rs)
+    np.subtract(100, rs, out=result)
     
     # 기간 이전의 값은 NaN으로 설정
-    for i in range(period):
-        rsi_values[i] = np.nan
+    result[:period] = np.nan
     
-    return rsi_values
+    return result
 
-def stochastic(high_data, low_data, close_data, k_period=14, d_period=3):
+def stochastic(high_data, low_data, close_data, k_period=14, d_period=3, out=None, dtype=None, workspace=None):
     """
     스토캐스틱 계산
     
@@ -189,36 +407,59 @@ def stochastic(high_data, low_data, close_data, k_period=14, d_period=3):
         close_data (numpy.ndarray): 종가 데이터
         k_period (int): %K 기간
         d_period (int): %D 기간
+        out (tuple): 결과를 저장할 (%K, %D) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         tuple: (%K, %D)
     """
-    if len(close_data) < k_period + d_period:
-        empty = np.array([np.nan] * len(close_data))
-        return empty, empty
+    length = len(close_data)
+    arrays = _prepare_output(length, 2, out, dtype)
+    
+    if length < k_period + d_period:
+        return _empty_result(arrays)
         
-    # %K 계산
-    k = np.zeros_like(close_data)
+    # 기간 내 최고가, 최저가
+    high_max = rolling_max(high_data, k_period, _scratch(workspace, "stochastic_high_max", length), workspace)
+    low_min = rolling_min(low_data, k_period, _scratch(workspace, "stochastic_low_min", length), workspace)
+    
+    return _stochastic_from_extrema(close_data, high_max, low_min, d_period, arrays, workspace)
+
+def _stochastic_from_extrema(close_data, high_max, low_min, d_period, out=None, workspace=None):
+    """
+    기간 최고가/최저가로 스토캐스틱 계산
     
-    for i in range(k_period-1, len(close_data)):
-        high_max = np.max(high_data[i-k_period+1:i+1])
-        low_min = np.min(low_data[i-k_period+1:i+1])
+    Args:
+        close_data (numpy.ndarray): 종가 데이터
+        high_max (numpy.ndarray): %K 기간 최고가
+        low_min (numpy.ndarray): %K 기간 최저가
+        d_period (int): %D 기간
+        out (tuple): 결과를 저장할 (%K, %D) 배열
+        workspace (Workspace): 임시 배열 저장소
         
-        if high_max == low_min:
-            k[i] = 50
-        else:
-            k[i] = 100 * (close_data[i] - low_min) / (high_max - low_min)
+    Returns:
+        tuple: (%K, %D)
+    """
+    k_out, d = _prepare_output(np.shape(close_data), 2, out, None)
     
-    # 기간 이전의 값은 NaN으로 설정
-    for i in range(k_period-1):
-        k[i] = np.nan
+    # %K 계산 (앞쪽 k_period-1개는 NaN)
+    price_range = np.subtract(high_max, low_min, out=_scratch(workspace, "stochastic_range", np.shape(high_max)))
+    
+    k = _float64_buffer(k_out, workspace, "stochastic_k")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.subtract(np.asarray(close_data, dtype=np.float64), low_min, out=k)
+        np.multiply(100, k, out=k)
+        np.divide(k, price_range, out=k)
+    k[price_range == 0] = 50
     
     # %D 계산 (단순 이동평균)
-    d = moving_average(k, d_period)
+    rolling_mean(k, d_period, d, workspace)
     
-    return k, d
+    return _store(k_out, k), d
 
-def ichimoku_cloud(high_data, low_data, close_data, tenkan_period=9, kijun_period=26, senkou_span_b_period=52, displacement=26):
+def ichimoku_cloud(high_data, low_data, close_data, tenkan_period=9, kijun_period=26, senkou_span_b_period=52, displacement=26,
+                   out=None, dtype=None, workspace=None):
     """
     일목균형표 계산
     
@@ -230,193 +471,299 @@ def ichimoku_cloud(high_data, low_data, close_data, tenkan_period=9, kijun_perio
         kijun_period (int): 기준선 기간
         senkou_span_b_period (int): 선행스팬 B 기간
         displacement (int): 이격 기간
+        out (tuple): 결과를 저장할 (전환선, 기준선, 선행스팬 A, 선행스팬 B, 후행스팬) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         tuple: (전환선, 기준선, 선행스팬 A, 선행스팬 B, 후행스팬)
     """
-    if len(close_data) < max(tenkan_period, kijun_period, senkou_span_b_period) + displacement:
-        empty = np.array([np.nan] * len(close_data))
-        return empty, empty, empty, empty, empty
+    length = len(close_data)
+    arrays = _prepare_output(length, 5, out, dtype)
+    
+    if length < max(tenkan_period, kijun_period, senkou_span_b_period) + displacement:
+        return _empty_result(arrays)
+        
+    # 기간별 최고가, 최저가
+    extrema = {
+        period: (
+            rolling_max(high_data, period, _scratch(workspace, f"ichimoku_high_max_{period}", length), workspace),
+            rolling_min(low_data, period, _scratch(workspace, f"ichimoku_low_min_{period}", length), workspace)
+        )
+        for period in (tenkan_period, kijun_period, senkou_span_b_period)
+    }
+    
+    return _ichimoku_from_extrema(close_data, extrema, tenkan_period, kijun_period, senkou_span_b_period, displacement,
+                                  arrays, workspace)
+
+def _ichimoku_from_extrema(close_data, extrema, tenkan_period, kijun_period, senkou_span_b_period, displacement,
+                           out=None, workspace=None):
+    """
+    기간별 최고가/최저가로 일목균형표 계산
+    
+    Args:
+        close_data (numpy.ndarray): 종가 데이터
+        extrema (dict): {기간: (기간 최고가, 기간 최저가)}
+        tenkan_period (int): 전환선 기간
+        kijun_period (int): 기준선 기간
+        senkou_span_b_period (int): 선행스팬 B 기간
+        displacement (int): 이격 기간
+        out (tuple): 결과를 저장할 (전환선, 기준선, 선행스팬 A, 선행스팬 B, 후행스팬) 배열
+        workspace (Workspace): 임시 배열 저장소
         
+    Returns:
+        tuple: (전환선, 기준선, 선행스팬 A, 선행스팬 B, 후행스팬)
+    """
     # 데이터 길이
     length = len(close_data)
+    tenkan_out, kijun_out, senkou_span_a, senkou_span_b, chikou_span = _prepare_output(length, 5, out, None)
     
-    # 전환선 (Tenkan-sen)
-    tenkan_sen = np.zeros_like(close_data)
-    for i in range(tenkan_period-1, length):
-        high_max = np.max(high_data[i-tenkan_period+1:i+1])
-        low_min = np.min(low_data[i-tenkan_period+1:i+1])
-        tenkan_sen[i] = (high_max + low_min) / 2
+    # 전환선 (Tenkan-sen, 앞쪽 tenkan_period-1개는 NaN)
+    tenkan_sen = _float64_buffer(tenkan_out, workspace, "ichimoku_tenkan")
+    np.add(extrema[tenkan_period][0], extrema[tenkan_period][1], out=tenkan_sen)
+    tenkan_sen /= 2
     
-    # 기준선 (Kijun-sen)
-    kijun_sen = np.zeros_like(close_data)
-    for i in range(kijun_period-1, length):
-        high_max = np.max(high_data[i-kijun_period+1:i+1])
-        low_min = np.min(low_data[i-kijun_period+1:i+1])
-        kijun_sen[i] = (high_max + low_min) / 2
+    # 기준선 (Kijun-sen, 앞쪽 kijun_period-1개는 NaN)
+    kijun_sen = _float64_buffer(kijun_out, workspace, "ichimoku_kijun")
+    np.add(extrema[kijun_period][0], extrema[kijun_period][1], out=kijun_sen)
+    kijun_sen /= 2
     
     # 선행스팬 A (Senkou Span A)
-    senkou_span_a = np.zeros_like(close_data)
-    for i in range(kijun_period-1, length):
-        if i + displacement < length:
-            senkou_span_a[i+displacement] = (tenkan_sen[i] + kijun_sen[i]) / 2
+    start = kijun_period - 1
+    senkou_span_a[:start+displacement] = 0
+    np.add(tenkan_sen[start:length-displacement], kijun_sen[start:length-displacement], out=senkou_span_a[start+displacement:])
+    senkou_span_a[start+displacement:] /= 2
     
     # 선행스팬 B (Senkou Span B)
-    senkou_span_b = np.zeros_like(close_data)
-    for i in range(senkou_span_b_period-1, length):
-        if i + displacement < length:
-            high_max = np.max(high_data[i-senkou_span_b_period+1:i+1])
-            low_min = np.min(low_data[i-senkou_span_b_period+1:i+1])
-            senkou_span_b[i+displacement] = (high_max + low_min) / 2
+    start = senkou_span_b_period - 1
+    high_max, low_min = extrema[senkou_span_b_period]
+    senkou_span_b[:start+displacement] = 0
+    np.add(high_max[start:length-displacement], low_min[start:length-displacement], out=senkou_span_b[start+displacement:])
+    senkou_span_b[start+displacement:] /= 2
     
     # 후행스팬 (Chikou Span)
-    chikou_span = np.zeros_like(close_data)
-    for i in range(length):
-        if i - displacement >= 0:
-            chikou_span[i-displacement] = close_data[i]
-    
-    # 기간 이전의 값은 NaN으로 설정
-    for i in range(tenkan_period-1):
-        tenkan_sen[i] = np.nan
-    
-    for i in range(kijun_period-1):
-        kijun_sen[i] = np.nan
+    chikou_span[:length-displacement] = close_data[displacement:]
+    chikou_span[length-displacement:] = 0
     
-    return tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b, chikou_span
+    return _store(tenkan_out, tenkan_sen), _store(kijun_out, kijun_sen), senkou_span_a, senkou_span_b, chikou_span
 
-def on_balance_volume(close_data, volume_data):
+def on_balance_volume(close_data, volume_data, out=None, dtype=None, workspace=None):
     """
     OBV (On Balance Volume) 계산
     
     Args:
         close_data (numpy.ndarray): 종가 데이터
         volume_data (numpy.ndarray): 거래량 데이터
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         numpy.ndarray: OBV 데이터
     """
+    (result,) = _prepare_output(len(close_data), 1, out, dtype)
+    
     if len(close_data) < 2:
-        return np.array([np.nan] * len(close_data))
+        return _empty_result([result])
         
-    obv = np.zeros_like(close_data)
+    close_data = np.asarray(close_data, dtype=np.float64)
+    volume_data = np.asarray(volume_data, dtype=np.float64)
+    
+    # 봉별 거래량 증감 (상승: +거래량, 하락: -거래량, 보합: 0)
+    obv = _float64_buffer(result, workspace, "obv")
+    change = np.subtract(close_data[1:], close_data[:-1], out=_scratch(workspace, "obv_change", len(close_data) - 1))
+    
     obv[0] = volume_data[0]
+    obv[1:] = 0
+    np.copyto(obv[1:], volume_data[1:], where=change > 0)
+    np.negative(volume_data[1:], out=obv[1:], where=change < 0)
     
-    for i in range(1, len(close_data)):
-        if close_data[i] > close_data[i-1]:
-            obv[i] = obv[i-1] + volume_data[i]
-        elif close_data[i] < close_data[i-1]:
-            obv[i] = obv[i-1] - volume_data[i]
-        else:
-            obv[i] = obv[i-1]
+    # 누적합 (앞에서부터 순서대로 더하므로 기존 루프와 같은 값)
+    np.cumsum(obv, out=obv)
     
-    return obv
+    return _store(result, obv)
 
-def average_directional_index(high_data, low_data, close_data, period=14):
+def true_range(high_data, low_data, close_data, out=None, dtype=None, workspace=None):
     """
-    ADX (Average Directional Index) 계산
+    True Range 계산
     
     Args:
         high_data (numpy.ndarray): 고가 데이터
         low_data (numpy.ndarray): 저가 데이터
         close_data (numpy.ndarray): 종가 데이터
-        period (int): ADX 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
-        tuple: (ADX, +DI, -DI)
+        numpy.ndarray: True Range 데이터 (첫 번째 값은 고가 - 저가)
     """
-    if len(close_data) < period * 2:
-        empty = np.array([np.nan] * len(close_data))
-        return empty, empty, empty
+    high_data = np.asarray(high_data, dtype=np.float64)
+    low_data = np.asarray(low_data, dtype=np.float64)
+    close_data = np.asarray(close_data, dtype=np.float64)
+    
+    (result,) = _prepare_output(high_data.shape, 1, out, dtype)
+    tr = _float64_buffer(result, workspace, "true_range")
+    np.subtract(high_data, low_data, out=tr)
+    
+    if len(tr) > 1:
+        prev_close = close_data[:-1]
+        gap = _scratch(workspace, "true_range_gap", len(tr) - 1)
+        np.abs(np.subtract(high_data[1:], prev_close, out=gap), out=gap)
+        np.maximum(tr[1:], gap, out=tr[1:])
+        np.abs(np.subtract(low_data[1:], prev_close, out=gap), out=gap)
+        np.maximum(tr[1:], gap, out=tr[1:])
+    
+    return _store(result, tr)
+
+def _adx_components(high_data, low_data, close_data, period, tr=None, out=None, workspace=None):
+    """
+    ADX 중간 계산값 산출
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터 (길이 >= period * 2)
+        period (int): ADX 기간
+        tr (numpy.ndarray): 미리 계산한 True Range (None이면 계산)
+        out (tuple): ADX, +DI, -DI를 저장할 float64 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
         
+    Returns:
+        dict: TR, DM, 평활값, DI, DX, ADX 배열
+    """
     # 데이터 길이
     length = len(close_data)
     
     # True Range (TR)
-    tr = np.zeros_like(close_data)
-    tr[0] = high_data[0] - low_data[0]
+    if tr is None:
+        tr = true_range(high_data, low_data, close_data, out=_scratch(workspace, "adx_tr", length), workspace=workspace)
     
-    for i in range(1, length):
-        hl = high_data[i] - low_data[i]
-        hc = abs(high_data[i] - close_data[i-1])
-        lc = abs(low_data[i] - close_data[i-1])
-        tr[i] = max(hl, hc, lc)
+    high_data = np.asarray(high_data, dtype=np.float64)
+    low_data = np.asarray(low_data, dtype=np.float64)
     
     # Directional Movement (DM)
-    plus_dm = np.zeros_like(close_data)
-    minus_dm = np.zeros_like(close_data)
-    
-    for i in range(1, length):
-        up_move = high_data[i] - high_data[i-1]
-        down_move = low_data[i-1] - low_data[i]
-        
-        if up_move > down_move and up_move > 0:
-            plus_dm[i] = up_move
-        else:
-            plus_dm[i] = 0
-            
-        if down_move > up_move and down_move > 0:
-            minus_dm[i] = down_move
-        else:
-            minus_dm[i] = 0
-    
-    # Smoothed TR and DM
-    smoothed_tr = np.zeros_like(close_data)
-    smoothed_plus_dm = np.zeros_like(close_data)
-    smoothed_minus_dm = np.zeros_like(close_data)
-    
-    # 첫 번째 평균
-    smoothed_tr[period] = np.sum(tr[1:period+1])
-    smoothed_plus_dm[period] = np.sum(plus_dm[1:period+1])
-    smoothed_minus_dm[period] = np.sum(minus_dm[1:period+1])
-    
-    # 나머지 평균
-    for i in range(period+1, length):
-        smoothed_tr[i] = smoothed_tr[i-1] - (smoothed_tr[i-1] / period) + tr[i]
-        smoothed_plus_dm[i] = smoothed_plus_dm[i-1] - (smoothed_plus_dm[i-1] / period) + plus_dm[i]
-        smoothed_minus_dm[i] = smoothed_minus_dm[i-1] - (smoothed_minus_dm[i-1] / period) + minus_dm[i]
-    
-    # Directional Indicators (DI)
-    plus_di = np.zeros_like(close_data)
-    minus_di = np.zeros_like(close_data)
-    
-    for i in range(period, length):
-        if smoothed_tr[i] == 0:
-            plus_di[i] = 0
-            minus_di[i] = 0
-        else:
-            plus_di[i] = 100 * smoothed_plus_dm[i] / smoothed_tr[i]
-            minus_di[i] = 100 * smoothed_minus_dm[i] / smoothed_tr[i]
-    
-    # Directional Index (DX)
-    dx = np.zeros_like(close_data)
-    
-    for i in range(period, length):
-        if plus_di[i] + minus_di[i] == 0:
-            dx[i] = 0
-        else:
-            dx[i] = 100 * abs(plus_di[i] - minus_di[i]) / (plus_di[i] + minus_di[i])
-    
-    # Average Directional Index (ADX)
-    adx = np.zeros_like(close_data)
-    
-    # 첫 번째 ADX
-    adx[period*2-1] = np.mean(dx[period:period*2])
-    
-    # 나머지 ADX
-    for i in range(period*2, length):
-        adx[i] = (adx[i-1] * (period-1) + dx[i]) / period
+    up_move = np.subtract(high_data[1:], high_data[:-1], out=_scratch(workspace, "adx_up_move", length - 1))
+    down_move = np.subtract(low_data[:-1], low_data[1:], out=_scratch(workspace, "adx_down_move", length - 1))
+    
+    plus_dm = _zeros(workspace, "adx_plus_dm", length)
+    minus_dm = _zeros(workspace, "adx_minus_dm", length)
+    np.copyto(plus_dm[1:], up_move, where=(up_move > down_move) & (up_move > 0))
+    np.copyto(minus_dm[1:], down_move, where=(down_move > up_move) & (down_move > 0))
+    
+    # Smoothed TR and DM (첫 번째 값은 기간 합계)
+    smoothed_tr = _zeros(workspace, "adx_smoothed_tr", length)
+    smoothed_plus_dm = _zeros(workspace, "adx_smoothed_plus_dm", length)
+    smoothed_minus_dm = _zeros(workspace, "adx_smoothed_minus_dm", length)
+    
+    _wilder_filter(tr, period, period, np.sum(tr[1:period+1]), smoothed_tr, kind="sum")
+    _wilder_filter(plus_dm, period, period, np.sum(plus_dm[1:period+1]), smoothed_plus_dm, kind="sum")
+    _wilder_filter(minus_dm, period, period, np.sum(minus_dm[1:period+1]), smoothed_minus_dm, kind="sum")
+    
+    # 결과 배열 (ADX, +DI, -DI)
+    adx, plus_di, minus_di = out if out is not None else (np.zeros(length), np.zeros(length), np.zeros(length))
+    
+    # Directional Indicators (DI, TR 평활값이 0이면 0)
+    plus_di.fill(0)
+    minus_di.fill(0)
+    
+    tr_tail = smoothed_tr[period:]
+    has_range = tr_tail != 0
+    np.multiply(100, smoothed_plus_dm[period:], out=plus_di[period:])
+    np.divide(plus_di[period:], tr_tail, out=plus_di[period:], where=has_range)
+    np.multiply(100, smoothed_minus_dm[period:], out=minus_di[period:])
+    np.divide(minus_di[period:], tr_tail, out=minus_di[period:], where=has_range)
+    plus_di[period:][~has_range] = 0
+    minus_di[period:][~has_range] = 0
+    
+    # Directional Index (DX, +DI와 -DI의 합이 0이면 0)
+    dx = _zeros(workspace, "adx_dx", length)
+    
+    di_sum = np.add(plus_di[period:], minus_di[period:], out=_scratch(workspace, "adx_di_sum", length - period))
+    di_diff = dx[period:]
+    np.subtract(plus_di[period:], minus_di[period:], out=di_diff)
+    np.abs(di_diff, out=di_diff)
+    di_diff *= 100
+    has_direction = di_sum != 0
+    np.divide(di_diff, di_sum, out=di_diff, where=has_direction)
+    di_diff[~has_direction] = 0
+    
+    # Average Directional Index (ADX, 첫 번째 값은 DX 평균)
+    adx.fill(0)
+    _wilder_filter(dx, period, period*2-1, np.mean(dx[period:period*2]), adx)
     
     # 기간 이전의 값은 NaN으로 설정
-    for i in range(period*2-1):
-        adx[i] = np.nan
+    adx[:period*2-1] = np.nan
+    plus_di[:period] = np.nan
+    minus_di[:period] = np.nan
+    
+    return {
+        "tr": tr,
+        "plus_dm": plus_dm,
+        "minus_dm": minus_dm,
+        "smoothed_tr": smoothed_tr,
+        "smoothed_plus_dm": smoothed_plus_dm,
+        "smoothed_minus_dm": smoothed_minus_dm,
+        "plus_di": plus_di,
+        "minus_di": minus_di,
+        "dx": dx,
+        "adx": adx
+    }
+
+def average_directional_index(high_data, low_data, close_data, period=14, out=None, dtype=None, workspace=None):
+    """
+    ADX (Average Directional Index) 계산
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        period (int): ADX 기간
+        out (tuple): 결과를 저장할 (ADX, +DI, -DI) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
-    for i in range(period):
-        plus_di[i] = np.nan
-        minus_di[i] = np.nan
+    Returns:
+        tuple: (ADX, +DI, -DI)
+    """
+    arrays = _prepare_output(len(close_data), 3, out, dtype)
     
-    return adx, plus_di, minus_di
+    if len(close_data) < period * 2:
+        return _empty_result(arrays)
+        
+    buffers = [_float64_buffer(array, workspace, f"adx_result_{i}") for i, array in enumerate(arrays)]
+    _adx_components(high_data, low_data, close_data, period, out=buffers, workspace=workspace)
+    
+    return tuple(_store(array, buffer) for array, buffer in zip(arrays, buffers))
 
-def parabolic_sar(high_data, low_data, close_data, af_start=0.02, af_increment=0.02, af_max=0.2):
+def _parabolic_sar_run(high_data, low_data, close_data, af_start, af_increment, af_max, out=None):
+    """
+    Parabolic SAR 계산 및 최종 상태 반환
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터 (길이 >= 2)
+        af_start (float): 초기 가속 계수
+        af_increment (float): 가속 계수 증가분
+        af_max (float): 최대 가속 계수
+        out (numpy.ndarray): SAR를 저장할 float64 배열 (None이면 새로 할당)
+        
+    Returns:
+        tuple: (SAR 데이터, 마지막 추세, 마지막 EP, 마지막 AF)
+    """
+    # Parabolic SAR
+    sar = np.zeros(len(close_data)) if out is None else out
+    
+    trend, ep, af = kernel("parabolic_sar")(
+        np.asarray(high_data, dtype=np.float64), np.asarray(low_data, dtype=np.float64),
+        af_start, af_increment, af_max, sar
+    )
+    
+    return sar, trend, ep, af
+
+def parabolic_sar(high_data, low_data, close_data, af_start=0.02, af_increment=0.02, af_max=0.2,
+                  out=None, dtype=None, workspace=None):
     """
     Parabolic SAR 계산
     
@@ -427,55 +774,395 @@ def parabolic_sar(high_data, low_data, close_data, af_start=0.02, af_increment=0
         af_start (float): 초기 가속 계수
         af_increment (float): 가속 계수 증가분
         af_max (float): 최대 가속 계수
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
         
     Returns:
         numpy.ndarray: Parabolic SAR 데이터
     """
+    (result,) = _prepare_output(len(close_data), 1, out, dtype)
+    
     if len(close_data) < 2:
-        return np.array([np.nan] * len(close_data))
+        return _empty_result([result])
         
-    # 데이터 길이
+    sar = _float64_buffer(result, workspace, "parabolic_sar")
+    _parabolic_sar_run(high_data, low_data, close_data, af_start, af_increment, af_max, out=sar)
+    
+    return _store(result, sar)
+
+def average_true_range(high_data, low_data, close_data, period=14, out=None, dtype=None, workspace=None):
+    """
+    ATR (Average True Range) 계산
+    
+    ADX와 같이 두 번째 봉부터의 True Range period개 평균으로 시작하고 이후 Wilder 평활합니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        period (int): ATR 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: ATR 데이터 (앞쪽 period개는 NaN)
+    """
     length = len(close_data)
+    (result,) = _prepare_output(length, 1, out, dtype)
     
-    # Parabolic SAR
-    sar = np.zeros_like(close_data)
-    
-    # 초기값 설정
-    trend = 1  # 1: 상승, -1: 하락
-    ep = high_data[0]  # Extreme Point
-    af = af_start  # Acceleration Factor
-    
-    # 첫 번째 SAR
-    sar[0] = low_data[0]
-    
-    for i in range(1, length):
-        # 이전 SAR
-        sar[i] = sar[i-1] + af * (ep - sar[i-1])
-        
-        # 추세 전환 확인
-        if trend == 1:  # 상승 추세
-            # SAR가 현재 또는 이전 저가보다 높으면 추세 전환
-            if sar[i] > low_data[i] or sar[i] > low_data[i-1]:
-                trend = -1
-                sar[i] = max(high_data[i], high_data[i-1])
-                ep = low_data[i]
-                af = af_start
-            else:
-                # 상승 추세 유지
-                if high_data[i] > ep:
-                    ep = high_data[i]
-                    af = min(af + af_increment, af_max)
-        else:  # 하락 추세
-            # SAR가 현재 또는 이전 고가보다 낮으면 추세 전환
-            if sar[i] < high_data[i] or sar[i] < high_data[i-1]:
-                trend = 1
-                sar[i] = min(low_data[i], low_data[i-1])
-                ep = high_data[i]
-                af = af_start
-            else:
-                # 하락 추세 유지
-                if low_data[i] < ep:
-                    ep = low_data[i]
-                    af = min(af + af_increment, af_max)
-    
-    return sar 
\ No newline at end of file
+    if length < period + 1:
+        return _empty_result([result])
+        
+    tr = true_range(high_data, low_data, close_data, out=_scratch(workspace, "atr_tr", length), workspace=workspace)
+    
+    atr = _float64_buffer(result, workspace, "atr")
+    _wilder_filter(tr, period, period, np.mean(tr[1:period+1]), atr)
+    atr[:period] = np.nan
+    
+    return _store(result, atr)
+
+def session_starts(date_data=None, time_data=None):
+    """
+    세션(거래일) 시작 봉 표시
+    
+    날짜가 바뀌는 봉을 새 세션의 시작으로 봅니다. 날짜 없이 시간만 주어지면
+    시간이 이전 봉보다 작거나 같아지는 봉(다음 날 장 시작)을 세션 시작으로 봅니다.
+    KiwoomChart의 분봉 데이터처럼 date는 "YYYYMMDD", time은 "HHMM" 문자열이어도 되고 숫자여도 됩니다.
+    
+    Args:
+        date_data (list or numpy.ndarray): 봉별 날짜 (과거 → 최근 순)
+        time_data (list or numpy.ndarray): 봉별 시간 (date_data가 없을 때만 사용)
+        
+    Returns:
+        numpy.ndarray: 세션 시작 봉이면 True인 bool 배열 (첫 봉은 항상 True)
+    """
+    if date_data is not None:
+        keys = np.asarray(date_data)
+        starts = np.empty(len(keys), dtype=bool)
+        np.not_equal(keys[1:], keys[:-1], out=starts[1:])
+    else:
+        keys = np.asarray(time_data).astype(np.float64)
+        starts = np.empty(len(keys), dtype=bool)
+        np.less_equal(keys[1:], keys[:-1], out=starts[1:])
+        
+    if len(starts):
+        starts[0] = True
+    return starts
+
+def vwap(high_data, low_data, close_data, volume_data, date_data=None, time_data=None, out=None, dtype=None, workspace=None):
+    """
+    VWAP (거래량 가중 평균 가격) 계산
+    
+    세션별 누적 (대표가 × 거래량) / 누적 거래량이며, 대표가는 (고가 + 저가 + 종가) / 3입니다.
+    date_data(또는 time_data)가 주어지면 세션이 바뀔 때마다 누적값을 초기화하고 (session_starts 참고),
+    없으면 전체 구간을 하나의 세션으로 봅니다.
+    원 단위 가격과 정수 거래량처럼 곱이 정수인 데이터는 int64 누적합으로 오차 없이 계산합니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        volume_data (numpy.ndarray): 거래량 데이터
+        date_data (list or numpy.ndarray): 봉별 날짜
+        time_data (list or numpy.ndarray): 봉별 시간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: VWAP 데이터 (세션 누적 거래량이 0인 봉은 NaN)
+    """
+    length = len(close_data)
+    (result,) = _prepare_output(length, 1, out, dtype)
+    
+    if length == 0:
+        return result
+        
+    volume_data = np.asarray(volume_data, dtype=np.float64)
+    
+    # 대표가 × 3 (나눗셈은 마지막에 한 번만 수행)
+    price = np.add(np.asarray(high_data, dtype=np.float64), low_data, out=_scratch(workspace, "vwap_price", length))
+    price += close_data
+    price_volume = np.multiply(price, volume_data, out=_scratch(workspace, "vwap_price_volume", length))
+    
+    if date_data is None and time_data is None:
+        starts = np.array([0])
+    else:
+        starts = np.flatnonzero(session_starts(date_data, time_data))
+        
+    price_volume_sum = _scratch(workspace, "vwap_price_volume_sum", length)
+    volume_sum = _scratch(workspace, "vwap_volume_sum", length)
+    _session_cumsum(price_volume, starts, price_volume_sum, workspace)
+    _session_cumsum(volume_data, starts, volume_sum, workspace)
+    
+    values = _float64_buffer(result, workspace, "vwap")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(price_volume_sum, volume_sum, out=values)
+    values /= 3
+    values[volume_sum == 0] = np.nan
+    
+    return _store(result, values)
+
+def _session_cumsum(values, starts, out, workspace=None):
+    """
+    세션별 누적합
+    
+    정수값 데이터(곱이 2^53 미만)는 전체 int64 누적합에서 세션 직전 누적합을 빼서 오차 없이 구하고,
+    실수 데이터는 세션마다 따로 누적하여 앞 세션의 큰 누적값에 의한 자릿수 손실을 피합니다.
+    두 방식 모두 세션 첫 봉부터 순서대로 더한 값과 같습니다.
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        starts (numpy.ndarray): 세션 시작 위치 (오름차순, 첫 값은 0)
+        out (numpy.ndarray): 결과를 저장할 float64 배열
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: out 배열
+    """
+    int_values = None
+    if len(values) and max(values.max(), -values.min()) < 2.0 ** 53:
+        int_values = _exact_int64(values, workspace)
+        
+    if int_values is None:
+        bounds = np.append(starts, len(values))
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            np.cumsum(values[start:stop], out=out[start:stop])
+        return out
+        
+    total = np.cumsum(int_values, out=_scratch(workspace, "session_cumsum", len(values), np.int64))
+    
+    # 봉별 세션 직전까지의 누적합 (세션 시작 위치에 증가분을 두고 누적)
+    before = np.zeros(len(starts), dtype=np.int64)
+    before[1:] = total[starts[1:] - 1]
+    offset = _scratch(workspace, "session_offset", len(values), np.int64)
+    offset.fill(0)
+    offset[starts[1:]] = np.diff(before)
+    np.cumsum(offset, out=offset)
+    
+    np.subtract(total, offset, out=total)
+    out[...] = total
+    return out
+
+def commodity_channel_index(high_data, low_data, close_data, period=20, out=None, dtype=None, workspace=None):
+    """
+    CCI (Commodity Channel Index) 계산
+    
+    CCI = (대표가 - 대표가 이동평균) / (0.015 × 평균 절대 편차), 대표가 = (고가 + 저가 + 종가) / 3
+    CCI는 대표가의 배율에 무관하므로 (고가 + 저가 + 종가)로 계산하여 원 단위 가격은 정수 누적합을 사용합니다.
+    평균 절대 편차가 0이면 0입니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        period (int): CCI 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: CCI 데이터 (앞쪽 period-1개는 NaN)
+    """
+    length = len(close_data)
+    (result,) = _prepare_output(length, 1, out, dtype)
+    
+    if length < period:
+        return _empty_result([result])
+        
+    price = np.add(np.asarray(high_data, dtype=np.float64), low_data, out=_scratch(workspace, "cci_price", length))
+    price += close_data
+    
+    mean = rolling_mean(price, period, _scratch(workspace, "cci_mean", length), workspace)
+    deviation = _mean_deviation(price, mean, period, _scratch(workspace, "cci_deviation", length), workspace)
+    
+    cci = _float64_buffer(result, workspace, "cci")
+    np.subtract(price, mean, out=cci)
+    has_deviation = deviation != 0
+    deviation *= 0.015
+    np.divide(cci, deviation, out=cci, where=has_deviation)
+    cci[~has_deviation] = 0
+    cci[:period-1] = np.nan
+    
+    return _store(result, cci)
+
+def _mean_deviation(values, mean, period, out, workspace=None, chunk_size=65536):
+    """
+    구간 평균 절대 편차 계산
+    
+    구간마다 기준이 되는 평균이 달라 누적합으로 분해할 수 없으므로,
+    구간 보기(sliding window view)를 chunk_size개 원소 단위로 나누어 계산하여 임시 메모리를 제한합니다.
+    
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        mean (numpy.ndarray): 구간 평균 (앞쪽 period-1개는 사용하지 않음)
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 float64 배열
+        workspace (Workspace): 임시 배열 저장소
+        chunk_size (int): 한 번에 처리할 최대 원소 수
+        
+    Returns:
+        numpy.ndarray: 평균 절대 편차 (앞쪽 period-1개는 NaN)
+    """
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    rows = max(chunk_size // period, 1)
+    buffer = _scratch(workspace, "mean_deviation_buffer", (min(rows, len(windows)), period))
+    
+    out[:period-1] = np.nan
+    for start in range(0, len(windows), rows):
+        stop = min(start + rows, len(windows))
+        chunk = buffer[:stop-start]
+        np.subtract(windows[start:stop], mean[start+period-1:stop+period-1, np.newaxis], out=chunk)
+        np.abs(chunk, out=chunk)
+        np.mean(chunk, axis=1, out=out[start+period-1:stop+period-1])
+        
+    return out
+
+def williams_r(high_data, low_data, close_data, period=14, out=None, dtype=None, workspace=None):
+    """
+    Williams %R 계산
+    
+    %R = (기간 최고가 - 종가) / (기간 최고가 - 기간 최저가) × -100 (범위 -100 ~ 0)
+    기간 최고가와 최저가가 같으면 스토캐스틱과 같이 중간값(-50)입니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        period (int): 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: Williams %R 데이터 (앞쪽 period-1개는 NaN)
+    """
+    length = len(close_data)
+    (result,) = _prepare_output(length, 1, out, dtype)
+    
+    if length < period:
+        return _empty_result([result])
+        
+    high_max = rolling_max(high_data, period, _scratch(workspace, "williams_high_max", length), workspace)
+    low_min = rolling_min(low_data, period, _scratch(workspace, "williams_low_min", length), workspace)
+    
+    return _williams_r_from_extrema(close_data, high_max, low_min, result, workspace)
+
+def _williams_r_from_extrema(close_data, high_max, low_min, out=None, workspace=None):
+    """
+    기간 최고가/최저가로 Williams %R 계산
+    
+    Args:
+        close_data (numpy.ndarray): 종가 데이터
+        high_max (numpy.ndarray): 기간 최고가
+        low_min (numpy.ndarray): 기간 최저가
+        out (numpy.ndarray): 결과를 저장할 배열
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: Williams %R 데이터
+    """
+    (result,) = _prepare_output(np.shape(close_data), 1, out, None)
+    
+    price_range = np.subtract(high_max, low_min, out=_scratch(workspace, "williams_range", np.shape(high_max)))
+    
+    williams = _float64_buffer(result, workspace, "williams")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.subtract(high_max, np.asarray(close_data, dtype=np.float64), out=williams)
+        np.multiply(-100, williams, out=williams)
+        np.divide(williams, price_range, out=williams)
+    williams[price_range == 0] = -50
+    
+    return _store(result, williams)
+
+def money_flow_index(high_data, low_data, close_data, volume_data, period=14, out=None, dtype=None, workspace=None):
+    """
+    MFI (Money Flow Index) 계산
+    
+    대표가가 직전 봉보다 오르면 양의 자금 흐름, 내리면 음의 자금 흐름으로 보고
+    MFI = 100 × 양의 흐름 합 / (양의 흐름 합 + 음의 흐름 합)을 계산합니다 (기간 내 흐름 합이 모두 0이면 50).
+    비율이므로 대표가 대신 (고가 + 저가 + 종가)를 사용하여 원 단위 가격은 정수 구간 합을 사용합니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        volume_data (numpy.ndarray): 거래량 데이터
+        period (int): MFI 기간
+        out (numpy.ndarray): 결과를 저장할 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        numpy.ndarray: MFI 데이터 (앞쪽 period개는 NaN)
+    """
+    length = len(close_data)
+    (result,) = _prepare_output(length, 1, out, dtype)
+    
+    if length < period + 1:
+        return _empty_result([result])
+        
+    price = np.add(np.asarray(high_data, dtype=np.float64), low_data, out=_scratch(workspace, "mfi_price", length))
+    price += close_data
+    money_flow = np.multiply(price, volume_data, out=_scratch(workspace, "mfi_money_flow", length))
+    
+    # 양/음의 자금 흐름 (첫 봉과 보합은 0)
+    change = np.subtract(price[1:], price[:-1], out=_scratch(workspace, "mfi_change", length - 1))
+    positive_flow = _zeros(workspace, "mfi_positive_flow", length)
+    negative_flow = _zeros(workspace, "mfi_negative_flow", length)
+    np.copyto(positive_flow[1:], money_flow[1:], where=change > 0)
+    np.copyto(negative_flow[1:], money_flow[1:], where=change < 0)
+    
+    positive_sum = rolling_sum(positive_flow, period, _scratch(workspace, "mfi_positive_sum", length), workspace)
+    total_sum = rolling_sum(negative_flow, period, _scratch(workspace, "mfi_total_sum", length), workspace)
+    total_sum += positive_sum
+    
+    mfi = _float64_buffer(result, workspace, "mfi")
+    np.multiply(100, positive_sum, out=mfi)
+    has_flow = total_sum != 0
+    np.divide(mfi, total_sum, out=mfi, where=has_flow)
+    mfi[~has_flow] = 50
+    mfi[:period] = np.nan
+    
+    return _store(result, mfi)
+
+def keltner_channels(high_data, low_data, close_data, ema_period=20, atr_period=10, multiplier=2,
+                     out=None, dtype=None, workspace=None):
+    """
+    켈트너 채널 계산
+    
+    중간선은 종가 EMA, 상단/하단선은 중간선 ± multiplier × ATR입니다.
+    
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        ema_period (int): 중간선 EMA 기간
+        atr_period (int): ATR 기간
+        multiplier (float): ATR 배수
+        out (tuple): 결과를 저장할 (중간선, 상단선, 하단선) 배열
+        dtype: 결과 자료형
+        workspace (Workspace): 임시 배열 저장소
+        
+    Returns:
+        tuple: (중간선, 상단선, 하단선)
+    """
+    length = len(close_data)
+    arrays = _prepare_output(length, 3, out, dtype)
+    
+    if length < max(ema_period, atr_period + 1):
+        return _empty_result(arrays)
+        
+    middle_out, upper, lower = arrays
+    middle = exponential_moving_average(close_data, ema_period, _float64_buffer(middle_out, workspace, "keltner_middle"),
+                                        workspace=workspace)
+    atr = average_true_range(high_data, low_data, close_data, atr_period, _scratch(workspace, "keltner_atr", length),
+                             workspace=workspace)
+    atr *= multiplier
+    
+    np.add(middle, atr, out=upper)
+    np.subtract(middle, atr, out=lower)
+    
+    return _store(middle_out, middle), upper, lower
@@ -0,0 +1,424 @@
+"""
+지표 계산 계획(planner) 모듈
+
+여러 지표를 동시에 계산할 때 공통 중간값을 한 번만 계산하도록 계산 그래프를 구성합니다.
+예를 들어 MACD(12, 26, 9)와 EMA(12)를 함께 요청하면 EMA(12)는 한 번만 계산되고,
+볼린저밴드(20)와 이동평균(20)은 같은 이동 평균/분산 계산을 공유합니다.
+같은 가격 데이터에 대한 여러 이동평균은 moving_average_bank 한 번으로 묶어 계산합니다.
+
+사용 예:
+    plan = IndicatorPlan()
+    plan.add("rsi", period=14)
+    plan.add("macd")
+    plan.add("bollinger_bands", name="bb", period=20)
+    results = plan.evaluate(chart_data)
+    results["bb.upper"], results["macd.signal"], results["rsi"]
+"""
+
+import numpy as np
+
+from . import indicators
+from .rolling import rolling_mean, rolling_mean_bank, rolling_mean_var, rolling_max, rolling_min
+
+# 지표별 기본 파라미터와 출력 이름 (analysis.indicators 함수와 동일)
+INDICATOR_SPECS = {
+    "moving_average": {"params": {"period": 20, "column": "close"}, "outputs": None},
+    "exponential_moving_average": {"params": {"period": 20, "column": "close"}, "outputs": None},
+    "bollinger_bands": {"params": {"period": 20, "std_dev": 2, "column": "close"}, "outputs": ("middle", "upper", "lower")},
+    "macd": {"params": {"fast_period": 12, "slow_period": 26, "signal_period": 9, "column": "close"}, "outputs": ("line", "signal", "histogram")},
+    "rsi": {"params": {"period": 14, "column": "close"}, "outputs": None},
+    "stochastic": {"params": {"k_period": 14, "d_period": 3}, "outputs": ("k", "d")},
+    "ichimoku_cloud": {
+        "params": {"tenkan_period": 9, "kijun_period": 26, "senkou_span_b_period": 52, "displacement": 26},
+        "outputs": ("tenkan", "kijun", "senkou_a", "senkou_b", "chikou")
+    },
+    "on_balance_volume": {"params": {}, "outputs": None},
+    "average_directional_index": {"params": {"period": 14}, "outputs": ("adx", "plus_di", "minus_di")},
+    "parabolic_sar": {"params": {"af_start": 0.02, "af_increment": 0.02, "af_max": 0.2}, "outputs": None},
+    "average_true_range": {"params": {"period": 14}, "outputs": None},
+    "vwap": {"params": {"session_column": "date"}, "outputs": None},
+    "commodity_channel_index": {"params": {"period": 20}, "outputs": None},
+    "williams_r": {"params": {"period": 14}, "outputs": None},
+    "money_flow_index": {"params": {"period": 14}, "outputs": None},
+    "keltner_channels": {"params": {"ema_period": 20, "atr_period": 10, "multiplier": 2}, "outputs": ("middle", "upper", "lower")},
+}
+
+def _source(column):
+    """원본 데이터 노드 키"""
+    return ("source", column)
+
+def _indicator_node(indicator, params):
+    """
+    지표 출력 노드 키 생성
+
+    Args:
+        indicator (str): 지표 이름
+        params (dict): 파라미터
+
+    Returns:
+        tuple: 노드 키
+    """
+    if indicator == "moving_average":
+        return ("sma", params["column"], params["period"])
+    if indicator == "exponential_moving_average":
+        return ("ema", params["column"], params["period"])
+    return (indicator,) + tuple(sorted(params.items()))
+
+def _node_definition(key):
+    """
+    노드의 계산 함수와 의존 노드 반환
+
+    Args:
+        key (tuple): 노드 키
+
+    Returns:
+        tuple: (계산 함수, 의존 노드 키 목록)
+    """
+    kind = key[0]
+
+    # 공통 중간값
+    if kind == "sma":
+        _, column, period = key
+        return (lambda data: rolling_mean(data, period)), [_source(column)]
+    if kind == "sma_bank":
+        _, column, periods = key
+        return (lambda data: rolling_mean_bank(data, periods)), [_source(column)]
+    if kind == "bank_row":
+        _, bank_key, row = key
+        return (lambda bank: bank[row]), [bank_key]
+    if kind == "mean_var":
+        _, column, period = key
+        return (lambda data: rolling_mean_var(data, period)), [_source(column)]
+    if kind == "mean_of":
+        _, column, period = key
+        return (lambda mean_var: mean_var[0]), [("mean_var", column, period)]
+    if kind == "ema":
+        _, column, period = key
+        return (lambda data: indicators.exponential_moving_average(data, period)), [_source(column)]
+    if kind == "rolling_max":
+        _, column, period = key
+        return (lambda data: rolling_max(data, period)), [_source(column)]
+    if kind == "rolling_min":
+        _, column, period = key
+        return (lambda data: rolling_min(data, period)), [_source(column)]
+    if kind == "true_range":
+        return indicators.true_range, [_source("high"), _source("low"), _source("close")]
+
+    # 지표
+    params = dict(key[1:])
+
+    if kind == "bollinger_bands":
+        column, period, std_dev = params["column"], params["period"], params["std_dev"]
+
+        def compute(data, mean_var):
+            if len(data) < period:
+                empty = np.full(len(data), np.nan)
+                return empty, empty, empty
+            return indicators._bollinger_from_mean_var(mean_var[0], mean_var[1], std_dev)
+
+        return compute, [_source(column), ("mean_var", column, period)]
+
+    if kind == "macd":
+        column = params["column"]
+        fast_period, slow_period, signal_period = params["fast_period"], params["slow_period"], params["signal_period"]
+
+        def compute(data, fast_ema, slow_ema):
+            if len(data) < slow_period + signal_period:
+                empty = np.full(len(data), np.nan)
+                return empty, empty, empty
+            return indicators._macd_from_ema(fast_ema, slow_ema, fast_period, slow_period, signal_period)
+
+        return compute, [_source(column), ("ema", column, fast_period), ("ema", column, slow_period)]
+
+    if kind == "rsi":
+        return (lambda data: indicators.rsi(data, params["period"])), [_source(params["column"])]
+
+    if kind == "stochastic":
+        k_period, d_period = params["k_period"], params["d_period"]
+
+        def compute(close_data, high_max, low_min):
+            if len(close_data) < k_period + d_period:
+                empty = np.full(len(close_data), np.nan)
+                return empty, empty
+            return indicators._stochastic_from_extrema(close_data, high_max, low_min, d_period)
+
+        return compute, [_source("close"), ("rolling_max", "high", k_period), ("rolling_min", "low", k_period)]
+
+    if kind == "ichimoku_cloud":
+        periods = (params["tenkan_period"], params["kijun_period"], params["senkou_span_b_period"])
+        displacement = params["displacement"]
+        unique_periods = sorted(set(periods))
+
+        def compute(close_data, *extrema_values):
+            if len(close_data) < max(periods) + displacement:
+                empty = np.full(len(close_data), np.nan)
+                return empty, empty, empty, empty, empty
+            extrema = {
+                period: (extrema_values[2*i], extrema_values[2*i+1])
+                for i, period in enumerate(unique_periods)
+            }
+            return indicators._ichimoku_from_extrema(close_data, extrema, *periods, displacement)
+
+        deps = [_source("close")]
+        for period in unique_periods:
+            deps += [("rolling_max", "high", period), ("rolling_min", "low", period)]
+        return compute, deps
+
+    if kind == "on_balance_volume":
+        return indicators.on_balance_volume, [_source("close"), _source("volume")]
+
+    if kind == "average_directional_index":
+        period = params["period"]
+
+        def compute(high_data, low_data, close_data, tr):
+            if len(close_data) < period * 2:
+                empty = np.full(len(close_data), np.nan)
+                return empty, empty, empty
+            components = indicators._adx_components(high_data, low_data, close_data, period, tr=tr)
+            return components["adx"], components["plus_di"], components["minus_di"]
+
+        return compute, [_source("high"), _source("low"), _source("close"), ("true_range",)]
+
+    if kind == "parabolic_sar":
+        return (lambda high_data, low_data, close_data: indicators.parabolic_sar(high_data, low_data, close_data, **params)), \
+            [_source("high"), _source("low"), _source("close")]
+
+    if kind == "average_true_range":
+        period = params["period"]
+        return (lambda tr: _average_true_range_from_tr(tr, period)), [("true_range",)]
+
+    if kind == "vwap":
+        column = params["session_column"]
+        if column is None:
+            return indicators.vwap, [_source("high"), _source("low"), _source("close"), _source("volume")]
+        return (lambda high_data, low_data, close_data, volume_data, date_data:
+                indicators.vwap(high_data, low_data, close_data, volume_data, date_data)), \
+            [_source("high"), _source("low"), _source("close"), _source("volume"), _source(column)]
+
+    if kind == "commodity_channel_index":
+        return (lambda high_data, low_data, close_data:
+                indicators.commodity_channel_index(high_data, low_data, close_data, params["period"])), \
+            [_source("high"), _source("low"), _source("close")]
+
+    if kind == "williams_r":
+        period = params["period"]
+
+        def compute(close_data, high_max, low_min):
+            if len(close_data) < period:
+                return np.full(len(close_data), np.nan)
+            return indicators._williams_r_from_extrema(close_data, high_max, low_min)
+
+        return compute, [_source("close"), ("rolling_max", "high", period), ("rolling_min", "low", period)]
+
+    if kind == "money_flow_index":
+        return (lambda high_data, low_data, close_data, volume_data:
+                indicators.money_flow_index(high_data, low_data, close_data, volume_data, params["period"])), \
+            [_source("high"), _source("low"), _source("close"), _source("volume")]
+
+    if kind == "keltner_channels":
+        ema_period, atr_period, multiplier = params["ema_period"], params["atr_period"], params["multiplier"]
+
+        def compute(close_data, middle, tr):
+            if len(close_data) < max(ema_period, atr_period + 1):
+                empty = np.full(len(close_data), np.nan)
+                return empty, empty, empty
+            band = _average_true_range_from_tr(tr, atr_period) * multiplier
+            return middle, middle + band, middle - band
+
+        return compute, [_source("close"), ("ema", "close", ema_period), ("true_range",)]
+
+    raise ValueError(f"알 수 없는 노드입니다: {key}")
+
+def _average_true_range_from_tr(tr, period):
+    """
+    True Range로 ATR 계산 (average_true_range()와 같은 값)
+
+    Args:
+        tr (numpy.ndarray): True Range
+        period (int): ATR 기간
+
+    Returns:
+        numpy.ndarray: ATR 데이터
+    """
+    atr = np.full(len(tr), np.nan)
+    if len(tr) < period + 1:
+        return atr
+    return indicators._wilder_filter(tr, period, period, np.mean(tr[1:period+1]), atr)
+
+class IndicatorPlan:
+    """
+    지표 계산 계획 클래스
+
+    요청된 지표들의 의존 관계를 하나의 그래프로 합쳐 공통 중간값을 한 번만 계산하고,
+    필요한 노드만 의존 순서대로 계산합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self.requests = []   # (이름, 지표, 파라미터)
+        self._order = None   # 계산 순서 (노드 키 목록)
+        self._definitions = {}
+
+    def add(self, indicator, name=None, **params):
+        """
+        지표 요청 추가
+
+        Args:
+            indicator (str): analysis.indicators의 지표 함수 이름
+            name (str): 결과 이름 (None이면 지표 이름과 파라미터로 생성)
+            **params: 지표 파라미터 (생략 시 기본값)
+
+        Returns:
+            str: 결과 이름
+        """
+        if indicator not in INDICATOR_SPECS:
+            raise ValueError(f"지원하지 않는 지표입니다: {indicator}")
+
+        defaults = INDICATOR_SPECS[indicator]["params"]
+        unknown = set(params) - set(defaults)
+        if unknown:
+            raise ValueError(f"{indicator}에 없는 파라미터입니다: {sorted(unknown)}")
+
+        full_params = dict(defaults, **params)
+        if name is None:
+            values = [str(value) for key, value in full_params.items() if key != "column" or value != "close"]
+            name = f"{indicator}({','.join(values)})" if values else indicator
+
+        self.requests.append((name, indicator, full_params))
+        self._order = None
+        return name
+
+    def _collect(self):
+        """요청된 지표에서 도달 가능한 노드와 정의 수집"""
+        definitions = {}
+        stack = [_indicator_node(indicator, params) for _, indicator, params in self.requests]
+
+        while stack:
+            key = stack.pop()
+            if key in definitions or key[0] == "source":
+                continue
+            definitions[key] = _node_definition(key)
+            stack.extend(definitions[key][1])
+
+        return definitions
+
+    def _fuse(self, definitions):
+        """
+        중간값 통합
+
+        - 이동평균(sma)과 같은 기간의 이동 평균/분산 노드가 있으면 평균을 재사용
+        - 같은 데이터에 대한 나머지 이동평균들은 하나의 moving_average_bank로 계산
+        """
+        banks = {}
+        for key in list(definitions):
+            if key[0] != "sma":
+                continue
+            _, column, period = key
+            if ("mean_var", column, period) in definitions:
+                definitions[key] = _node_definition(("mean_of", column, period))
+            else:
+                banks.setdefault(column, []).append(period)
+
+        for column, periods in banks.items():
+            if len(periods) < 2:
+                continue
+            bank_key = ("sma_bank", column, tuple(sorted(periods)))
+            definitions[bank_key] = _node_definition(bank_key)
+            for row, period in enumerate(bank_key[2]):
+                definitions[("sma", column, period)] = _node_definition(("bank_row", bank_key, row))
+
+        return definitions
+
+    def build(self):
+        """
+        계산 그래프 구성
+
+        Returns:
+            list: 의존 순서로 정렬된 노드 키 목록
+        """
+        definitions = self._fuse(self._collect())
+
+        # 의존 순서 정렬 (깊이 우선 탐색)
+        order = []
+        visited = set()
+
+        def visit(key):
+            if key in visited or key[0] == "source":
+                return
+            visited.add(key)
+            for dep in definitions[key][1]:
+                visit(dep)
+            order.append(key)
+
+        for _, indicator, params in self.requests:
+            visit(_indicator_node(indicator, params))
+
+        self._definitions = definitions
+        self._order = order
+        return order
+
+    @property
+    def node_count(self):
+        """계산할 노드 수"""
+        if self._order is None:
+            self.build()
+        return len(self._order)
+
+    def evaluate(self, data):
+        """
+        지표 계산
+
+        Args:
+            data (dict): 차트 데이터 (open, high, low, close, volume 등 컬럼별 배열)
+
+        Returns:
+            dict: {결과 이름: 배열}. 여러 출력을 갖는 지표는 "이름.출력" 형식
+        """
+        if self._order is None:
+            self.build()
+
+        values = {}
+
+        def lookup(key):
+            if key[0] == "source":
+                if key not in values:
+                    values[key] = np.asarray(data[key[1]], dtype=np.float64)
+                return values[key]
+            return values[key]
+
+        for key in self._order:
+            function, deps = self._definitions[key]
+            values[key] = function(*[lookup(dep) for dep in deps])
+
+        results = {}
+        for name, indicator, params in self.requests:
+            output = values[_indicator_node(indicator, params)]
+            parts = INDICATOR_SPECS[indicator]["outputs"]
+            if parts is None:
+                results[name] = output
+            else:
+                for part, array in zip(parts, output):
+                    results[f"{name}.{part}"] = array
+
+        return results
+
+def compute_indicators(data, requests):
+    """
+    여러 지표를 한 번에 계산
+
+    Args:
+        data (dict): 차트 데이터 (컬럼별 배열)
+        requests (list): [(지표 이름, 파라미터 dict)] 또는 [(결과 이름, 지표 이름, 파라미터 dict)]
+
+    Returns:
+        dict: {결과 이름: 배열}
+    """
+    plan = IndicatorPlan()
+    for request in requests:
+        if len(request) == 3:
+            name, indicator, params = request
+            plan.add(indicator, name=name, **params)
+        else:
+            indicator, params = request
+            plan.add(indicator, **params)
+    return plan.evaluate(data)
@@ -0,0 +1,920 @@
+"""
+롤링 윈도우 계산 모듈
+
+이 모듈은 기술적 지표에서 공통으로 사용하는 이동 구간(rolling window) 계산 커널을 제공합니다.
+누적합(cumulative sum)과 블록 분할을 이용해 구간 길이와 무관하게 O(n)으로 계산하며,
+기존 지표 함수와 동일하게 앞쪽 (period - 1)개 값은 NaN으로 채웁니다.
+모든 커널은 (종목 × 봉) 형태의 2차원 배열도 마지막 축을 따라 계산합니다.
+
+결과를 저장할 out 배열과 임시 배열을 재사용하는 Workspace를 전달하면
+반복 계산 시 메모리 할당을 줄일 수 있습니다.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+
+import numpy as np
+
+from .backend import kernel, window_statistic
+
+def _as_float_array(data):
+    """
+    입력 데이터를 float64 배열로 변환
+
+    Args:
+        data (array-like): 가격 데이터
+
+    Returns:
+        numpy.ndarray: float64 배열
+    """
+    return np.asarray(data, dtype=np.float64)
+
+class Workspace:
+    """
+    임시 배열 재사용 클래스
+
+    계산 중 필요한 임시 배열을 이름별로 보관하여 다음 계산에서 재사용합니다.
+    여러 종목을 반복해서 계산할 때 같은 Workspace를 전달하면 호출마다 임시 배열을
+    새로 할당하지 않습니다. 스레드 간에 공유하지 마십시오.
+    """
+
+    max_memo = 64  # 보관할 구간 인덱스 최대 개수
+
+    def __init__(self):
+        """초기화"""
+        self._buffers = {}
+        self._memo = {}
+
+    def get(self, name, shape, dtype=np.float64):
+        """
+        임시 배열 조회 (크기가 부족하면 새로 할당)
+
+        Args:
+            name (str): 배열 이름
+            shape (int or tuple): 배열 형태
+            dtype: 자료형
+
+        Returns:
+            numpy.ndarray: 초기화되지 않은 배열
+        """
+        shape = (int(shape),) if np.ndim(shape) == 0 else tuple(int(size) for size in shape)
+        size = int(np.prod(shape, dtype=np.int64))
+        dtype = np.dtype(dtype)
+
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.dtype != dtype or buffer.size < size:
+            buffer = np.empty(max(size, 1), dtype=dtype)
+            self._buffers[name] = buffer
+
+        return buffer[:size].reshape(shape)
+
+    def memo(self, key, build):
+        """
+        형태에만 의존하는 값 (구간 인덱스 등) 재사용
+
+        Args:
+            key (tuple): 값 식별 키
+            build (callable): 값이 없을 때 생성하는 함수
+
+        Returns:
+            생성되었거나 보관 중인 값
+        """
+        value = self._memo.get(key)
+        if value is None:
+            # 길이가 다양한 데이터를 계산할 때 무한히 늘어나지 않도록 제한
+            if len(self._memo) >= self.max_memo:
+                self._memo.clear()
+            value = build()
+            self._memo[key] = value
+        return value
+
+    def clear(self):
+        """보관 중인 임시 배열 해제"""
+        self._buffers.clear()
+        self._memo.clear()
+
+    @property
+    def nbytes(self):
+        """보관 중인 임시 배열의 바이트 크기 합"""
+        memo_bytes = sum(
+            array.nbytes for value in self._memo.values() for array in value.values() if isinstance(array, np.ndarray)
+        )
+        return sum(buffer.nbytes for buffer in self._buffers.values()) + memo_bytes
+
+def _scratch(workspace, name, shape, dtype=np.float64):
+    """
+    임시 배열 준비
+
+    Args:
+        workspace (Workspace): 임시 배열 저장소 (None이면 새로 할당)
+        name (str): 배열 이름
+        shape (int or tuple): 배열 형태
+        dtype: 자료형
+
+    Returns:
+        numpy.ndarray: 초기화되지 않은 배열
+    """
+    if workspace is None:
+        return np.empty(shape, dtype=dtype)
+    return workspace.get(name, shape, dtype)
+
+def _result_array(shape, out):
+    """
+    결과 배열 준비
+
+    Args:
+        shape (tuple): 결과 형태
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 float64로 새로 할당)
+
+    Returns:
+        numpy.ndarray: 결과 배열
+    """
+    if out is None:
+        return np.empty(shape)
+    if out.shape != tuple(shape):
+        raise ValueError(f"out 배열의 형태가 맞지 않습니다: {out.shape} != {tuple(shape)}")
+    return out
+
+def _window_has_nan(nan_mask, period, workspace=None):
+    """
+    구간별 NaN 포함 여부 계산 (마지막 축 기준)
+
+    Args:
+        nan_mask (numpy.ndarray): NaN 위치 마스크
+        period (int): 구간 길이
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 각 완성 구간(길이 len-period+1)의 NaN 포함 여부
+    """
+    shape = nan_mask.shape[:-1] + (nan_mask.shape[-1] + 1,)
+    nan_count = _scratch(workspace, "nan_count", shape, np.int64)
+    nan_count[..., 0] = 0
+    np.cumsum(nan_mask, axis=-1, out=nan_count[..., 1:])
+
+    window_count = _scratch(workspace, "nan_window_count", shape[:-1] + (shape[-1] - period,), np.int64)
+    np.subtract(nan_count[..., period:], nan_count[..., :-period], out=window_count)
+    return np.greater(window_count, 0, out=_scratch(workspace, "nan_window", window_count.shape, np.bool_))
+
+def _exact_int64(values, workspace=None):
+    """
+    정수값 데이터를 int64로 변환
+
+    정수형 배열이거나, 모든 값이 정수인 실수 배열(원 단위 가격 등)이면서
+    누적합이 int64 범위를 넘지 않는 경우 int64 배열을 반환합니다.
+
+    Args:
+        values (numpy.ndarray): 입력 데이터
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: int64 배열 (정수값 데이터가 아니면 None)
+    """
+    if np.issubdtype(values.dtype, np.integer) or values.dtype == np.bool_:
+        return values.astype(np.int64, copy=False)
+
+    if values.size == 0 or not np.issubdtype(values.dtype, np.floating):
+        return None
+
+    rounded = np.rint(values, out=_scratch(workspace, "exact_rounded", values.shape, values.dtype))
+    with np.errstate(invalid='ignore'):
+        if not np.equal(values, rounded, out=_scratch(workspace, "exact_equal", values.shape, np.bool_)).all():
+            return None
+    if np.abs(values, out=rounded).max() * values.shape[-1] >= 2.0 ** 62:
+        return None
+
+    int_values = _scratch(workspace, "exact_int64", values.shape, np.int64)
+    int_values[...] = values
+    return int_values
+
+def _block_cumsums(values, block_size, squares=False, workspace=None):
+    """
+    블록 단위 편차 누적합 계산 (마지막 축 기준)
+
+    데이터를 block_size 크기의 블록으로 나누고, 각 블록의 평균을 기준값으로 뺀
+    편차의 블록 내 전방/후방 누적합을 구합니다. 한 번 계산한 결과로
+    block_size 이하의 모든 구간 길이에 대한 구간 합을 얻을 수 있습니다.
+
+    Args:
+        values (numpy.ndarray): float64 입력 데이터
+        block_size (int): 블록 크기
+        squares (bool): 편차 제곱의 누적합도 계산할지 여부
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        dict: 블록 기준값과 전방/후방 누적합
+    """
+    lead_shape = values.shape[:-1]
+    length = values.shape[-1]
+    rows = values.reshape(-1, length)
+    row_count = rows.shape[0]
+    block_count = -(-length // block_size)
+
+    padded = _scratch(workspace, "block_padded", (row_count, block_count * block_size))
+    padded[:, :length] = rows
+    padded[:, length:] = np.nan
+    blocks = padded.reshape(row_count, block_count, block_size)
+
+    # 블록 기준값 (유효값 평균)
+    missing = np.isnan(blocks, out=_scratch(workspace, "block_missing", blocks.shape, np.bool_))
+    finite_count = block_size - missing.sum(axis=2)
+    deviation = _scratch(workspace, "block_deviation", blocks.shape)
+    np.copyto(deviation, blocks)
+    np.copyto(deviation, 0.0, where=missing)
+    block_sum = deviation.sum(axis=2)
+    refs = np.zeros((row_count, block_count))
+    np.divide(block_sum, finite_count, out=refs, where=finite_count > 0)
+
+    np.subtract(blocks, refs[:, :, None], out=deviation)
+    np.copyto(deviation, 0.0, where=missing)
+
+    def prefix_suffix(block_values, name):
+        prefix = _scratch(workspace, f"block_prefix{name}", blocks.shape)
+        suffix = _scratch(workspace, f"block_suffix{name}", blocks.shape)
+        np.cumsum(block_values, axis=2, out=prefix)
+        np.cumsum(block_values[:, :, ::-1], axis=2, out=suffix[:, :, ::-1])
+        return prefix.reshape(row_count, -1), suffix.reshape(row_count, -1)
+
+    sums = {
+        "lead_shape": lead_shape,
+        "length": length,
+        "block_size": block_size,
+        "refs": refs,
+        "workspace": workspace,
+    }
+    sums["prefix1"], sums["suffix1"] = prefix_suffix(deviation, 1)
+
+    if squares:
+        deviation *= deviation
+        sums["prefix2"], sums["suffix2"] = prefix_suffix(deviation, 2)
+
+    return sums
+
+def _window_moments(sums, period):
+    """
+    블록 누적합으로부터 구간 모멘트 계산
+
+    길이 period(<= 블록 크기)인 구간은 한 블록 안에 있거나 인접한 두 블록에 걸칩니다.
+    한 블록 안이면 전방 누적합의 차로, 두 블록에 걸치면
+    (앞 블록의 후방 누적합 + 뒤 블록의 전방 누적합)으로 구간 합을 얻습니다.
+    누적 길이가 블록 크기를 넘지 않고 편차가 구간 근처 값 기준이므로,
+    전체 누적합 방식과 달리 시계열이 길거나 가격대가 커도 오차가 쌓이지 않습니다.
+
+    Args:
+        sums (dict): _block_cumsums() 결과
+        period (int): 구간 길이
+
+    Returns:
+        tuple: (기준값, 편차 합, 편차 제곱합 또는 None) - 각 완성 구간별 배열
+    """
+    length = sums["length"]
+    block_size = sums["block_size"]
+    refs = sums["refs"]
+    workspace = sums["workspace"]
+
+    # 구간 i는 [i, i + period - 1]이므로 시작/끝/직전 위치는 모두 연속 구간 슬라이스입니다.
+    # 블록 경계 여부만 형태에 의존하는 마스크로 보관합니다.
+    if workspace is None:
+        index = _window_index(length, period, block_size)
+    else:
+        index = workspace.memo(("window_index", length, period, block_size),
+                               lambda: _window_index(length, period, block_size))
+    count = length - period + 1
+    rows = refs.shape[0]
+    shape = (rows, count)
+
+    def scratch(name):
+        return _scratch(workspace, f"moment_{name}", shape)
+
+    # 위치별 블록 기준값 (구간 머리/꼬리 위치의 기준값이 곧 슬라이스)
+    position_refs = _scratch(workspace, "moment_position_refs", (rows, refs.shape[1], block_size))
+    position_refs[...] = refs[:, :, np.newaxis]
+    position_refs = position_refs.reshape(rows, -1)
+    ref_head = scratch("ref_head")
+    np.copyto(ref_head, position_refs[:, :count])
+    delta = np.subtract(position_refs[:, period - 1:length], ref_head, out=scratch("delta"))
+
+    def window_sum(prefix, suffix, name):
+        # 같은 블록: prefix[끝] - prefix[시작 - 1], 두 블록: suffix[시작] + prefix[끝]
+        end_sum = prefix[:, period - 1:length]
+        result = scratch(name)
+        result[:, 0] = 0.0
+        result[:, 1:] = prefix[:, :count - 1]
+        np.copyto(result, 0.0, where=index["no_before"])
+        np.subtract(end_sum, result, out=result)
+        crossing_sum = np.add(suffix[:, :count], end_sum, out=scratch("crossing_sum"))
+        np.copyto(result, crossing_sum, where=index["crossing"])
+        return result, end_sum
+
+    sum1, end_sum1 = window_sum(sums["prefix1"], sums["suffix1"], "sum1")
+
+    # 두 번째 블록의 편차를 첫 번째 블록 기준값으로 이동
+    shift = np.multiply(index["tail_count"], delta, out=scratch("shift"))
+    sum1 += shift
+
+    out_shape = sums["lead_shape"] + (count,)
+    if "prefix2" not in sums:
+        return ref_head.reshape(out_shape), sum1.reshape(out_shape), None
+
+    tail1 = scratch("tail1")
+    np.copyto(tail1, end_sum1)
+    np.copyto(tail1, 0.0, where=index["same_block"])
+
+    sum2, _ = window_sum(sums["prefix2"], sums["suffix2"], "sum2")
+    cross_term = np.multiply(2, delta, out=scratch("cross_term"))
+    cross_term *= tail1
+    sum2 += cross_term
+    shift *= delta
+    sum2 += shift
+
+    return ref_head.reshape(out_shape), sum1.reshape(out_shape), sum2.reshape(out_shape)
+
+def _window_index(length, period, block_size):
+    """
+    블록 구간 합 계산용 마스크
+
+    Args:
+        length (int): 데이터 길이
+        period (int): 구간 길이
+        block_size (int): 블록 크기
+
+    Returns:
+        dict: 두 블록 걸침 여부, 직전 누적합 사용 여부, 두 번째 블록 원소 수
+    """
+    offset = np.arange(length - period + 1) % block_size
+    crossing = offset + period > block_size
+    tail_count = np.where(crossing, offset + period - block_size, 0).astype(np.float64)
+
+    return {
+        "crossing": crossing,
+        "same_block": ~crossing,
+        "no_before": crossing | (offset == 0),
+        "tail_count": tail_count,
+    }
+
+def _block_window_moments(values, period, squares=False, workspace=None):
+    """
+    블록 단위 누적합을 이용한 구간 모멘트 계산 (블록 크기 = period)
+
+    Args:
+        values (numpy.ndarray): float64 입력 데이터 (마지막 축 길이 >= period)
+        period (int): 구간 길이
+        squares (bool): 편차 제곱합도 계산할지 여부
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        tuple: (기준값, 편차 합, 편차 제곱합 또는 None) - 각 완성 구간별 배열
+    """
+    return _window_moments(_block_cumsums(values, period, squares, workspace), period)
+
+def rolling_sum(data, period, out=None, workspace=None):
+    """
+    이동 구간 합계 계산
+
+    구간 안에 NaN이 하나라도 있으면 해당 위치의 결과는 NaN입니다.
+    정수값 데이터는 int64 누적합으로 오차 없이 계산하고, 실수 데이터는
+    블록 기준값을 뺀 편차의 블록 내 누적합으로 계산하여 큰 가격대에서의 자릿수 손실을 줄입니다.
+    2차원 이상의 배열은 마지막 축(봉 방향)을 따라 계산합니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 구간 합계 (앞쪽 period-1개는 NaN)
+    """
+    values = np.asarray(data)
+    length = values.shape[-1]
+    result = _result_array(values.shape, out)
+
+    if period < 1 or length < period:
+        result.fill(np.nan)
+        return result
+
+    result[..., :period-1] = np.nan
+
+    # 정수값 데이터: 정확한 누적합
+    int_values = _exact_int64(values, workspace)
+    if int_values is not None:
+        csum = _scratch(workspace, "rolling_sum_csum", values.shape[:-1] + (length + 1,), np.int64)
+        csum[..., 0] = 0
+        np.cumsum(int_values, axis=-1, out=csum[..., 1:])
+        np.subtract(csum[..., period:], csum[..., :-period], out=result[..., period-1:])
+        return result
+
+    values = _as_float_array(values)
+    ref, sum1, _ = _block_window_moments(values, period, workspace=workspace)
+    ref *= period
+    np.add(sum1, ref, out=result[..., period-1:])
+
+    # NaN이 포함된 구간은 NaN 처리
+    nan_mask = np.isnan(values, out=_scratch(workspace, "nan_mask", values.shape, np.bool_))
+    if nan_mask.any():
+        result[..., period-1:][_window_has_nan(nan_mask, period, workspace)] = np.nan
+
+    return result
+
+def rolling_mean(data, period, out=None, workspace=None):
+    """
+    이동 구간 평균 계산 (단순 이동평균)
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 구간 평균 (앞쪽 period-1개는 NaN)
+    """
+    result = rolling_sum(data, period, out, workspace)
+    result /= period
+    return result
+
+def rolling_mean_var(data, period, out=None, workspace=None):
+    """
+    이동 구간 평균과 모분산을 한 번에 계산
+
+    블록 기준값 대비 편차의 합과 제곱합을 함께 누적하므로 한 번의 계산으로
+    평균과 분산(np.var, ddof=0과 동일한 모분산)을 얻습니다. 편차가 구간 근처의
+    기준값에서 계산되므로 1,000,000원 이상의 고가 종목에서도 상쇄 오차가 작습니다.
+    평균은 rolling_mean과 동일한 값입니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (tuple): 결과를 저장할 (평균, 분산) 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        tuple: (평균, 분산) - 앞쪽 period-1개는 NaN
+    """
+    values = _as_float_array(data)
+    length = values.shape[-1]
+
+    if out is None:
+        mean, var = np.empty(values.shape), np.empty(values.shape)
+    else:
+        mean, var = _result_array(values.shape, out[0]), _result_array(values.shape, out[1])
+
+    nan_mask = np.isnan(values, out=_scratch(workspace, "nan_mask", values.shape, np.bool_))
+    if period < 1 or length < period or nan_mask.all():
+        mean.fill(np.nan)
+        var.fill(np.nan)
+        return mean, var
+
+    ref, sum1, sum2 = _block_window_moments(values, period, squares=True, workspace=workspace)
+    if _exact_int64(values, workspace) is not None:
+        rolling_mean(values, period, mean, workspace)
+    else:
+        mean[..., :period-1] = np.nan
+        ref *= period
+        np.add(sum1, ref, out=mean[..., period-1:])
+        mean[..., period-1:] /= period
+
+    sum1 /= period
+    sum1 *= sum1
+    sum2 /= period
+    sum2 -= sum1
+    var[..., :period-1] = np.nan
+    np.maximum(sum2, 0.0, out=var[..., period-1:])
+
+    # NaN이 포함된 구간은 NaN 처리
+    if nan_mask.any():
+        window_nan = _window_has_nan(nan_mask, period, workspace)
+        mean[..., period-1:][window_nan] = np.nan
+        var[..., period-1:][window_nan] = np.nan
+
+    return mean, var
+
+def rolling_mean_bank(data, periods, out=None, workspace=None):
+    """
+    여러 기간의 이동평균을 한 번의 누적합으로 계산
+
+    정수값 데이터는 하나의 int64 누적합을, 실수 데이터는 가장 긴 기간을 블록 크기로 하는
+    하나의 블록 누적합을 모든 기간이 공유합니다. 각 행은 rolling_mean(data, period)와 같습니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        periods (list): 이동평균 기간 목록
+        out (numpy.ndarray): 결과를 저장할 (기간 수, ...) 형태의 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: (기간 수, ...) 형태의 이동평균 배열 (각 행의 앞쪽 period-1개는 NaN)
+    """
+    values = np.asarray(data)
+    length = values.shape[-1]
+    periods = [int(period) for period in periods]
+
+    if out is None:
+        out = np.empty((len(periods),) + values.shape)
+    out.fill(np.nan)
+
+    valid_periods = [period for period in periods if 1 <= period <= length]
+    if not valid_periods:
+        return out
+
+    # 정수값 데이터: 공유 int64 누적합
+    int_values = _exact_int64(values, workspace)
+    if int_values is not None:
+        csum = _scratch(workspace, "rolling_sum_csum", values.shape[:-1] + (length + 1,), np.int64)
+        csum[..., 0] = 0
+        np.cumsum(int_values, axis=-1, out=csum[..., 1:])
+        for row, period in enumerate(periods):
+            if 1 <= period <= length:
+                window = out[row, ..., period-1:]
+                np.subtract(csum[..., period:], csum[..., :-period], out=window)
+                window /= period
+        return out
+
+    # 실수 데이터: 공유 블록 누적합
+    values = _as_float_array(values)
+    sums = _block_cumsums(values, max(valid_periods), workspace=workspace)
+    nan_mask = np.isnan(values, out=_scratch(workspace, "nan_mask", values.shape, np.bool_))
+    has_nan = nan_mask.any()
+
+    for row, period in enumerate(periods):
+        if not 1 <= period <= length:
+            continue
+        ref, sum1, _ = _window_moments(sums, period)
+        window = out[row, ..., period-1:]
+        ref *= period
+        np.add(sum1, ref, out=window)
+        window /= period
+        if has_nan:
+            window[_window_has_nan(nan_mask, period, workspace)] = np.nan
+
+    return out
+
+def rolling_std(data, period):
+    """
+    이동 구간 모표준편차 계산 (np.std, ddof=0과 동일)
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+
+    Returns:
+        numpy.ndarray: 구간 표준편차 (앞쪽 period-1개는 NaN)
+    """
+    return np.sqrt(rolling_mean_var(data, period)[1])
+
+def rolling_zscore(data, period):
+    """
+    이동 구간 z-score 계산
+
+    (현재값 - 구간 평균) / 구간 표준편차이며, 표준편차가 0인 구간은 0으로 설정합니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+
+    Returns:
+        numpy.ndarray: z-score (앞쪽 period-1개는 NaN)
+    """
+    values = _as_float_array(data)
+    mean, var = rolling_mean_var(values, period)
+    std = np.sqrt(var)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zscore = (values - mean) / std
+    zscore[std == 0] = 0.0
+
+    return zscore
+
+def _rolling_extremum(data, period, accumulate, fill, out=None, workspace=None):
+    """
+    van Herk/Gil-Werman 방식의 이동 구간 최대/최소 계산 (마지막 축 기준)
+
+    데이터를 period 크기의 블록으로 나눈 뒤 블록 내부의 전방 누적값과
+    후방 누적값을 구해, 각 구간의 극값을 두 값의 비교 한 번으로 얻습니다.
+    구간 길이와 무관하게 원소당 비교 횟수가 일정합니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        accumulate (numpy.ufunc): np.maximum 또는 np.minimum
+        fill (float): 블록을 채우기 위한 항등값 (최대: -inf, 최소: +inf)
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 구간 극값 (앞쪽 period-1개는 NaN)
+    """
+    values = _as_float_array(data)
+    length = values.shape[-1]
+    result = _result_array(values.shape, out)
+
+    if period < 1 or length < period:
+        result.fill(np.nan)
+        return result
+
+    rows = values.reshape(-1, length)
+    row_count = rows.shape[0]
+    block_count = -(-length // period)
+    padded = _scratch(workspace, "extremum_padded", (row_count, block_count * period))
+    padded[:, :length] = rows
+    padded[:, length:] = fill
+    blocks = padded.reshape(row_count, block_count, period)
+
+    # 블록 내부 전방/후방 누적 극값
+    prefix = _scratch(workspace, "extremum_prefix", blocks.shape)
+    suffix = _scratch(workspace, "extremum_suffix", blocks.shape)
+    accumulate.accumulate(blocks, axis=2, out=prefix)
+    accumulate.accumulate(blocks[:, :, ::-1], axis=2, out=suffix[:, :, ::-1])
+    prefix = prefix.reshape(row_count, -1)
+    suffix = suffix.reshape(row_count, -1)
+
+    result_rows = result.reshape(row_count, length)
+    result_rows[:, :period-1] = np.nan
+    accumulate(suffix[:, :length-period+1], prefix[:, period-1:length], out=result_rows[:, period-1:])
+
+    return result
+
+def rolling_max(data, period, out=None, workspace=None):
+    """
+    이동 구간 최대값 계산
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 구간 최대값 (앞쪽 period-1개는 NaN)
+    """
+    return _rolling_extremum(data, period, np.maximum, -np.inf, out, workspace)
+
+def rolling_min(data, period, out=None, workspace=None):
+    """
+    이동 구간 최소값 계산
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+        workspace (Workspace): 임시 배열 저장소
+
+    Returns:
+        numpy.ndarray: 구간 최소값 (앞쪽 period-1개는 NaN)
+    """
+    return _rolling_extremum(data, period, np.minimum, np.inf, out, workspace)
+
+def _sorted_window(data, period, mode, q=0.5, out=None):
+    """
+    정렬 구간 통계 계산 (마지막 축 기준)
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        mode (int): 0 분위수, 1 중앙값, 2 백분위 순위
+        q (float): 분위수
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+
+    Returns:
+        numpy.ndarray: 구간 통계값 (앞쪽 period-1개는 NaN)
+    """
+    values = _as_float_array(data)
+    length = values.shape[-1]
+    result = _result_array(values.shape, out)
+
+    if period < 1 or length < period:
+        result.fill(np.nan)
+        return result
+
+    sorted_window = kernel("sorted_window")
+    result_rows = result.reshape(-1, length)
+    for row, row_values in enumerate(values.reshape(-1, length)):
+        sorted_window(np.ascontiguousarray(row_values), period, mode, float(q), result_rows[row])
+    return result
+
+def rolling_quantile(data, period, q, out=None):
+    """
+    이동 구간 분위수 계산 (np.quantile의 선형 보간과 같은 값)
+
+    최근 period개 값을 정렬된 상태로 유지하며 한 봉마다 값 하나를 이진 탐색으로 삽입/제거하므로
+    구간마다 정렬하는 방식(O(period log period))보다 빠릅니다. 구간에 NaN이 있으면 NaN입니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        q (float): 분위수 (0 ~ 1)
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+
+    Returns:
+        numpy.ndarray: 구간 분위수 (앞쪽 period-1개는 NaN)
+    """
+    if not 0 <= q <= 1:
+        raise ValueError(f"분위수는 0 ~ 1 사이여야 합니다: {q}")
+    return _sorted_window(data, period, 0, q, out)
+
+def rolling_median(data, period, out=None):
+    """
+    이동 구간 중앙값 계산 (np.median과 같은 값)
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+
+    Returns:
+        numpy.ndarray: 구간 중앙값 (앞쪽 period-1개는 NaN)
+    """
+    return _sorted_window(data, period, 1, out=out)
+
+def rolling_percentile_rank(data, period, out=None):
+    """
+    이동 구간 백분위 순위 계산
+
+    각 봉의 값이 자신을 포함한 최근 period개 값 중 몇 번째 백분위인지 계산합니다.
+    같은 값은 평균 순위를 사용하며 (pandas rolling().rank(pct=True) × 100과 같음),
+    예를 들어 95 이상이면 최근 구간 상위 5% 안의 값입니다.
+
+    Args:
+        data (numpy.ndarray): 입력 데이터
+        period (int): 구간 길이
+        out (numpy.ndarray): 결과를 저장할 배열 (None이면 새로 할당)
+
+    Returns:
+        numpy.ndarray: 백분위 순위 (0 ~ 100, 앞쪽 period-1개는 NaN)
+    """
+    return _sorted_window(data, period, 2, out=out)
+
+class RollingQuantile:
+    """
+    실시간 이동 구간 분위수 클래스
+
+    최근 period개 값을 정렬된 리스트로 유지하여 값이 추가될 때마다
+    이진 탐색으로 삽입/제거 위치를 찾습니다.
+    rolling_quantile/rolling_median/rolling_percentile_rank와 같은 값을 반환하며,
+    구간에 NaN이 있으면 NaN을 반환합니다.
+    """
+
+    def __init__(self, period):
+        """
+        초기화
+
+        Args:
+            period (int): 구간 길이
+        """
+        self.period = period
+        self.count = 0              # 지금까지 추가된 값의 개수
+        self.nan_count = 0          # 구간 안의 NaN 개수
+        self.last = np.nan          # 마지막으로 추가된 값
+        self.window = deque()       # 추가 순서의 구간 값
+        self.sorted_values = []     # 정렬된 구간 값 (NaN 제외)
+
+    def append(self, value):
+        """
+        값 추가
+
+        Args:
+            value (float): 새 값
+
+        Returns:
+            float: 새 값의 구간 백분위 순위 (구간이 채워지지 않았으면 NaN)
+        """
+        value = float(value)
+        self.count += 1
+        self.last = value
+        self.window.append(value)
+        if np.isnan(value):
+            self.nan_count += 1
+        else:
+            insort(self.sorted_values, value)
+
+        if len(self.window) > self.period:
+            old = self.window.popleft()
+            if np.isnan(old):
+                self.nan_count -= 1
+            else:
+                del self.sorted_values[bisect_left(self.sorted_values, old)]
+
+        return self.percentile_rank()
+
+    def extend(self, values):
+        """
+        여러 값 추가
+
+        Args:
+            values (array-like): 추가할 값들
+
+        Returns:
+            float: 마지막 값의 구간 백분위 순위
+        """
+        rank = np.nan
+        for value in values:
+            rank = self.append(value)
+        return rank
+
+    def _statistic(self, value, mode, q=0.5):
+        """정렬 구간 통계값"""
+        if self.count < self.period or self.period < 1 or self.nan_count > 0:
+            return np.nan
+        return window_statistic(self.sorted_values, len(self.sorted_values), value, mode, q)
+
+    def quantile(self, q):
+        """현재 구간의 q 분위수"""
+        return self._statistic(np.nan, 0, q)
+
+    @property
+    def median(self):
+        """현재 구간의 중앙값"""
+        return self._statistic(np.nan, 1)
+
+    def percentile_rank(self, value=None):
+        """
+        현재 구간 기준 백분위 순위
+
+        Args:
+            value (float): 순위를 구할 값 (None이면 마지막으로 추가된 값)
+
+        Returns:
+            float: 백분위 순위 (0 ~ 100)
+        """
+        return self._statistic(self.last if value is None else float(value), 2)
+
+class RollingExtremum:
+    """
+    실시간 이동 구간 최대/최소 클래스
+
+    단조 덱(monotonic deque)을 이용해 값이 하나씩 추가될 때마다
+    분할 상환 O(1)로 현재 구간의 극값을 갱신합니다.
+    rolling_max/rolling_min과 동일하게 구간에 NaN이 있으면 NaN을 반환합니다.
+    """
+
+    def __init__(self, period, kind="max"):
+        """
+        초기화
+
+        Args:
+            period (int): 구간 길이
+            kind (str): "max" 또는 "min"
+        """
+        if kind not in ("max", "min"):
+            raise ValueError(f"지원하지 않는 극값 종류입니다: {kind}")
+
+        self.period = period
+        self.kind = kind
+        self.count = 0              # 지금까지 추가된 값의 개수
+        self.last_nan_index = -1    # 마지막 NaN 위치
+        self.window = deque()       # (인덱스, 값) 단조 덱
+
+    def _dominates(self, new_value, old_value):
+        """새 값이 기존 값을 덱에서 밀어낼 수 있는지 여부"""
+        if self.kind == "max":
+            return new_value >= old_value
+        return new_value <= old_value
+
+    def append(self, value):
+        """
+        값 추가
+
+        Args:
+            value (float): 새 값
+
+        Returns:
+            float: 현재 구간의 극값 (구간이 채워지지 않았으면 NaN)
+        """
+        index = self.count
+        self.count += 1
+
+        if np.isnan(value):
+            self.last_nan_index = index
+        else:
+            while self.window and self._dominates(value, self.window[-1][1]):
+                self.window.pop()
+            self.window.append((index, value))
+
+        # 구간을 벗어난 값 제거
+        while self.window and self.window[0][0] <= index - self.period:
+            self.window.popleft()
+
+        return self.value
+
+    def extend(self, values):
+        """
+        여러 값 추가
+
+        Args:
+            values (array-like): 추가할 값들
+
+        Returns:
+            float: 마지막 구간의 극값
+        """
+        for value in values:
+            self.append(float(value))
+        return self.value
+
+    @property
+    def value(self):
+        """현재 구간의 극값"""
+        if self.count < self.period or self.period < 1:
+            return np.nan
+        if self.last_nan_index > self.count - 1 - self.period:
+            return np.nan
+        return self.window[0][1]
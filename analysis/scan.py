@@ -0,0 +1,435 @@
+"""
+종목 전체 지표 스캔 모듈
+
+장 마감 후 전체 종목(KiwoomData.code_cache)에 대해 여러 지표/파라미터 조합을 계산하는
+다중 프로세스 스캔 기능을 제공합니다.
+
+- OHLCV는 (컬럼 × 종목 × 봉) 배열로 multiprocessing.shared_memory에 한 번만 올리고,
+  워커 프로세스는 이름으로 연결하여 배열을 복사하거나 pickle하지 않습니다.
+- 작업은 (지표 조합 × 종목 묶음) 단위로 나누어 프로세스 풀에 분배하며,
+  각 워커는 결과를 공유 메모리의 결과 행렬에 직접 기록합니다.
+- 종목 묶음 계산은 analysis.universe의 (종목 × 봉) 함수를 사용하고,
+  해당 함수가 없는 지표는 종목별로 analysis.indicators 함수를 호출합니다.
+
+사용 예:
+    with SharedOHLCV.from_chart_data(chart_data_by_code) as shared:
+        scanner = UniverseScanner(workers=8)
+        scanner.add("rsi", period=14)
+        scanner.add("macd")
+        values = scanner.run(shared)        # (출력 수 × 종목) 마지막 봉 값
+        scanner.output_names                # ["rsi(14)", "macd.line", ...]
+"""
+
+import inspect
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from . import indicators, universe
+from .planner import INDICATOR_SPECS
+
+# OHLCV 컬럼 순서
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# 지표 함수 인자 이름별 입력 컬럼 (기본값이 None인 인자는 컬럼이 있을 때만 사용)
+_ARGUMENT_COLUMNS = {
+    "high_data": "high",
+    "low_data": "low",
+    "close_data": "close",
+    "volume_data": "volume",
+    "date_data": "date",
+    "time_data": "time",
+}
+
+def _open_block(name):
+    """
+    기존 공유 메모리 블록 열기
+
+    연결한 프로세스가 종료될 때 resource_tracker가 블록을 해제하지 않도록
+    가능하면(Python 3.13 이상) 추적하지 않고 엽니다.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+class SharedArray:
+    """
+    공유 메모리 배열
+
+    생성한 프로세스는 close() 후 unlink()로 공유 메모리를 해제하고,
+    연결한 프로세스는 close()만 호출합니다.
+    """
+
+    def __init__(self, block, shape, dtype, owner):
+        """
+        초기화 (create() 또는 attach() 사용)
+
+        Args:
+            block (SharedMemory): 공유 메모리 블록
+            shape (tuple): 배열 형태
+            dtype: 배열 자료형
+            owner (bool): 공유 메모리를 생성한 객체인지 여부
+        """
+        self.block = block
+        self.array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        self.owner = owner
+
+    @classmethod
+    def create(cls, shape, dtype=np.float64):
+        """
+        공유 메모리 배열 생성
+
+        Args:
+            shape (tuple): 배열 형태
+            dtype: 배열 자료형
+
+        Returns:
+            SharedArray: 생성된 배열
+        """
+        nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+        return cls(shared_memory.SharedMemory(create=True, size=nbytes), tuple(shape), np.dtype(dtype), True)
+
+    @classmethod
+    def attach(cls, spec):
+        """
+        다른 프로세스가 생성한 공유 메모리 배열에 연결
+
+        Args:
+            spec (dict): spec 속성 값
+
+        Returns:
+            SharedArray: 연결된 배열
+        """
+        return cls(_open_block(spec["name"]), spec["shape"], spec["dtype"], False)
+
+    @property
+    def spec(self):
+        """다른 프로세스에 전달할 연결 정보 (이름, 형태, 자료형)"""
+        return {"name": self.block.name, "shape": self.array.shape, "dtype": self.array.dtype.str}
+
+    def close(self):
+        """
+        연결 해제 (생성한 객체는 공유 메모리도 해제)
+
+        array의 뷰를 아직 참조하고 있으면 BufferError가 발생하므로, 필요한 값은 먼저 복사해야 합니다.
+        """
+        self.array = None
+        self.block.close()
+        if self.owner:
+            self.block.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class SharedOHLCV(SharedArray):
+    """
+    공유 메모리 OHLCV 행렬
+
+    (컬럼 × 종목 × 봉) 배열이며, 종목마다 이력 길이가 다르면 analysis.universe.to_matrix와 같이
+    앞쪽을 NaN으로 채워 오른쪽 정렬합니다.
+    """
+
+    def __init__(self, block, shape, dtype, owner, columns=OHLCV_COLUMNS, codes=()):
+        super().__init__(block, shape, dtype, owner)
+        self.columns = tuple(columns)
+        self.codes = list(codes)
+
+    @classmethod
+    def create(cls, shape, dtype=np.float64, columns=OHLCV_COLUMNS, codes=()):
+        """
+        공유 메모리 OHLCV 행렬 생성
+
+        Args:
+            shape (tuple): (종목 수, 봉 개수)
+            dtype: 배열 자료형
+            columns (tuple): 컬럼 이름
+            codes (list): 종목코드 (행 순서)
+
+        Returns:
+            SharedOHLCV: 생성된 행렬 (값은 초기화되지 않음)
+        """
+        full_shape = (len(columns),) + tuple(shape)
+        nbytes = max(int(np.prod(full_shape)) * np.dtype(dtype).itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=nbytes)
+        return cls(block, full_shape, np.dtype(dtype), True, columns, codes)
+
+    @classmethod
+    def from_chart_data(cls, chart_data_by_code, length=None, columns=OHLCV_COLUMNS):
+        """
+        종목별 차트 데이터로 생성
+
+        Args:
+            chart_data_by_code (dict): {종목코드: 차트 데이터 (컬럼별 배열, 과거 → 최근 순)}
+            length (int): 봉 개수 (None이면 가장 긴 이력 길이)
+            columns (tuple): 컬럼 이름
+
+        Returns:
+            SharedOHLCV: 생성된 행렬
+        """
+        codes = list(chart_data_by_code)
+        if length is None:
+            length = max((len(data[columns[0]]) for data in chart_data_by_code.values()), default=0)
+
+        shared = cls.create((len(codes), length), columns=columns, codes=codes)
+        for index, column in enumerate(columns):
+            shared.array[index] = universe.to_matrix([chart_data_by_code[code][column] for code in codes], length)
+        return shared
+
+    @classmethod
+    def attach(cls, spec):
+        return cls(_open_block(spec["name"]), spec["shape"], spec["dtype"], False, spec["columns"], spec["codes"])
+
+    @property
+    def spec(self):
+        return dict(super().spec, columns=self.columns, codes=self.codes)
+
+    def column(self, name):
+        """
+        컬럼 행렬
+
+        Args:
+            name (str): 컬럼 이름
+
+        Returns:
+            numpy.ndarray: (종목 × 봉) 배열 (공유 메모리 뷰)
+        """
+        return self.array[self.columns.index(name)]
+
+def _input_columns(indicator, params, available):
+    """
+    지표 함수의 입력 컬럼
+
+    기본값이 None인 선택 입력(date_data, time_data)은 행렬에 해당 컬럼이 있을 때만 사용합니다.
+
+    Args:
+        indicator (str): 지표 함수 이름
+        params (dict): 파라미터 (column이 있으면 단일 입력 컬럼)
+        available (tuple): 행렬의 컬럼 이름
+
+    Returns:
+        dict: {인자 이름: 입력 컬럼 이름}
+    """
+    columns = {}
+    missing = []
+    for name, parameter in inspect.signature(getattr(indicators, indicator)).parameters.items():
+        if name == "data":
+            column = params.get("column", "close")
+        elif name in _ARGUMENT_COLUMNS:
+            column = _ARGUMENT_COLUMNS[name]
+        else:
+            continue
+
+        if column in available:
+            columns[name] = column
+        elif parameter.default is not None:
+            missing.append(column)
+
+    if missing:
+        raise ValueError(f"{indicator} 계산에 필요한 컬럼이 없습니다: {', '.join(missing)}")
+    return columns
+
+def _as_outputs(output):
+    """지표 결과를 (종목 × 봉) 배열 목록으로 변환"""
+    if isinstance(output, tuple):
+        return list(output)
+    if output.ndim == 3:
+        return list(output)
+    return [output]
+
+def _compute_rows(job, ohlcv, rows):
+    """
+    종목 묶음에 대한 지표 계산
+
+    Args:
+        job (tuple): (지표 이름, 파라미터, {인자 이름: 입력 컬럼})
+        ohlcv (SharedOHLCV): OHLCV 행렬
+        rows (slice): 종목 범위
+
+    Returns:
+        list: 출력별 (종목 × 봉) 배열
+    """
+    indicator, params, columns = job
+    params = {key: value for key, value in params.items() if key != "column"}
+    inputs = {name: ohlcv.column(column)[rows] for name, column in columns.items()}
+
+    function = getattr(universe, indicator, None)
+    if function is not None:
+        return _as_outputs(function(**inputs, **params))
+
+    # 행렬 함수가 없는 지표: 종목별로 유효 구간만 계산해 오른쪽 정렬
+    function = getattr(indicators, indicator)
+    first_input = next(iter(inputs.values()))
+    row_count, length = first_input.shape
+    first_valid = universe._first_valid_index(first_input)
+    outputs = None
+    for row in range(row_count):
+        start = first_valid[row]
+        row_inputs = {name: matrix[row, start:] for name, matrix in inputs.items()}
+        values = _as_outputs(function(**row_inputs, **params))
+        if outputs is None:
+            outputs = [np.full((row_count, length), np.nan) for _ in values]
+        for output, value in zip(outputs, values):
+            output[row, start:] = value
+    return outputs
+
+# 워커 프로세스의 공유 메모리 연결과 작업 정보
+_worker = {}
+
+def _init_worker(ohlcv_spec, result_spec, jobs, offsets, tail):
+    """워커 프로세스 초기화 (공유 메모리 연결)"""
+    _worker["ohlcv"] = SharedOHLCV.attach(ohlcv_spec)
+    _worker["result"] = SharedArray.attach(result_spec)
+    _worker["jobs"] = jobs
+    _worker["offsets"] = offsets
+    _worker["tail"] = tail
+
+def _run_task(task):
+    """
+    작업 하나 실행 (결과는 공유 결과 행렬에 직접 기록)
+
+    Args:
+        task (tuple): (작업 번호, 시작 종목, 끝 종목)
+
+    Returns:
+        tuple: 입력 task (완료 확인용)
+    """
+    job_index, row_start, row_stop = task
+    outputs = _compute_rows(_worker["jobs"][job_index], _worker["ohlcv"], slice(row_start, row_stop))
+
+    offset = _worker["offsets"][job_index]
+    tail = _worker["tail"]
+    result = _worker["result"].array
+    for index, output in enumerate(outputs):
+        result[offset + index, row_start:row_stop] = output[:, -tail:]
+    return task
+
+class UniverseScanner:
+    """
+    다중 프로세스 종목 전체 스캔 클래스
+
+    지표 요청은 IndicatorPlan.add()와 같은 방식으로 추가하고, run()은 모든 요청의
+    출력을 (출력 수 × 종목) 행렬 하나로 모아 반환합니다.
+    """
+
+    def __init__(self, workers=None, rows_per_task=None, tail=1, columns=OHLCV_COLUMNS):
+        """
+        초기화
+
+        Args:
+            workers (int): 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+            rows_per_task (int): 작업 하나가 계산할 종목 수 (None이면 워커당 작업 4개 이상이 되도록 결정)
+            tail (int): 결과에 남길 최근 봉 개수
+            columns (tuple): 스캔할 SharedOHLCV의 컬럼 이름 (add()에서 입력 컬럼 확인에 사용)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.rows_per_task = rows_per_task
+        self.tail = tail
+        self.columns = tuple(columns)
+        self.requests = []    # (이름, 지표, 파라미터)
+        self.output_names = []
+
+    def add(self, indicator, name=None, **params):
+        """
+        지표 요청 추가
+
+        Args:
+            indicator (str): analysis.indicators의 지표 함수 이름
+            name (str): 결과 이름 (None이면 지표 이름과 파라미터로 생성)
+            **params: 지표 파라미터
+
+        Returns:
+            str: 결과 이름
+        """
+        if not hasattr(indicators, indicator):
+            raise ValueError(f"지원하지 않는 지표입니다: {indicator}")
+        _input_columns(indicator, params, self.columns)
+
+        if name is None:
+            values = [str(value) for value in params.values()]
+            name = f"{indicator}({','.join(values)})" if values else indicator
+
+        self.requests.append((name, indicator, params))
+        return name
+
+    def _jobs(self, ohlcv):
+        """
+        작업 목록과 출력 이름 구성
+
+        첫 종목으로 한 번 계산하여 지표별 출력 개수를 확인합니다.
+        여러 출력은 IndicatorPlan과 같은 "이름.출력" 형식으로 이름을 붙입니다.
+
+        Returns:
+            tuple: (작업 목록, 작업별 결과 행 시작 위치, 출력 이름 목록)
+        """
+        jobs = []
+        offsets = []
+        names = []
+        for name, indicator, params in self.requests:
+            job = (indicator, params, _input_columns(indicator, params, ohlcv.columns))
+            count = len(_compute_rows(job, ohlcv, slice(0, 1)))
+
+            parts = INDICATOR_SPECS.get(indicator, {}).get("outputs")
+            if indicator == "moving_average_bank":
+                parts = params.get("periods", (5, 10, 20, 60, 120))
+            if parts is None or len(parts) != count:
+                parts = range(count)
+
+            jobs.append(job)
+            offsets.append(len(names))
+            names += [name] if count == 1 else [f"{name}.{part}" for part in parts]
+        return jobs, offsets, names
+
+    def run(self, ohlcv):
+        """
+        스캔 실행
+
+        Args:
+            ohlcv (SharedOHLCV): 공유 메모리 OHLCV 행렬
+
+        Returns:
+            numpy.ndarray: (출력 수 × 종목) 행렬. tail > 1이면 (출력 수 × 종목 × tail)
+        """
+        _, row_count, length = ohlcv.array.shape
+        if row_count == 0 or length == 0 or not self.requests:
+            self.output_names = []
+            return np.empty((0, row_count))
+
+        jobs, offsets, names = self._jobs(ohlcv)
+        self.output_names = names
+
+        rows_per_task = self.rows_per_task or max(-(-row_count * len(jobs) // (self.workers * 4)), 1)
+        rows_per_task = min(rows_per_task, row_count)
+        tasks = [
+            (job_index, start, min(start + rows_per_task, row_count))
+            for job_index in range(len(jobs))
+            for start in range(0, row_count, rows_per_task)
+        ]
+
+        tail = min(self.tail, length)
+        with SharedArray.create((len(names), row_count, tail)) as result:
+            result.array.fill(np.nan)
+            init_args = (ohlcv.spec, result.spec, jobs, offsets, tail)
+
+            if self.workers == 1:
+                _init_worker(*init_args)
+                try:
+                    for task in tasks:
+                        _run_task(task)
+                finally:
+                    _worker["ohlcv"].close()
+                    _worker["result"].close()
+                    _worker.clear()
+            else:
+                with multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=init_args) as pool:
+                    for _ in pool.imap_unordered(_run_task, tasks):
+                        pass
+
+            values = result.array.copy()
+
+        return values[..., 0] if self.tail == 1 else values
@@ -0,0 +1,1121 @@
+"""
+실시간 지표 계산 모듈
+
+이 모듈은 실시간 체결 데이터에 맞춰 기술적 지표를 한 봉씩 갱신하는 상태 클래스를 제공합니다.
+각 클래스는 analysis.indicators의 일괄 계산 함수와 같은 연산 순서를 사용하므로
+같은 데이터에 대해 일괄 계산 결과와 비트 단위까지 동일한 값을 반환합니다.
+
+사용 방법:
+    - update(): 아직 완성되지 않은 봉(진행 중인 봉)의 잠정값 계산. 여러 번 호출 가능
+    - commit(): 마지막 update() 결과를 확정 (봉 완성)
+    - rollback(): 마지막 update() 결과를 폐기
+    - append(): update() 후 commit()
+    - from_history(): 과거 데이터로 상태 초기화
+"""
+
+import numpy as np
+
+from .indicators import (
+    exponential_moving_average, on_balance_volume, average_true_range, vwap, commodity_channel_index,
+    williams_r, money_flow_index, session_starts, _rsi_averages, _adx_components, _parabolic_sar_run, _session_cumsum
+)
+
+class IndicatorState:
+    """
+    실시간 지표 상태 기본 클래스
+
+    하위 클래스는 _initial_state()와 _step()만 구현합니다.
+    _step()은 확정된 상태를 변경하지 않고 새 상태를 반환해야 합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._state = self._initial_state()
+        self._pending = None
+        self._value = self._empty_value()
+
+    def _initial_state(self):
+        """초기 상태 반환"""
+        raise NotImplementedError
+
+    def _empty_value(self):
+        """계산 전 출력값"""
+        return np.nan
+
+    def _step(self, state, *args):
+        """
+        한 봉 계산
+
+        Args:
+            state (dict): 확정된 상태
+
+        Returns:
+            tuple: (새 상태, 출력값)
+        """
+        raise NotImplementedError
+
+    def update(self, *args):
+        """
+        진행 중인 봉의 잠정값 계산
+
+        확정된 상태는 변경하지 않으므로 같은 봉에 대해 여러 번 호출할 수 있습니다.
+
+        Returns:
+            지표 값
+        """
+        new_state, value = self._step(self._state, *args)
+        self._pending = (new_state, value)
+        return value
+
+    def commit(self):
+        """마지막 update() 결과 확정"""
+        if self._pending is not None:
+            self._state, self._value = self._pending
+            self._pending = None
+
+    def rollback(self):
+        """마지막 update() 결과 폐기"""
+        self._pending = None
+
+    def append(self, *args):
+        """
+        완성된 봉 추가 (update 후 commit)
+
+        Returns:
+            지표 값
+        """
+        value = self.update(*args)
+        self.commit()
+        return value
+
+    @property
+    def value(self):
+        """현재 값 (잠정값이 있으면 잠정값)"""
+        if self._pending is not None:
+            return self._pending[1]
+        return self._value
+
+    @property
+    def count(self):
+        """확정된 봉 개수"""
+        return self._state["count"]
+
+class EMAState(IndicatorState):
+    """
+    지수 이동평균 실시간 상태 클래스
+
+    exponential_moving_average()와 동일하게 처음 period개 값의 평균으로 시작합니다.
+    """
+
+    def __init__(self, period=20):
+        """
+        초기화
+
+        Args:
+            period (int): 이동평균 기간
+        """
+        self.period = period
+        self.k = 2 / (period + 1)
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "buffer": (), "ema": np.nan}
+
+    def _step(self, state, price):
+        count = state["count"] + 1
+
+        if count < self.period:
+            return {"count": count, "buffer": state["buffer"] + (price,), "ema": np.nan}, np.nan
+
+        if count == self.period:
+            ema = np.mean(np.array(state["buffer"] + (price,), dtype=np.float64))
+        else:
+            ema = price * self.k + state["ema"] * (1-self.k)
+
+        return {"count": count, "buffer": (), "ema": ema}, ema
+
+    @classmethod
+    def from_history(cls, data, period=20):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            data (numpy.ndarray): 가격 데이터
+            period (int): 이동평균 기간
+
+        Returns:
+            EMAState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        data = np.asarray(data, dtype=np.float64)
+
+        if len(data) < period:
+            for price in data:
+                state.append(price)
+            return state
+
+        ema = exponential_moving_average(data, period)[-1]
+        state._state = {"count": len(data), "buffer": (), "ema": ema}
+        state._value = ema
+        return state
+
+class RSIState(IndicatorState):
+    """
+    RSI 실시간 상태 클래스
+
+    rsi()와 동일하게 처음 period개 변화량의 평균 이후 Wilder 평활을 사용합니다.
+    """
+
+    def __init__(self, period=14):
+        """
+        초기화
+
+        Args:
+            period (int): RSI 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {
+            "count": 0, "prev": np.nan, "gains": (), "losses": (),
+            "avg_gain": np.nan, "avg_loss": np.nan
+        }
+
+    def _rsi(self, avg_gain, avg_loss):
+        """평균 상승/하락으로 RSI 계산"""
+        if avg_loss == 0:
+            rs = 100
+        else:
+            rs = avg_gain / avg_loss
+        return 100 - (100 / (1 + rs))
+
+    def _step(self, state, price):
+        index = state["count"]
+        new_state = dict(state, count=index + 1, prev=price)
+
+        if index == 0:
+            return new_state, np.nan
+
+        # 상승, 하락 구분
+        delta = price - state["prev"]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if index < self.period:
+            new_state["gains"] = state["gains"] + (gain,)
+            new_state["losses"] = state["losses"] + (loss,)
+            return new_state, np.nan
+
+        if index == self.period:
+            avg_gain = np.mean(np.array(state["gains"] + (gain,), dtype=np.float64))
+            avg_loss = np.mean(np.array(state["losses"] + (loss,), dtype=np.float64))
+            new_state["gains"] = ()
+            new_state["losses"] = ()
+        else:
+            avg_gain = (state["avg_gain"] * (self.period-1) + gain) / self.period
+            avg_loss = (state["avg_loss"] * (self.period-1) + loss) / self.period
+
+        new_state["avg_gain"] = avg_gain
+        new_state["avg_loss"] = avg_loss
+        return new_state, self._rsi(avg_gain, avg_loss)
+
+    @classmethod
+    def from_history(cls, data, period=14):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            data (numpy.ndarray): 가격 데이터
+            period (int): RSI 기간
+
+        Returns:
+            RSIState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        data = np.asarray(data, dtype=np.float64)
+
+        if len(data) < period + 1:
+            for price in data:
+                state.append(price)
+            return state
+
+        avg_gain, avg_loss = _rsi_averages(data, period)
+        state._state = {
+            "count": len(data), "prev": data[-1], "gains": (), "losses": (),
+            "avg_gain": avg_gain[-1], "avg_loss": avg_loss[-1]
+        }
+        state._value = state._rsi(avg_gain[-1], avg_loss[-1])
+        return state
+
+class MACDState:
+    """
+    MACD 실시간 상태 클래스
+
+    빠른/느린/시그널 EMAState를 조합하며, macd()와 같이 MACD 라인이 유효해진 시점부터
+    시그널 EMA를 계산합니다. macd()와 같이 봉이 slow_period + signal_period개 미만이면
+    값은 모두 NaN입니다.
+
+    따라서 처음부터 봉을 추가하면 MACD 라인이 유효해진 뒤 signal_period개 봉
+    (slow_period ~ slow_period + signal_period - 1번째 봉) 동안은 MACD 라인도 NaN입니다.
+    전체 이력에 대한 macd() 결과에는 이 봉들의 MACD 라인 값이 있으므로,
+    그 구간의 MACD 라인이 필요하면 macd()로 계산합니다.
+    """
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        """
+        초기화
+
+        Args:
+            fast_period (int): 빠른 EMA 기간
+            slow_period (int): 느린 EMA 기간
+            signal_period (int): 시그널 EMA 기간
+        """
+        self.fast = EMAState(fast_period)
+        self.slow = EMAState(slow_period)
+        self.signal = EMAState(signal_period)
+        self.min_count = slow_period + signal_period
+        self._value = (np.nan, np.nan, np.nan)
+        self._pending = None
+
+    def update(self, price):
+        """
+        진행 중인 봉의 잠정값 계산
+
+        Args:
+            price (float): 가격
+
+        Returns:
+            tuple: (MACD 라인, 시그널 라인, 히스토그램)
+        """
+        macd_value = self.fast.update(price) - self.slow.update(price)
+
+        if np.isnan(macd_value):
+            signal_value = np.nan
+        else:
+            signal_value = self.signal.update(macd_value)
+
+        # macd()의 최소 데이터 길이 미만
+        if self.fast.count + 1 < self.min_count:
+            self._pending = (np.nan, np.nan, np.nan)
+        else:
+            self._pending = (macd_value, signal_value, macd_value - signal_value)
+        return self._pending
+
+    def commit(self):
+        """마지막 update() 결과 확정"""
+        if self._pending is not None:
+            self.fast.commit()
+            self.slow.commit()
+            self.signal.commit()
+            self._value = self._pending
+            self._pending = None
+
+    def rollback(self):
+        """마지막 update() 결과 폐기"""
+        self.fast.rollback()
+        self.slow.rollback()
+        self.signal.rollback()
+        self._pending = None
+
+    def append(self, price):
+        """
+        완성된 봉 추가 (update 후 commit)
+
+        Args:
+            price (float): 가격
+
+        Returns:
+            tuple: (MACD 라인, 시그널 라인, 히스토그램)
+        """
+        value = self.update(price)
+        self.commit()
+        return value
+
+    @property
+    def value(self):
+        """현재 값 (잠정값이 있으면 잠정값)"""
+        if self._pending is not None:
+            return self._pending
+        return self._value
+
+    @property
+    def count(self):
+        """확정된 봉 개수"""
+        return self.fast.count
+
+    @classmethod
+    def from_history(cls, data, fast_period=12, slow_period=26, signal_period=9):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            data (numpy.ndarray): 가격 데이터
+            fast_period (int): 빠른 EMA 기간
+            slow_period (int): 느린 EMA 기간
+            signal_period (int): 시그널 EMA 기간
+
+        Returns:
+            MACDState: 초기화된 상태 객체
+        """
+        state = cls(fast_period, slow_period, signal_period)
+        data = np.asarray(data, dtype=np.float64)
+
+        start = max(fast_period, slow_period) - 1
+        if len(data) <= start:
+            for price in data:
+                state.append(price)
+            return state
+
+        state.fast = EMAState.from_history(data, fast_period)
+        state.slow = EMAState.from_history(data, slow_period)
+
+        macd_line = exponential_moving_average(data, fast_period) - exponential_moving_average(data, slow_period)
+        state.signal = EMAState.from_history(macd_line[start:], signal_period)
+
+        if len(data) >= state.min_count:
+            macd_value = macd_line[-1]
+            state._value = (macd_value, state.signal.value, macd_value - state.signal.value)
+        return state
+
+class OBVState(IndicatorState):
+    """OBV 실시간 상태 클래스"""
+
+    def _initial_state(self):
+        return {"count": 0, "prev_close": np.nan, "obv": np.nan}
+
+    def _step(self, state, close, volume):
+        count = state["count"] + 1
+
+        # 첫 봉은 on_balance_volume()과 같이 NaN
+        if count == 1:
+            return {"count": count, "prev_close": close, "obv": float(volume)}, np.nan
+
+        if close > state["prev_close"]:
+            obv = state["obv"] + volume
+        elif close < state["prev_close"]:
+            obv = state["obv"] - volume
+        else:
+            obv = state["obv"]
+
+        return {"count": count, "prev_close": close, "obv": obv}, obv
+
+    @classmethod
+    def from_history(cls, close_data, volume_data):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            close_data (numpy.ndarray): 종가 데이터
+            volume_data (numpy.ndarray): 거래량 데이터
+
+        Returns:
+            OBVState: 초기화된 상태 객체
+        """
+        state = cls()
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < 2:
+            for close, volume in zip(close_data, volume_data):
+                state.append(close, volume)
+            return state
+
+        obv = on_balance_volume(close_data, volume_data)[-1]
+        state._state = {"count": len(close_data), "prev_close": close_data[-1], "obv": obv}
+        state._value = obv
+        return state
+
+class ADXState(IndicatorState):
+    """
+    ADX 실시간 상태 클래스
+
+    average_directional_index()와 동일한 Wilder 평활을 사용합니다.
+    average_directional_index()와 같이 봉이 period * 2개 미만이면 값은 모두 NaN이고,
+    이후 ADX, +DI, -DI가 함께 나옵니다.
+    """
+
+    def __init__(self, period=14):
+        """
+        초기화
+
+        Args:
+            period (int): ADX 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {
+            "count": 0, "prev": None,
+            "trs": (), "plus_dms": (), "minus_dms": (), "dxs": (),
+            "smoothed_tr": np.nan, "smoothed_plus_dm": np.nan, "smoothed_minus_dm": np.nan,
+            "adx": np.nan
+        }
+
+    def _empty_value(self):
+        return (np.nan, np.nan, np.nan)
+
+    def _step(self, state, high, low, close):
+        period = self.period
+        index = state["count"]
+        new_state = dict(state, count=index + 1, prev=(high, low, close))
+
+        if index == 0:
+            return new_state, (np.nan, np.nan, np.nan)
+
+        prev_high, prev_low, prev_close = state["prev"]
+
+        # True Range, Directional Movement
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        up_move = high - prev_high
+        down_move = prev_low - low
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0
+
+        if index < period:
+            new_state["trs"] = state["trs"] + (tr,)
+            new_state["plus_dms"] = state["plus_dms"] + (plus_dm,)
+            new_state["minus_dms"] = state["minus_dms"] + (minus_dm,)
+            return new_state, (np.nan, np.nan, np.nan)
+
+        # 평활 TR, DM
+        if index == period:
+            smoothed_tr = np.sum(np.array(state["trs"] + (tr,), dtype=np.float64))
+            smoothed_plus_dm = np.sum(np.array(state["plus_dms"] + (plus_dm,), dtype=np.float64))
+            smoothed_minus_dm = np.sum(np.array(state["minus_dms"] + (minus_dm,), dtype=np.float64))
+            new_state["trs"] = new_state["plus_dms"] = new_state["minus_dms"] = ()
+        else:
+            smoothed_tr = state["smoothed_tr"] - (state["smoothed_tr"] / period) + tr
+            smoothed_plus_dm = state["smoothed_plus_dm"] - (state["smoothed_plus_dm"] / period) + plus_dm
+            smoothed_minus_dm = state["smoothed_minus_dm"] - (state["smoothed_minus_dm"] / period) + minus_dm
+
+        new_state["smoothed_tr"] = smoothed_tr
+        new_state["smoothed_plus_dm"] = smoothed_plus_dm
+        new_state["smoothed_minus_dm"] = smoothed_minus_dm
+
+        # Directional Indicators, DX
+        if smoothed_tr == 0:
+            plus_di = 0.0
+            minus_di = 0.0
+        else:
+            plus_di = 100 * smoothed_plus_dm / smoothed_tr
+            minus_di = 100 * smoothed_minus_dm / smoothed_tr
+
+        if plus_di + minus_di == 0:
+            dx = 0.0
+        else:
+            dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+
+        # ADX (average_directional_index()의 최소 데이터 길이 미만이면 NaN)
+        if index < period * 2 - 1:
+            new_state["dxs"] = state["dxs"] + (dx,)
+            return new_state, (np.nan, np.nan, np.nan)
+
+        if index == period * 2 - 1:
+            adx = np.mean(np.array(state["dxs"] + (dx,), dtype=np.float64))
+            new_state["dxs"] = ()
+        else:
+            adx = (state["adx"] * (period-1) + dx) / period
+
+        new_state["adx"] = adx
+        return new_state, (adx, plus_di, minus_di)
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, period=14):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            period (int): ADX 기간
+
+        Returns:
+            ADXState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        high_data = np.asarray(high_data, dtype=np.float64)
+        low_data = np.asarray(low_data, dtype=np.float64)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < period * 2:
+            for high, low, close in zip(high_data, low_data, close_data):
+                state.append(high, low, close)
+            return state
+
+        components = _adx_components(high_data, low_data, close_data, period)
+        state._state = {
+            "count": len(close_data), "prev": (high_data[-1], low_data[-1], close_data[-1]),
+            "trs": (), "plus_dms": (), "minus_dms": (), "dxs": (),
+            "smoothed_tr": components["smoothed_tr"][-1],
+            "smoothed_plus_dm": components["smoothed_plus_dm"][-1],
+            "smoothed_minus_dm": components["smoothed_minus_dm"][-1],
+            "adx": components["adx"][-1]
+        }
+        state._value = (components["adx"][-1], components["plus_di"][-1], components["minus_di"][-1])
+        return state
+
+class ParabolicSARState(IndicatorState):
+    """Parabolic SAR 실시간 상태 클래스"""
+
+    def __init__(self, af_start=0.02, af_increment=0.02, af_max=0.2):
+        """
+        초기화
+
+        Args:
+            af_start (float): 초기 가속 계수
+            af_increment (float): 가속 계수 증가분
+            af_max (float): 최대 가속 계수
+        """
+        self.af_start = af_start
+        self.af_increment = af_increment
+        self.af_max = af_max
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "prev_high": np.nan, "prev_low": np.nan, "sar": np.nan, "trend": 1, "ep": np.nan, "af": self.af_start}
+
+    def _step(self, state, high, low, close):
+        count = state["count"] + 1
+
+        # 첫 번째 SAR (parabolic_sar()와 같이 첫 봉의 출력은 NaN)
+        if count == 1:
+            return {"count": count, "prev_high": high, "prev_low": low, "sar": low, "trend": 1, "ep": high, "af": self.af_start}, np.nan
+
+        trend = state["trend"]
+        ep = state["ep"]
+        af = state["af"]
+        prev_high = state["prev_high"]
+        prev_low = state["prev_low"]
+
+        sar = state["sar"] + af * (ep - state["sar"])
+
+        # 추세 전환 확인
+        if trend == 1:
+            if sar > low or sar > prev_low:
+                trend = -1
+                sar = max(high, prev_high)
+                ep = low
+                af = self.af_start
+            elif high > ep:
+                ep = high
+                af = min(af + self.af_increment, self.af_max)
+        else:
+            if sar < high or sar < prev_high:
+                trend = 1
+                sar = min(low, prev_low)
+                ep = high
+                af = self.af_start
+            elif low < ep:
+                ep = low
+                af = min(af + self.af_increment, self.af_max)
+
+        return {"count": count, "prev_high": high, "prev_low": low, "sar": sar, "trend": trend, "ep": ep, "af": af}, sar
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, af_start=0.02, af_increment=0.02, af_max=0.2):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            af_start (float): 초기 가속 계수
+            af_increment (float): 가속 계수 증가분
+            af_max (float): 최대 가속 계수
+
+        Returns:
+            ParabolicSARState: 초기화된 상태 객체
+        """
+        state = cls(af_start, af_increment, af_max)
+        high_data = np.asarray(high_data, dtype=np.float64)
+        low_data = np.asarray(low_data, dtype=np.float64)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < 2:
+            for high, low, close in zip(high_data, low_data, close_data):
+                state.append(high, low, close)
+            return state
+
+        sar, trend, ep, af = _parabolic_sar_run(high_data, low_data, close_data, af_start, af_increment, af_max)
+        state._state = {
+            "count": len(close_data), "prev_high": high_data[-1], "prev_low": low_data[-1],
+            "sar": sar[-1], "trend": trend, "ep": ep, "af": af
+        }
+        state._value = sar[-1]
+        return state
+
+class ATRState(IndicatorState):
+    """
+    ATR 실시간 상태 클래스
+
+    average_true_range()와 동일하게 두 번째 봉부터의 True Range period개 평균 이후 Wilder 평활을 사용합니다.
+    """
+
+    def __init__(self, period=14):
+        """
+        초기화
+
+        Args:
+            period (int): ATR 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "prev_close": np.nan, "trs": (), "atr": np.nan}
+
+    def _step(self, state, high, low, close):
+        index = state["count"]
+        new_state = dict(state, count=index + 1, prev_close=close)
+
+        if index == 0:
+            return new_state, np.nan
+
+        prev_close = state["prev_close"]
+        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+        if index < self.period:
+            new_state["trs"] = state["trs"] + (tr,)
+            return new_state, np.nan
+
+        if index == self.period:
+            atr = np.mean(np.array(state["trs"] + (tr,), dtype=np.float64))
+            new_state["trs"] = ()
+        else:
+            atr = (state["atr"] * (self.period-1) + tr) / self.period
+
+        new_state["atr"] = atr
+        return new_state, atr
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, period=14):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            period (int): ATR 기간
+
+        Returns:
+            ATRState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < period + 1:
+            for high, low, close in zip(high_data, low_data, close_data):
+                state.append(high, low, close)
+            return state
+
+        atr = average_true_range(high_data, low_data, close_data, period)[-1]
+        state._state = {"count": len(close_data), "prev_close": close_data[-1], "trs": (), "atr": atr}
+        state._value = atr
+        return state
+
+class VWAPState(IndicatorState):
+    """
+    VWAP 실시간 상태 클래스
+
+    vwap()과 같이 날짜가 바뀌면(날짜 없이 시간만 주면 시간이 이전 봉 이하로 돌아가면) 누적값을 초기화합니다.
+    """
+
+    def _initial_state(self):
+        return {"count": 0, "date": None, "time": None, "price_volume_sum": 0.0, "volume_sum": 0.0}
+
+    def _step(self, state, high, low, close, volume, date=None, time=None):
+        count = state["count"] + 1
+
+        if count == 1:
+            new_session = True
+        elif date is not None:
+            new_session = date != state["date"]
+        elif time is not None:
+            new_session = float(time) <= float(state["time"])
+        else:
+            new_session = False
+
+        price_volume = (high + low + close) * volume
+        if new_session:
+            price_volume_sum = float(price_volume)
+            volume_sum = float(volume)
+        else:
+            price_volume_sum = state["price_volume_sum"] + price_volume
+            volume_sum = state["volume_sum"] + volume
+
+        value = price_volume_sum / volume_sum / 3 if volume_sum != 0 else np.nan
+        return {
+            "count": count, "date": date, "time": time,
+            "price_volume_sum": price_volume_sum, "volume_sum": volume_sum
+        }, value
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, volume_data, date_data=None, time_data=None):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            volume_data (numpy.ndarray): 거래량 데이터
+            date_data (list or numpy.ndarray): 봉별 날짜
+            time_data (list or numpy.ndarray): 봉별 시간
+
+        Returns:
+            VWAPState: 초기화된 상태 객체
+        """
+        state = cls()
+        length = len(close_data)
+        if length == 0:
+            return state
+
+        # 마지막 세션의 누적값만 있으면 됨
+        if date_data is None and time_data is None:
+            start = 0
+        else:
+            start = int(np.flatnonzero(session_starts(date_data, time_data))[-1])
+
+        price_volume = (np.asarray(high_data[start:], dtype=np.float64) + low_data[start:] + close_data[start:]) \
+            * np.asarray(volume_data[start:], dtype=np.float64)
+        volume = np.asarray(volume_data[start:], dtype=np.float64)
+        session = np.array([0])
+
+        state._state = {
+            "count": length,
+            "date": None if date_data is None else date_data[-1],
+            "time": None if time_data is None else time_data[-1],
+            "price_volume_sum": float(_session_cumsum(price_volume, session, np.empty(len(price_volume)))[-1]),
+            "volume_sum": float(_session_cumsum(volume, session, np.empty(len(volume)))[-1]),
+        }
+        state._value = vwap(high_data, low_data, close_data, volume_data, date_data, time_data)[-1]
+        return state
+
+class CCIState(IndicatorState):
+    """
+    CCI 실시간 상태 클래스
+
+    최근 period개 봉의 (고가 + 저가 + 종가)를 보관합니다.
+    원 단위 가격처럼 정수값 데이터는 commodity_channel_index()와 비트 단위까지 같고,
+    실수 데이터는 이동평균의 합산 순서 차이만큼(반올림 오차 수준) 다를 수 있습니다.
+    """
+
+    def __init__(self, period=20):
+        """
+        초기화
+
+        Args:
+            period (int): CCI 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "window": ()}
+
+    def _step(self, state, high, low, close):
+        count = state["count"] + 1
+        price = high + low + close
+        window = (state["window"] + (price,))[-self.period:]
+        new_state = {"count": count, "window": window}
+
+        if count < self.period:
+            return new_state, np.nan
+
+        mean = sum(window) / self.period
+        deviation = np.mean(np.abs(np.array(window, dtype=np.float64) - mean))
+
+        if deviation == 0:
+            return new_state, 0.0
+        return new_state, (price - mean) / (deviation * 0.015)
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, period=20):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            period (int): CCI 기간
+
+        Returns:
+            CCIState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < period:
+            for high, low, close in zip(high_data, low_data, close_data):
+                state.append(high, low, close)
+            return state
+
+        price = np.asarray(high_data[-period:], dtype=np.float64) + low_data[-period:] + close_data[-period:]
+        state._state = {"count": len(close_data), "window": tuple(price.tolist())}
+        state._value = commodity_channel_index(high_data, low_data, close_data, period)[-1]
+        return state
+
+class WilliamsRState(IndicatorState):
+    """Williams %R 실시간 상태 클래스"""
+
+    def __init__(self, period=14):
+        """
+        초기화
+
+        Args:
+            period (int): 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "highs": (), "lows": ()}
+
+    def _step(self, state, high, low, close):
+        count = state["count"] + 1
+        highs = (state["highs"] + (high,))[-self.period:]
+        lows = (state["lows"] + (low,))[-self.period:]
+        new_state = {"count": count, "highs": highs, "lows": lows}
+
+        if count < self.period:
+            return new_state, np.nan
+
+        high_max = max(highs)
+        price_range = high_max - min(lows)
+        if price_range == 0:
+            return new_state, -50.0
+        return new_state, -100 * (high_max - close) / price_range
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, period=14):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            period (int): 기간
+
+        Returns:
+            WilliamsRState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < period:
+            for high, low, close in zip(high_data, low_data, close_data):
+                state.append(high, low, close)
+            return state
+
+        state._state = {
+            "count": len(close_data),
+            "highs": tuple(np.asarray(high_data[-period:], dtype=np.float64).tolist()),
+            "lows": tuple(np.asarray(low_data[-period:], dtype=np.float64).tolist())
+        }
+        state._value = williams_r(high_data, low_data, close_data, period)[-1]
+        return state
+
+class MFIState(IndicatorState):
+    """
+    MFI 실시간 상태 클래스
+
+    최근 period개 봉의 양/음의 자금 흐름을 보관합니다.
+    원 단위 가격과 정수 거래량은 money_flow_index()와 비트 단위까지 같고,
+    실수 데이터는 구간 합의 합산 순서 차이만큼(반올림 오차 수준) 다를 수 있습니다.
+    """
+
+    def __init__(self, period=14):
+        """
+        초기화
+
+        Args:
+            period (int): MFI 기간
+        """
+        self.period = period
+        super().__init__()
+
+    def _initial_state(self):
+        return {"count": 0, "prev_price": np.nan, "flows": ()}
+
+    def _step(self, state, high, low, close, volume):
+        index = state["count"]
+        price = high + low + close
+        new_state = {"count": index + 1, "prev_price": price, "flows": state["flows"]}
+
+        if index == 0:
+            return new_state, np.nan
+
+        money_flow = price * volume
+        if price > state["prev_price"]:
+            flow = (money_flow, 0.0)
+        elif price < state["prev_price"]:
+            flow = (0.0, money_flow)
+        else:
+            flow = (0.0, 0.0)
+
+        flows = (state["flows"] + (flow,))[-self.period:]
+        new_state["flows"] = flows
+
+        if index < self.period:
+            return new_state, np.nan
+
+        positive_sum = sum(positive for positive, _ in flows)
+        total_sum = sum(negative for _, negative in flows) + positive_sum
+
+        if total_sum == 0:
+            return new_state, 50.0
+        return new_state, 100 * positive_sum / total_sum
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, volume_data, period=14):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            volume_data (numpy.ndarray): 거래량 데이터
+            period (int): MFI 기간
+
+        Returns:
+            MFIState: 초기화된 상태 객체
+        """
+        state = cls(period)
+        close_data = np.asarray(close_data, dtype=np.float64)
+
+        if len(close_data) < period + 1:
+            for high, low, close, volume in zip(high_data, low_data, close_data, volume_data):
+                state.append(high, low, close, volume)
+            return state
+
+        # 최근 period개 자금 흐름 (직전 봉 대표가 필요)
+        price = np.asarray(high_data[-period-1:], dtype=np.float64) + low_data[-period-1:] + close_data[-period-1:]
+        money_flow = price[1:] * np.asarray(volume_data[-period:], dtype=np.float64)
+        positive = np.where(price[1:] > price[:-1], money_flow, 0.0)
+        negative = np.where(price[1:] < price[:-1], money_flow, 0.0)
+
+        state._state = {
+            "count": len(close_data), "prev_price": price[-1],
+            "flows": tuple(zip(positive.tolist(), negative.tolist()))
+        }
+        state._value = money_flow_index(high_data, low_data, close_data, volume_data, period)[-1]
+        return state
+
+class KeltnerState:
+    """
+    켈트너 채널 실시간 상태 클래스
+
+    EMAState와 ATRState를 조합합니다. keltner_channels()와 같이 봉이
+    max(ema_period, atr_period + 1)개 미만이면 값은 모두 NaN입니다.
+    """
+
+    def __init__(self, ema_period=20, atr_period=10, multiplier=2):
+        """
+        초기화
+
+        Args:
+            ema_period (int): 중간선 EMA 기간
+            atr_period (int): ATR 기간
+            multiplier (float): ATR 배수
+        """
+        self.multiplier = multiplier
+        self.ema = EMAState(ema_period)
+        self.atr = ATRState(atr_period)
+        self.min_count = max(ema_period, atr_period + 1)
+        self._value = (np.nan, np.nan, np.nan)
+        self._pending = None
+
+    def _channels(self, middle, atr):
+        """중간선과 ATR로 채널 계산"""
+        band = atr * self.multiplier
+        return (middle, middle + band, middle - band)
+
+    def update(self, high, low, close):
+        """
+        진행 중인 봉의 잠정값 계산
+
+        Args:
+            high (float): 고가
+            low (float): 저가
+            close (float): 종가
+
+        Returns:
+            tuple: (중간선, 상단선, 하단선)
+        """
+        middle = self.ema.update(close)
+        atr = self.atr.update(high, low, close)
+
+        # keltner_channels()의 최소 데이터 길이 미만
+        if self.ema.count + 1 < self.min_count:
+            self._pending = (np.nan, np.nan, np.nan)
+        else:
+            self._pending = self._channels(middle, atr)
+        return self._pending
+
+    def commit(self):
+        """마지막 update() 결과 확정"""
+        if self._pending is not None:
+            self.ema.commit()
+            self.atr.commit()
+            self._value = self._pending
+            self._pending = None
+
+    def rollback(self):
+        """마지막 update() 결과 폐기"""
+        self.ema.rollback()
+        self.atr.rollback()
+        self._pending = None
+
+    def append(self, high, low, close):
+        """
+        완성된 봉 추가 (update 후 commit)
+
+        Returns:
+            tuple: (중간선, 상단선, 하단선)
+        """
+        value = self.update(high, low, close)
+        self.commit()
+        return value
+
+    @property
+    def value(self):
+        """현재 값 (잠정값이 있으면 잠정값)"""
+        if self._pending is not None:
+            return self._pending
+        return self._value
+
+    @property
+    def count(self):
+        """확정된 봉 개수"""
+        return self.ema.count
+
+    @classmethod
+    def from_history(cls, high_data, low_data, close_data, ema_period=20, atr_period=10, multiplier=2):
+        """
+        과거 데이터로 초기화
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            ema_period (int): 중간선 EMA 기간
+            atr_period (int): ATR 기간
+            multiplier (float): ATR 배수
+
+        Returns:
+            KeltnerState: 초기화된 상태 객체
+        """
+        state = cls(ema_period, atr_period, multiplier)
+        state.ema = EMAState.from_history(close_data, ema_period)
+        state.atr = ATRState.from_history(high_data, low_data, close_data, atr_period)
+        if len(close_data) >= state.min_count:
+            state._value = state._channels(state.ema.value, state.atr.value)
+        return state
@@ -0,0 +1,257 @@
+"""
+다중 시간단위 정렬 모듈
+
+분봉 데이터에서 일봉/주봉/월봉을 만들거나(TR 재조회 없이) 별도로 조회한 상위 시간단위 데이터를
+분봉 인덱스에 맞춰 정렬하는 기능을 제공합니다.
+
+각 분봉은 자신이 속한 상위 봉이 아니라 직전에 "완성된" 상위 봉에 대응하므로
+(예: 당일 분봉에는 전일 일봉) 미래 데이터를 참조하지 않습니다.
+대응 관계는 정수 인덱스 배열(index map)로 한 번 계산해 두고, 상위 시간단위 지표 값은
+인덱스 배열로 분봉 길이에 펼칩니다(broadcast).
+
+모든 데이터는 과거 → 최근 순이어야 합니다. 차트 TR 응답은 최근 → 과거 순이므로
+parse_tr() 결과를 직접 사용할 때는 컬럼을 뒤집어야 합니다 (KiwoomChart가 전달하는 데이터는 이미 뒤집혀 있음).
+
+사용 예:
+    frames = MultiTimeframe(minute_data)                  # KiwoomChart.chart_data_received 분봉 데이터
+    ma20 = frames.indicator("day", "moving_average", period=20)   # 분봉 길이, 전일까지의 20일 이동평균
+    daily = frames.bars("day")                            # 분봉으로 만든 일봉
+"""
+
+import numpy as np
+
+from . import indicators
+
+# 지원 시간단위
+TIMEFRAMES = ("day", "week", "month")
+
+def date_numbers(dates):
+    """
+    YYYYMMDD 날짜를 1970-01-01 기준 일수로 변환
+
+    Args:
+        dates (list or numpy.ndarray): "YYYYMMDD" 문자열 또는 정수 날짜
+
+    Returns:
+        numpy.ndarray: int64 일수
+    """
+    values = np.asarray(dates)
+    if len(values) == 0:
+        return np.empty(0, dtype=np.int64)
+
+    # 분봉은 같은 날짜가 연속되므로 날짜가 바뀌는 위치만 변환한 뒤 펼침
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    if len(starts) < len(values):
+        days = date_numbers(values[starts])
+        return np.repeat(days, np.diff(np.append(starts, len(values))))
+
+    if values.dtype.kind in "US":
+        values = np.char.strip(values.astype(str)).astype(np.int64)
+    else:
+        values = values.astype(np.int64)
+
+    months = (values // 10000 - 1970) * 12 + (values // 100 % 100 - 1)
+    days = months.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64)
+    return days + values % 100 - 1
+
+def period_keys(dates, timeframe="day"):
+    """
+    날짜별 상위 시간단위 키
+
+    같은 상위 봉에 속하는 날짜는 같은 키를 가지며, 키는 시간 순서대로 증가합니다.
+
+    Args:
+        dates (list or numpy.ndarray): "YYYYMMDD" 날짜
+        timeframe (str): "day", "week"(월요일 시작) 또는 "month"
+
+    Returns:
+        numpy.ndarray: int64 키
+    """
+    days = date_numbers(dates)
+    if timeframe == "day":
+        return days
+    if timeframe == "week":
+        # 1970-01-01은 목요일이므로 3일을 더해 월요일 기준으로 맞춤
+        return days - (days + 3) % 7
+    if timeframe == "month":
+        return days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    raise ValueError(f"지원하지 않는 시간단위입니다: {timeframe}")
+
+def group_starts(keys):
+    """
+    키가 바뀌는 위치
+
+    Args:
+        keys (numpy.ndarray): 시간 순서의 키
+
+    Returns:
+        numpy.ndarray: 그룹 시작 인덱스 (첫 값은 0)
+    """
+    return np.flatnonzero(indicators.session_starts(keys))
+
+def resample_ohlcv(data, timeframe="day"):
+    """
+    분봉(또는 일봉)을 상위 시간단위 봉으로 변환
+
+    Args:
+        data (dict): date, open, high, low, close, volume 컬럼 (과거 → 최근 순)
+        timeframe (str): "day", "week" 또는 "month"
+
+    Returns:
+        dict: date(상위 봉의 마지막 거래일), open, high, low, close, volume 배열
+    """
+    dates = np.asarray(data["date"])
+    starts = group_starts(period_keys(dates, timeframe))
+    if len(dates) == 0:
+        return {column: np.empty(0) for column in ("date", "open", "high", "low", "close", "volume")}
+
+    ends = np.append(starts[1:], len(dates)) - 1
+    return {
+        "date": dates[ends],
+        "open": np.asarray(data["open"], dtype=np.float64)[starts],
+        "high": np.maximum.reduceat(np.asarray(data["high"], dtype=np.float64), starts),
+        "low": np.minimum.reduceat(np.asarray(data["low"], dtype=np.float64), starts),
+        "close": np.asarray(data["close"], dtype=np.float64)[ends],
+        "volume": np.add.reduceat(np.asarray(data["volume"], dtype=np.float64), starts),
+    }
+
+def completed_index_map(lower_dates, higher_dates, timeframe="day"):
+    """
+    하위 봉별 직전 완성 상위 봉 인덱스
+
+    하위 봉이 속한 상위 봉보다 앞선 상위 봉 중 마지막 봉의 인덱스입니다.
+    상위 봉은 opt10081/opt10082/opt10083 조회 결과나 resample_ohlcv() 결과처럼
+    과거 → 최근 순이어야 합니다.
+
+    Args:
+        lower_dates (list or numpy.ndarray): 하위 봉 날짜 (YYYYMMDD)
+        higher_dates (list or numpy.ndarray): 상위 봉 날짜 (YYYYMMDD)
+        timeframe (str): 상위 봉의 시간단위
+
+    Returns:
+        numpy.ndarray: int64 인덱스 (완성된 상위 봉이 없으면 -1)
+    """
+    lower_keys = period_keys(lower_dates, timeframe)
+    higher_keys = period_keys(higher_dates, timeframe)
+    if np.any(higher_keys[1:] < higher_keys[:-1]):
+        raise ValueError("상위 봉 날짜가 과거 → 최근 순이 아닙니다 (TR 응답 순서라면 뒤집어야 합니다)")
+    return np.searchsorted(higher_keys, lower_keys, side="left") - 1
+
+def broadcast(values, index_map, out=None):
+    """
+    상위 시간단위 값을 하위 봉 길이로 펼침
+
+    Args:
+        values (numpy.ndarray or tuple): 상위 봉 길이의 값 (지표 결과 튜플 가능, 마지막 축이 봉 방향)
+        index_map (numpy.ndarray): completed_index_map() 결과
+        out (numpy.ndarray or tuple): 결과를 저장할 배열
+
+    Returns:
+        numpy.ndarray or tuple: 하위 봉 길이의 값 (대응하는 상위 봉이 없으면 NaN)
+    """
+    if isinstance(values, tuple):
+        outs = out if out is not None else (None,) * len(values)
+        return tuple(broadcast(array, index_map, array_out) for array, array_out in zip(values, outs))
+
+    values = np.asarray(values, dtype=np.float64)
+    missing = index_map < 0
+    result = np.take(values, np.maximum(index_map, 0), axis=-1, out=out)
+    if missing.any():
+        result[..., missing] = np.nan
+    return result
+
+class MultiTimeframe:
+    """
+    다중 시간단위 데이터 클래스
+
+    하위 시간단위(분봉) 데이터 하나로 상위 시간단위 봉과 인덱스 배열을 만들고 보관합니다.
+    상위 봉을 별도로 조회했다면 set_bars()로 지정할 수 있습니다.
+    """
+
+    def __init__(self, data):
+        """
+        초기화
+
+        Args:
+            data (dict): 하위 시간단위 차트 데이터 (date, open, high, low, close, volume, 과거 → 최근 순)
+        """
+        self.data = data
+        self._bars = {}
+        self._index_maps = {}
+
+    def set_bars(self, timeframe, bars):
+        """
+        상위 시간단위 봉 지정 (예: opt10081 일봉 조회 결과)
+
+        Args:
+            timeframe (str): 시간단위
+            bars (dict): 상위 봉 차트 데이터 (과거 → 최근 순)
+        """
+        self._bars[timeframe] = bars
+        self._index_maps.pop(timeframe, None)
+
+    def bars(self, timeframe):
+        """
+        상위 시간단위 봉
+
+        Args:
+            timeframe (str): 시간단위
+
+        Returns:
+            dict: 상위 봉 차트 데이터 (지정하지 않았으면 하위 봉으로 생성)
+        """
+        if timeframe not in self._bars:
+            self._bars[timeframe] = resample_ohlcv(self.data, timeframe)
+        return self._bars[timeframe]
+
+    def index_map(self, timeframe):
+        """
+        하위 봉별 직전 완성 상위 봉 인덱스
+
+        Args:
+            timeframe (str): 시간단위
+
+        Returns:
+            numpy.ndarray: completed_index_map() 결과
+        """
+        if timeframe not in self._index_maps:
+            self._index_maps[timeframe] = completed_index_map(self.data["date"], self.bars(timeframe)["date"], timeframe)
+        return self._index_maps[timeframe]
+
+    def align(self, timeframe, values):
+        """
+        상위 시간단위 값을 하위 봉 길이로 정렬
+
+        Args:
+            timeframe (str): 시간단위
+            values (numpy.ndarray or tuple): 상위 봉 길이의 값
+
+        Returns:
+            numpy.ndarray or tuple: 하위 봉 길이의 값
+        """
+        return broadcast(values, self.index_map(timeframe))
+
+    def indicator(self, timeframe, indicator, columns=None, **params):
+        """
+        상위 시간단위 지표를 계산해 하위 봉 길이로 정렬
+
+        Args:
+            timeframe (str): 시간단위
+            indicator (str): analysis.indicators의 지표 함수 이름
+            columns (tuple): 입력 컬럼 (None이면 단일 입력은 close, 고가/저가/종가 지표는 high, low, close)
+            **params: 지표 파라미터
+
+        Returns:
+            numpy.ndarray or tuple: 하위 봉 길이의 지표 값
+        """
+        bars = self.bars(timeframe)
+        function = getattr(indicators, indicator)
+        if columns is None:
+            columns = _default_columns(function)
+        return self.align(timeframe, function(*[bars[column] for column in columns], **params))
+
+def _default_columns(function):
+    """지표 함수 인자 이름으로 입력 컬럼 결정"""
+    names = {"data": "close", "high_data": "high", "low_data": "low", "close_data": "close", "volume_data": "volume"}
+    code = function.__code__
+    return tuple(names[name] for name in code.co_varnames[:code.co_argcount] if name in names)
@@ -0,0 +1,383 @@
+"""
+차트 변환 모듈
+
+컬럼형 OHLCV 차트 데이터(date, time, open, high, low, close, volume)를
+헤이킨아시, 렌코, 삼선전환도로 변환하는 단계(stage)를 제공합니다.
+이미 받은 봉 데이터를 로컬에서 변환하므로 차트 종류를 바꿀 때 TR을 다시 요청하지 않으며,
+봉이 추가되면 append()로 마지막 상태에서 이어서 새 봉만 변환합니다.
+
+변환 결과는 같은 컬럼을 가진 딕셔너리이며, 렌코/삼선전환도는 원본 봉과 개수가 다르므로
+각 결과 봉이 완성된 원본 봉 위치를 "index" 컬럼으로 함께 반환합니다.
+
+사용 예:
+    pipeline = TransformPipeline([HeikinAshiTransform()])
+    candles = pipeline.transform(chart_data)   # 전체 변환
+    pipeline.append(new_bars)                  # 추가된 봉만 변환, pipeline.output에 누적
+"""
+
+import numpy as np
+
+from .backend import kernel
+from .incremental import GrowableArray
+from .indicators import average_true_range
+
+# 변환에 사용하는 차트 컬럼 (next 등 다른 키는 무시)
+CHART_COLUMNS = ("date", "time", "open", "high", "low", "close", "volume")
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+def _columns(data):
+    """변환 입력 준비 (가격/거래량은 float64 배열, 날짜/시간은 배열)"""
+    columns = {}
+    for column in CHART_COLUMNS:
+        if column not in data:
+            continue
+        if column == "date" or column == "time":
+            columns[column] = np.asarray(data[column])
+        else:
+            columns[column] = np.asarray(data[column], dtype=np.float64)
+    return columns
+
+def _length(data):
+    """데이터 봉 개수"""
+    return len(data["close"]) if "close" in data else 0
+
+class ChartTransform:
+    """
+    차트 변환 단계 기본 클래스
+
+    하위 클래스는 reset()으로 상태를 초기화하고, _process(data, offset)에서 새 봉을 변환해
+    결과 컬럼 딕셔너리를 반환합니다. offset은 새 봉의 첫 원본 위치입니다.
+    누적 결과는 컬럼별 GrowableArray에 새 결과 봉만 기록하므로 append() 비용은 전체 이력이 아니라
+    새 봉 수에 비례합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self.buffers = {}
+        self.source_length = 0
+        self.reset()
+
+    @property
+    def output(self):
+        """누적 변환 결과 (버퍼의 뷰, 다음 append() 전까지 유효)"""
+        return {column: buffer.view() for column, buffer in self.buffers.items()}
+
+    def reset(self):
+        """변환 상태 초기화"""
+
+    def _process(self, data, offset):
+        """
+        새 봉 변환
+
+        Args:
+            data (dict): 새 봉의 컬럼 데이터
+            offset (int): 새 봉의 첫 원본 위치
+
+        Returns:
+            dict: 변환 결과 컬럼
+        """
+        raise NotImplementedError
+
+    def transform(self, data):
+        """
+        전체 데이터 변환 (이전 상태 폐기)
+
+        Args:
+            data (dict): 컬럼형 차트 데이터 (과거 → 최근 순)
+
+        Returns:
+            dict: 변환 결과
+        """
+        self.reset()
+        self.buffers = {}
+        self.source_length = 0
+        return self.append(data)
+
+    def append(self, data):
+        """
+        추가된 봉 변환
+
+        Args:
+            data (dict): 새 봉의 컬럼형 차트 데이터
+
+        Returns:
+            dict: 새 봉의 변환 결과 (전체 결과는 output에 누적)
+        """
+        data = _columns(data)
+        result = self._process(data, self.source_length)
+        self.source_length += _length(data)
+
+        if not self.buffers:
+            self.buffers = {
+                column: GrowableArray(len(values) * 2, np.asarray(values).dtype) for column, values in result.items()
+            }
+        for column, buffer in self.buffers.items():
+            buffer.write(buffer.length, result[column])
+        return result
+
+class HeikinAshiTransform(ChartTransform):
+    """
+    헤이킨아시 변환 클래스
+
+    HA 종가 = (시가 + 고가 + 저가 + 종가) / 4
+    HA 시가 = (이전 HA 시가 + 이전 HA 종가) / 2 (첫 봉은 (시가 + 종가) / 2)
+    HA 고가/저가 = 고가/저가와 HA 시가/종가 중 최대/최소
+
+    HA 시가의 재귀식은 이전 HA 종가에 대한 평활 계수 0.5의 지수 평활이므로
+    EMA 백엔드 커널로 계산합니다.
+    """
+
+    def reset(self):
+        self.last_open = None
+        self.last_close = None
+
+    def _process(self, data, offset):
+        length = _length(data)
+        result = {"index": np.arange(offset, offset + length)}
+        result.update((column, values) for column, values in data.items() if column not in PRICE_COLUMNS)
+        if length == 0:
+            return {**result, **{column: np.empty(0) for column in PRICE_COLUMNS}}
+
+        ha_close = data["open"] + data["high"]
+        ha_close += data["low"]
+        ha_close += data["close"]
+        ha_close /= 4
+
+        # ha_open[i] = ha_close[i-1] * 0.5 + ha_open[i-1] * 0.5
+        shifted = np.empty(length)
+        shifted[1:] = ha_close[:-1]
+        if self.last_open is None:
+            seed = (data["open"][0] + data["close"][0]) / 2
+        else:
+            seed = (self.last_open + self.last_close) / 2
+        ha_open = np.empty(length)
+        kernel("ema")(shifted, 0.5, 0, seed, ha_open)
+
+        result["open"] = ha_open
+        result["high"] = np.maximum(np.maximum(data["high"], ha_open), ha_close)
+        result["low"] = np.minimum(np.minimum(data["low"], ha_open), ha_close)
+        result["close"] = ha_close
+
+        self.last_open, self.last_close = ha_open[-1], ha_close[-1]
+        return result
+
+def _brick_output(data, offset, events, volume_state):
+    """
+    벽돌/선 이벤트를 결과 컬럼으로 변환
+
+    Args:
+        data (dict): 새 봉의 컬럼 데이터
+        offset (int): 새 봉의 첫 원본 위치
+        events (list): (원본 위치(새 봉 기준), 시가, 종가) 목록
+        volume_state (list): [이전 이벤트 이후 누적 거래량] (이벤트 사이 거래량을 다음 결과 봉에 배분)
+
+    Returns:
+        dict: index, date/time(있으면), open, high, low, close, volume 컬럼
+    """
+    positions = np.array([event[0] for event in events], dtype=np.int64)
+    opens = np.array([event[1] for event in events], dtype=np.float64)
+    closes = np.array([event[2] for event in events], dtype=np.float64)
+
+    result = {"index": positions + offset}
+    for column in ("date", "time"):
+        if column in data:
+            result[column] = data[column][positions]
+    result["open"] = opens
+    result["high"] = np.maximum(opens, closes)
+    result["low"] = np.minimum(opens, closes)
+    result["close"] = closes
+
+    # 이전 결과 봉 이후의 거래량을 각 이벤트의 첫 결과 봉에 배분
+    volume = np.zeros(len(events))
+    if "volume" in data:
+        cumulative = np.cumsum(data["volume"])
+        first = np.ones(len(events), dtype=np.bool_)
+        first[1:] = positions[1:] != positions[:-1]
+        event_positions = positions[first]
+        totals = cumulative[event_positions] if len(event_positions) else np.empty(0)
+        volume[first] = np.diff(totals, prepend=0.0)
+        if len(event_positions):
+            volume[np.flatnonzero(first)[0]] += volume_state[0]
+            volume_state[0] = cumulative[-1] - totals[-1]
+        else:
+            volume_state[0] += cumulative[-1] if len(cumulative) else 0.0
+    result["volume"] = volume
+    return result
+
+class RenkoTransform(ChartTransform):
+    """
+    렌코 변환 클래스
+
+    종가가 마지막 벽돌보다 box_size 이상 같은 방향으로 움직이면 벽돌을 추가하고,
+    반대 방향은 2 × box_size 이상 움직여야 벽돌을 추가합니다. 벽돌 경계는 첫 종가 기준
+    box_size 격자에 있으므로, 종가의 격자 칸(floor/ceil)이 바뀐 봉에서만 벽돌이 생길 수 있습니다.
+    이 봉만 골라 순차 판정하므로 대부분의 봉은 벡터 연산으로 건너뜁니다.
+    """
+
+    def __init__(self, box_size=None, atr_period=14):
+        """
+        초기화
+
+        Args:
+            box_size (float): 벽돌 크기 (None이면 첫 변환 데이터의 마지막 ATR)
+            atr_period (int): 자동 벽돌 크기에 사용할 ATR 기간
+        """
+        self.fixed_box_size = box_size
+        self.atr_period = atr_period
+        super().__init__()
+
+    def reset(self):
+        self.box_size = self.fixed_box_size
+        self.base = None      # 격자 기준 가격 (첫 종가)
+        self.top = 0          # 마지막 벽돌 윗변 (격자 칸)
+        self.bottom = 0       # 마지막 벽돌 아랫변 (격자 칸)
+        self.volume_state = [0.0]
+
+    def _auto_box_size(self, data):
+        """마지막 ATR (계산할 수 없으면 마지막 종가의 1%)"""
+        atr = average_true_range(data["high"], data["low"], data["close"], self.atr_period)
+        valid = atr[~np.isnan(atr)]
+        if len(valid) and valid[-1] > 0:
+            return float(valid[-1])
+        return max(abs(float(data["close"][-1])) * 0.01, 1.0)
+
+    def _process(self, data, offset):
+        events = []
+        close = data["close"]
+        if len(close):
+            if self.box_size is None:
+                self.box_size = self._auto_box_size(data)
+            if self.base is None:
+                self.base = float(close[0])
+
+            level = (close - self.base) / self.box_size
+            upper_cell = np.floor(level)
+            lower_cell = np.ceil(level)
+
+            # 격자 칸이 바뀐 봉 (첫 봉은 직전 상태와 비교)
+            changed = np.ones(len(close), dtype=np.bool_)
+            changed[1:] = (upper_cell[1:] != upper_cell[:-1]) | (lower_cell[1:] != lower_cell[:-1])
+
+            top, bottom = self.top, self.bottom
+            for position, up, down in zip(np.flatnonzero(changed).tolist(), upper_cell[changed].tolist(),
+                                          lower_cell[changed].tolist()):
+                if up > top:
+                    for cell in range(int(top), int(up)):
+                        events.append((position, self.base + cell * self.box_size, self.base + (cell + 1) * self.box_size))
+                    top, bottom = up, up - 1
+                elif down < bottom:
+                    for cell in range(int(bottom), int(down), -1):
+                        events.append((position, self.base + cell * self.box_size, self.base + (cell - 1) * self.box_size))
+                    bottom, top = down, down + 1
+            self.top, self.bottom = top, bottom
+
+        return _brick_output(data, offset, events, self.volume_state)
+
+class LineBreakTransform(ChartTransform):
+    """
+    삼선전환도(line break) 변환 클래스
+
+    종가가 마지막 선의 최고가를 넘으면 상승선, 최저가 아래면 하락선을 추가합니다.
+    추세를 전환하는 선은 최근 lines개 선의 극값(상승 중이면 최저가, 하락 중이면 최고가)을
+    넘어야 합니다.
+    """
+
+    def __init__(self, lines=3):
+        """
+        초기화
+
+        Args:
+            lines (int): 전환에 필요한 선 개수
+        """
+        self.lines = lines
+        super().__init__()
+
+    def reset(self):
+        self.recent = []         # 최근 lines개 선의 (시가, 종가)
+        self.reference = None    # 첫 선 이전 기준 종가
+        self.volume_state = [0.0]
+
+    def _process(self, data, offset):
+        events = []
+        recent = self.recent
+        for position, close in enumerate(data["close"].tolist()):
+            if self.reference is None:
+                self.reference = close
+                continue
+
+            if not recent:
+                if close != self.reference:
+                    line = (self.reference, close)
+                else:
+                    continue
+            else:
+                last_open, last_close = recent[-1]
+                rising = last_close > last_open
+                highest = max(max(line) for line in recent)
+                lowest = min(min(line) for line in recent)
+                if rising and close > last_close:
+                    line = (last_close, close)
+                elif rising and close < lowest:
+                    line = (last_open, close)
+                elif not rising and close < last_close:
+                    line = (last_close, close)
+                elif not rising and close > highest:
+                    line = (last_open, close)
+                else:
+                    continue
+
+            events.append((position, line[0], line[1]))
+            recent.append(line)
+            del recent[:-self.lines]
+
+        return _brick_output(data, offset, events, self.volume_state)
+
+class TransformPipeline:
+    """
+    차트 변환 파이프라인 클래스
+
+    여러 변환 단계를 순서대로 적용합니다 (예: 헤이킨아시 → 렌코).
+    append()는 각 단계에 앞 단계의 새 결과만 전달하므로 전체를 다시 변환하지 않습니다.
+    """
+
+    def __init__(self, stages):
+        """
+        초기화
+
+        Args:
+            stages (list): ChartTransform 목록
+        """
+        self.stages = list(stages)
+
+    @property
+    def output(self):
+        """마지막 단계의 전체 결과"""
+        return self.stages[-1].output if self.stages else {}
+
+    def transform(self, data):
+        """
+        전체 데이터 변환
+
+        Args:
+            data (dict): 컬럼형 차트 데이터
+
+        Returns:
+            dict: 마지막 단계의 결과
+        """
+        for stage in self.stages:
+            data = stage.transform(data)
+        return data
+
+    def append(self, data):
+        """
+        추가된 봉 변환
+
+        Args:
+            data (dict): 새 봉의 컬럼형 차트 데이터
+
+        Returns:
+            dict: 마지막 단계의 새 결과
+        """
+        for stage in self.stages:
+            data = stage.append(data)
+        return data
@@ -0,0 +1,562 @@
+"""
+종목 전체(universe) 일괄 지표 계산 모듈
+
+이 모듈은 (종목 × 봉) 형태의 2차원 배열을 입력받아 모든 종목의 기술적 지표를
+한 번의 벡터 연산으로 계산하는 함수를 제공합니다. 함수 이름과 인자는
+analysis.indicators의 같은 이름 함수와 동일합니다.
+
+종목마다 상장일이 달라 이력 길이가 다른 경우, 짧은 종목은 앞쪽을 NaN으로 채워
+최근 봉이 같은 열에 오도록 오른쪽 정렬합니다(to_matrix 참고).
+각 행의 결과는 해당 행의 유효 구간(앞쪽 NaN 제외)에 analysis.indicators 함수를
+적용한 결과와 같고, 유효 구간 이전은 NaN입니다.
+"""
+
+import numpy as np
+
+from .rolling import rolling_mean, rolling_mean_bank, rolling_mean_var, rolling_max, rolling_min
+
+def to_matrix(series_list, length=None):
+    """
+    종목별 시계열 목록을 오른쪽 정렬된 2차원 배열로 변환
+
+    Args:
+        series_list (list): 종목별 가격 데이터 목록 (과거 → 최근 순)
+        length (int): 봉 개수. None이면 가장 긴 시계열 길이
+
+    Returns:
+        numpy.ndarray: (종목 × 봉) 배열. 데이터가 없는 앞쪽은 NaN
+    """
+    if length is None:
+        length = max((len(series) for series in series_list), default=0)
+
+    matrix = np.full((len(series_list), length), np.nan)
+    for row, series in enumerate(series_list):
+        values = np.asarray(series, dtype=np.float64)[-length:] if length else []
+        if len(values):
+            matrix[row, length-len(values):] = values
+
+    return matrix
+
+def _as_matrix(data):
+    """입력 데이터를 2차원 float64 배열로 변환"""
+    return np.atleast_2d(np.asarray(data, dtype=np.float64))
+
+def _first_valid_index(matrix):
+    """
+    행별 첫 번째 유효값 위치
+
+    Args:
+        matrix (numpy.ndarray): (종목 × 봉) 배열
+
+    Returns:
+        numpy.ndarray: 행별 첫 유효값 인덱스 (전부 NaN이면 봉 개수)
+    """
+    valid = ~np.isnan(matrix)
+    first = valid.argmax(axis=1)
+    first[~valid.any(axis=1)] = matrix.shape[1]
+    return first
+
+def _mask_short_rows(arrays, first_valid, length, min_length):
+    """
+    유효 구간이 min_length보다 짧은 행을 NaN으로 설정 (1차원 함수의 조기 반환과 동일)
+
+    Args:
+        arrays (list): 결과 배열 목록
+        first_valid (numpy.ndarray): 행별 첫 유효값 인덱스
+        length (int): 봉 개수
+        min_length (int): 최소 유효 구간 길이
+    """
+    short = (length - first_valid) < min_length
+    if short.any():
+        for array in arrays:
+            array[short] = np.nan
+
+def _gather_windows(matrix, starts, period):
+    """
+    행별 시작 위치부터 period개 값 추출
+
+    Args:
+        matrix (numpy.ndarray): (종목 × 봉) 배열
+        starts (numpy.ndarray): 행별 시작 인덱스
+        period (int): 구간 길이
+
+    Returns:
+        numpy.ndarray: (종목 × period) 배열
+    """
+    rows = np.arange(matrix.shape[0])[:, None]
+    return matrix[rows, starts[:, None] + np.arange(period)]
+
+def _ema_matrix(values, period, first_valid):
+    """
+    행별 지수 이동평균 계산
+
+    exponential_moving_average()와 동일하게 각 행의 처음 period개 유효값 평균으로 시작합니다.
+    재귀 계산은 봉 방향으로 진행하되 종목 방향으로 벡터화합니다.
+
+    Args:
+        values (numpy.ndarray): (종목 × 봉) 배열
+        period (int): 이동평균 기간
+        first_valid (numpy.ndarray): 행별 첫 유효값 인덱스
+
+    Returns:
+        numpy.ndarray: 지수 이동평균
+    """
+    row_count, length = values.shape
+    ema = np.full((length, row_count), np.nan)
+
+    seed_index = first_valid + period - 1
+    seeded = np.flatnonzero(seed_index < length)
+    if len(seeded) == 0:
+        return ema.T.copy()
+
+    ema[seed_index[seeded], seeded] = _gather_windows(values[seeded], first_valid[seeded], period).mean(axis=1)
+
+    k = 2 / (period + 1)
+    columns = values.T.copy()
+
+    for i in range(seed_index[seeded].min() + 1, length):
+        active = i > seed_index
+        ema[i] = np.where(active, columns[i] * k + ema[i-1] * (1-k), ema[i])
+
+    return ema.T.copy()
+
+def moving_average(data, period=20):
+    """
+    이동평균선 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        period (int): 이동평균 기간
+
+    Returns:
+        numpy.ndarray: 이동평균 데이터
+    """
+    return rolling_mean(_as_matrix(data), period)
+
+def moving_average_bank(data, periods=(5, 10, 20, 60, 120), out=None):
+    """
+    여러 기간의 이동평균선 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        periods (list): 이동평균 기간 목록
+        out (numpy.ndarray): 결과를 저장할 (기간 수 × 종목 × 봉) 배열 (선택)
+
+    Returns:
+        numpy.ndarray: (기간 수 × 종목 × 봉) 형태의 이동평균 데이터
+    """
+    return rolling_mean_bank(_as_matrix(data), periods, out)
+
+def exponential_moving_average(data, period=20):
+    """
+    지수 이동평균선 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        period (int): 이동평균 기간
+
+    Returns:
+        numpy.ndarray: 지수 이동평균 데이터
+    """
+    values = _as_matrix(data)
+    return _ema_matrix(values, period, _first_valid_index(values))
+
+def bollinger_bands(data, period=20, std_dev=2):
+    """
+    볼린저 밴드 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        period (int): 이동평균 기간
+        std_dev (float): 표준편차 배수
+
+    Returns:
+        tuple: (중간선, 상단선, 하단선)
+    """
+    middle, var = rolling_mean_var(_as_matrix(data), period)
+    std = np.sqrt(var)
+
+    return middle, middle + std_dev * std, middle - std_dev * std
+
+def macd(data, fast_period=12, slow_period=26, signal_period=9):
+    """
+    MACD 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        fast_period (int): 빠른 EMA 기간
+        slow_period (int): 느린 EMA 기간
+        signal_period (int): 시그널 EMA 기간
+
+    Returns:
+        tuple: (MACD 라인, 시그널 라인, 히스토그램)
+    """
+    values = _as_matrix(data)
+    first_valid = _first_valid_index(values)
+
+    macd_line = _ema_matrix(values, fast_period, first_valid) - _ema_matrix(values, slow_period, first_valid)
+    signal_line = _ema_matrix(macd_line, signal_period, first_valid + max(fast_period, slow_period) - 1)
+    histogram = macd_line - signal_line
+
+    _mask_short_rows([macd_line, signal_line, histogram], first_valid, values.shape[1], slow_period + signal_period)
+
+    return macd_line, signal_line, histogram
+
+def rsi(data, period=14):
+    """
+    RSI 일괄 계산
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 가격 데이터
+        period (int): RSI 기간
+
+    Returns:
+        numpy.ndarray: RSI 데이터
+    """
+    values = _as_matrix(data)
+    row_count, length = values.shape
+    first_valid = _first_valid_index(values)
+
+    rsi_values = np.full((length, row_count), np.nan)
+    seed_index = first_valid + period
+    seeded = np.flatnonzero(seed_index < length)
+    if len(seeded) == 0:
+        return rsi_values.T.copy()
+
+    # 상승, 하락 구분
+    delta = np.zeros_like(values)
+    delta[:, 1:] = values[:, 1:] - values[:, :-1]
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    # 첫 번째 평균
+    avg_gain = np.full(row_count, np.nan)
+    avg_loss = np.full(row_count, np.nan)
+    seed_gain = _gather_windows(gain[seeded], first_valid[seeded] + 1, period).mean(axis=1)
+    seed_loss = _gather_windows(loss[seeded], first_valid[seeded] + 1, period).mean(axis=1)
+
+    gain_columns = gain.T.copy()
+    loss_columns = loss.T.copy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(seed_index[seeded].min(), length):
+            starting = np.flatnonzero(seed_index[seeded] == i)
+            avg_gain = (avg_gain * (period-1) + gain_columns[i]) / period
+            avg_loss = (avg_loss * (period-1) + loss_columns[i]) / period
+            if len(starting):
+                avg_gain[seeded[starting]] = seed_gain[starting]
+                avg_loss[seeded[starting]] = seed_loss[starting]
+
+            rs = np.where(avg_loss == 0, 100, avg_gain / avg_loss)
+            rsi_values[i] = np.where(i >= seed_index, 100 - (100 / (1 + rs)), np.nan)
+
+    return rsi_values.T.copy()
+
+def stochastic(high_data, low_data, close_data, k_period=14, d_period=3):
+    """
+    스토캐스틱 일괄 계산
+
+    Args:
+        high_data (numpy.ndarray): (종목 × 봉) 고가 데이터
+        low_data (numpy.ndarray): (종목 × 봉) 저가 데이터
+        close_data (numpy.ndarray): (종목 × 봉) 종가 데이터
+        k_period (int): %K 기간
+        d_period (int): %D 기간
+
+    Returns:
+        tuple: (%K, %D)
+    """
+    close = _as_matrix(close_data)
+    high_max = rolling_max(_as_matrix(high_data), k_period)
+    low_min = rolling_min(_as_matrix(low_data), k_period)
+    price_range = high_max - low_min
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * (close - low_min) / price_range
+    k[price_range == 0] = 50
+
+    d = rolling_mean(k, d_period)
+
+    _mask_short_rows([k, d], _first_valid_index(close), close.shape[1], k_period + d_period)
+
+    return k, d
+
+def ichimoku_cloud(high_data, low_data, close_data, tenkan_period=9, kijun_period=26, senkou_span_b_period=52, displacement=26):
+    """
+    일목균형표 일괄 계산
+
+    Args:
+        high_data (numpy.ndarray): (종목 × 봉) 고가 데이터
+        low_data (numpy.ndarray): (종목 × 봉) 저가 데이터
+        close_data (numpy.ndarray): (종목 × 봉) 종가 데이터
+        tenkan_period (int): 전환선 기간
+        kijun_period (int): 기준선 기간
+        senkou_span_b_period (int): 선행스팬 B 기간
+        displacement (int): 이격 기간
+
+    Returns:
+        tuple: (전환선, 기준선, 선행스팬 A, 선행스팬 B, 후행스팬)
+    """
+    high = _as_matrix(high_data)
+    low = _as_matrix(low_data)
+    close = _as_matrix(close_data)
+    length = close.shape[1]
+
+    first_valid = _first_valid_index(close)
+    position = np.arange(length) - first_valid[:, None]  # 유효 구간 기준 위치
+
+    # 전환선, 기준선
+    tenkan_sen = (rolling_max(high, tenkan_period) + rolling_min(low, tenkan_period)) / 2
+    kijun_sen = (rolling_max(high, kijun_period) + rolling_min(low, kijun_period)) / 2
+
+    def shift_forward(values, start):
+        """displacement만큼 뒤로 이동하고, 유효 구간의 시작 전 위치는 0으로 설정"""
+        shifted = np.zeros_like(values)
+        shifted[:, displacement:] = values[:, :length-displacement]
+        shifted[position < start + displacement] = 0
+        return shifted
+
+    # 선행스팬 A, B
+    senkou_span_a = shift_forward((tenkan_sen + kijun_sen) / 2, kijun_period - 1)
+    span_b = (rolling_max(high, senkou_span_b_period) + rolling_min(low, senkou_span_b_period)) / 2
+    senkou_span_b = shift_forward(span_b, senkou_span_b_period - 1)
+
+    # 후행스팬
+    chikou_span = np.zeros_like(close)
+    chikou_span[:, :length-displacement] = close[:, displacement:]
+
+    outputs = [tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b, chikou_span]
+    for output in outputs[2:]:
+        output[position < 0] = np.nan
+
+    _mask_short_rows(outputs, first_valid, length, max(tenkan_period, kijun_period, senkou_span_b_period) + displacement)
+
+    return tuple(outputs)
+
+def on_balance_volume(close_data, volume_data):
+    """
+    OBV 일괄 계산
+
+    Args:
+        close_data (numpy.ndarray): (종목 × 봉) 종가 데이터
+        volume_data (numpy.ndarray): (종목 × 봉) 거래량 데이터
+
+    Returns:
+        numpy.ndarray: OBV 데이터
+    """
+    close = _as_matrix(close_data)
+    volume = _as_matrix(volume_data)
+    length = close.shape[1]
+    first_valid = _first_valid_index(close)
+    position = np.arange(length) - first_valid[:, None]
+
+    # 봉별 증감량 (첫 유효 봉은 거래량 그대로)
+    step = np.zeros_like(close)
+    step[:, 1:] = np.where(close[:, 1:] > close[:, :-1], volume[:, 1:],
+                           np.where(close[:, 1:] < close[:, :-1], -volume[:, 1:], 0.0))
+    step[position < 0] = 0.0
+    start = position == 0
+    step[start] = volume[start]
+
+    obv = np.cumsum(step, axis=1)
+    obv[position < 0] = np.nan
+
+    _mask_short_rows([obv], first_valid, length, 2)
+
+    return obv
+
+def average_directional_index(high_data, low_data, close_data, period=14):
+    """
+    ADX 일괄 계산
+
+    Args:
+        high_data (numpy.ndarray): (종목 × 봉) 고가 데이터
+        low_data (numpy.ndarray): (종목 × 봉) 저가 데이터
+        close_data (numpy.ndarray): (종목 × 봉) 종가 데이터
+        period (int): ADX 기간
+
+    Returns:
+        tuple: (ADX, +DI, -DI)
+    """
+    high = _as_matrix(high_data)
+    low = _as_matrix(low_data)
+    close = _as_matrix(close_data)
+    row_count, length = close.shape
+    first_valid = _first_valid_index(close)
+
+    adx = np.full((length, row_count), np.nan)
+    plus_di = np.full((length, row_count), np.nan)
+    minus_di = np.full((length, row_count), np.nan)
+
+    seeded = np.flatnonzero(first_valid + period * 2 <= length)
+    if len(seeded) == 0:
+        return adx.T.copy(), plus_di.T.copy(), minus_di.T.copy()
+
+    # True Range, Directional Movement
+    tr = np.zeros_like(close)
+    tr[:, 1:] = np.maximum(np.maximum(high[:, 1:] - low[:, 1:], np.abs(high[:, 1:] - close[:, :-1])),
+                           np.abs(low[:, 1:] - close[:, :-1]))
+
+    up_move = np.zeros_like(close)
+    down_move = np.zeros_like(close)
+    up_move[:, 1:] = high[:, 1:] - high[:, :-1]
+    down_move[:, 1:] = low[:, :-1] - low[:, 1:]
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0.0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0.0)
+
+    # 첫 번째 평활값 (행별 period개 합)
+    di_start = first_valid + period
+    adx_start = first_valid + period * 2 - 1
+    seed_tr = _gather_windows(tr[seeded], first_valid[seeded] + 1, period).sum(axis=1)
+    seed_plus = _gather_windows(plus_dm[seeded], first_valid[seeded] + 1, period).sum(axis=1)
+    seed_minus = _gather_windows(minus_dm[seeded], first_valid[seeded] + 1, period).sum(axis=1)
+
+    tr_columns = tr.T.copy()
+    plus_columns = plus_dm.T.copy()
+    minus_columns = minus_dm.T.copy()
+
+    smoothed_tr = np.full(row_count, np.nan)
+    smoothed_plus = np.full(row_count, np.nan)
+    smoothed_minus = np.full(row_count, np.nan)
+    adx_value = np.full(row_count, np.nan)
+    dx_sum_rows = np.zeros((row_count, period))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(di_start[seeded].min(), length):
+            smoothed_tr = smoothed_tr - (smoothed_tr / period) + tr_columns[i]
+            smoothed_plus = smoothed_plus - (smoothed_plus / period) + plus_columns[i]
+            smoothed_minus = smoothed_minus - (smoothed_minus / period) + minus_columns[i]
+
+            starting = np.flatnonzero(di_start[seeded] == i)
+            if len(starting):
+                smoothed_tr[seeded[starting]] = seed_tr[starting]
+                smoothed_plus[seeded[starting]] = seed_plus[starting]
+                smoothed_minus[seeded[starting]] = seed_minus[starting]
+
+            # Directional Indicators, DX
+            pdi = np.where(smoothed_tr == 0, 0.0, 100 * smoothed_plus / smoothed_tr)
+            mdi = np.where(smoothed_tr == 0, 0.0, 100 * smoothed_minus / smoothed_tr)
+            di_total = pdi + mdi
+            dx = np.where(di_total == 0, 0.0, 100 * np.abs(pdi - mdi) / di_total)
+
+            active = i >= di_start
+            plus_di[i] = np.where(active, pdi, np.nan)
+            minus_di[i] = np.where(active, mdi, np.nan)
+
+            # ADX (처음 period개 DX 평균 후 Wilder 평활)
+            warming = active & (i <= adx_start)
+            dx_sum_rows[warming, i - di_start[warming]] = dx[warming]
+
+            adx_value = (adx_value * (period-1) + dx) / period
+            starting = np.flatnonzero(adx_start == i)
+            if len(starting):
+                adx_value[starting] = dx_sum_rows[starting].mean(axis=1)
+            adx[i] = np.where(i >= adx_start, adx_value, np.nan)
+
+    adx, plus_di, minus_di = adx.T.copy(), plus_di.T.copy(), minus_di.T.copy()
+    _mask_short_rows([adx, plus_di, minus_di], first_valid, length, period * 2)
+
+    return adx, plus_di, minus_di
+
+def parabolic_sar(high_data, low_data, close_data, af_start=0.02, af_increment=0.02, af_max=0.2):
+    """
+    Parabolic SAR 일괄 계산
+
+    Args:
+        high_data (numpy.ndarray): (종목 × 봉) 고가 데이터
+        low_data (numpy.ndarray): (종목 × 봉) 저가 데이터
+        close_data (numpy.ndarray): (종목 × 봉) 종가 데이터
+        af_start (float): 초기 가속 계수
+        af_increment (float): 가속 계수 증가분
+        af_max (float): 최대 가속 계수
+
+    Returns:
+        numpy.ndarray: Parabolic SAR 데이터
+    """
+    high = _as_matrix(high_data).T.copy()
+    low = _as_matrix(low_data).T.copy()
+    close = _as_matrix(close_data)
+    row_count, length = close.shape
+    first_valid = _first_valid_index(close)
+
+    sar = np.full((length, row_count), np.nan)
+    started = np.flatnonzero(first_valid < length)
+    if len(started) == 0:
+        return sar.T.copy()
+
+    # 초기값 설정
+    trend = np.ones(row_count)
+    ep = np.full(row_count, np.nan)
+    af = np.full(row_count, af_start)
+    sar[first_valid[started], started] = low[first_valid[started], started]
+    ep[started] = high[first_valid[started], started]
+
+    for i in range(first_valid[started].min() + 1, length):
+        active = i > first_valid
+        prev_sar = sar[i-1]
+        current = prev_sar + af * (ep - prev_sar)
+
+        # 추세 전환 확인
+        rising = trend == 1
+        reverse_down = active & rising & ((current > low[i]) | (current > low[i-1]))
+        reverse_up = active & ~rising & ((current < high[i]) | (current < high[i-1]))
+        extend_up = active & rising & ~reverse_down & (high[i] > ep)
+        extend_down = active & ~rising & ~reverse_up & (low[i] < ep)
+
+        current = np.where(reverse_down, np.maximum(high[i], high[i-1]), current)
+        current = np.where(reverse_up, np.minimum(low[i], low[i-1]), current)
+        sar[i] = np.where(active, current, sar[i])
+
+        ep = np.where(reverse_down | extend_down, low[i], ep)
+        ep = np.where(reverse_up | extend_up, high[i], ep)
+        af = np.where(extend_up | extend_down, np.minimum(af + af_increment, af_max), af)
+        af = np.where(reverse_down | reverse_up, af_start, af)
+        trend = np.where(reverse_down, -1, np.where(reverse_up, 1, trend))
+
+    sar = sar.T.copy()
+    _mask_short_rows([sar], first_valid, length, 2)
+
+    return sar
+
+def cross_sectional_rank(data, pct=True):
+    """
+    봉별 종목 간 순위 (횡단면 순위)
+
+    각 봉(열)에서 종목 값의 순위를 계산합니다. 같은 값은 평균 순위를 사용하고
+    (pandas rank(method="average")와 같음), NaN인 종목은 순위에서 제외되어 NaN입니다.
+
+    Args:
+        data (numpy.ndarray): (종목 × 봉) 데이터 (예: 수익률, 거래량 백분위)
+        pct (bool): True이면 백분위 순위 (순위 / 유효 종목 수 × 100), False이면 1부터 시작하는 순위
+
+    Returns:
+        numpy.ndarray: (종목 × 봉) 순위
+    """
+    matrix = _as_matrix(data)
+    count = matrix.shape[0]
+
+    # 열별 정렬 (NaN은 뒤쪽)
+    order = np.argsort(matrix, axis=0, kind="stable")
+    sorted_values = np.take_along_axis(matrix, order, axis=0)
+    positions = np.broadcast_to(np.arange(count)[:, np.newaxis], matrix.shape)
+
+    # 같은 값 묶음의 첫/마지막 위치로 평균 순위 계산
+    changed = sorted_values[1:] != sorted_values[:-1]
+    starts = np.ones(matrix.shape, dtype=np.bool_)
+    starts[1:] = changed
+    ends = np.ones(matrix.shape, dtype=np.bool_)
+    ends[:-1] = changed
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=0)
+    last = np.minimum.accumulate(np.where(ends, positions, count - 1)[::-1], axis=0)[::-1]
+    sorted_rank = (first + last) / 2 + 1
+
+    rank = np.empty(matrix.shape)
+    np.put_along_axis(rank, order, sorted_rank, axis=0)
+
+    valid = ~np.isnan(matrix)
+    rank[~valid] = np.nan
+    if pct:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rank /= valid.sum(axis=0)
+        rank *= 100
+    return rank
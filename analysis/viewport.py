@@ -0,0 +1,215 @@
+"""
+화면 구간(viewport) 지표 계산 모듈
+
+긴 이력 중 일부만 화면에 표시할 때, 보이는 구간과 각 지표의 준비 구간(warm-up)만 잘라
+계산하여 이력 길이와 무관한 비용으로 지표를 갱신합니다.
+
+- 구간형 지표(이동평균, 볼린저밴드, 스토캐스틱, 일목균형표, CCI, Williams %R, MFI):
+  준비 구간은 조회 구간(lookback)이며 결과는 전체 계산과 같은 값(부동소수점 반올림 오차 이내)입니다.
+- 재귀형 지표(EMA, MACD, RSI, ADX, ATR, 켈트너 채널):
+  초기값의 영향이 충분히 사라지는 길이(기간 × WARMUP_PERIODS)를 준비 구간으로 사용합니다.
+  결과는 전체 계산의 근사값이며, 차이는 화면에서 구분할 수 없는 수준입니다.
+- 누적형 지표(OBV, Parabolic SAR, VWAP): 값이 전체 이력에 의존하므로 전체를 한 번 계산해 둡니다.
+
+사용 예:
+    viewport = ViewportEvaluator()
+    viewport.set_data({"close": close, "high": high, "low": low})
+    viewport.add("ma", "moving_average_bank", ("close",), periods=(5, 20))
+    viewport.evaluate(start, stop)["ma"]  # [start, stop) 구간의 결과
+"""
+
+import numpy as np
+
+from . import indicators
+from .incremental import INCREMENTAL_SPECS
+from .rolling import Workspace
+
+# 재귀형 지표의 준비 구간 배수 (Wilder 평활 기준 초기값 영향 e^-20 이하)
+WARMUP_PERIODS = 20
+
+# 지표별 준비 구간 (None이면 전체 이력 필요)
+WARMUP_SPECS = {
+    "moving_average_bank": lambda p: max(p.get("periods", (5, 10, 20, 60, 120))) - 1,
+    "true_range": lambda p: 1,
+    "exponential_moving_average": lambda p: p.get("period", 20) * WARMUP_PERIODS,
+    "macd": lambda p: (max(p.get("fast_period", 12), p.get("slow_period", 26)) + p.get("signal_period", 9)) * WARMUP_PERIODS,
+    "rsi": lambda p: p.get("period", 14) * WARMUP_PERIODS,
+    "average_directional_index": lambda p: p.get("period", 14) * 2 * WARMUP_PERIODS,
+    "average_true_range": lambda p: p.get("period", 14) * WARMUP_PERIODS,
+    "keltner_channels": lambda p: max(p.get("ema_period", 20), p.get("atr_period", 10)) * WARMUP_PERIODS,
+    "on_balance_volume": lambda p: None,
+    "parabolic_sar": lambda p: None,
+    "vwap": lambda p: None,
+}
+
+def warmup_range(indicator, **params):
+    """
+    지표의 준비 구간
+
+    Args:
+        indicator (str): analysis.indicators의 지표 함수 이름
+        **params: 지표 파라미터
+
+    Returns:
+        tuple: (앞쪽 준비 봉 수, 뒤쪽 참조 봉 수). 전체 이력이 필요하면 None
+    """
+    if indicator in WARMUP_SPECS:
+        lookback = WARMUP_SPECS[indicator](params)
+        return None if lookback is None else (lookback, 0)
+
+    spec = INCREMENTAL_SPECS.get(indicator)
+    if spec is None or spec["kind"] != "window":
+        raise ValueError(f"화면 구간 계산을 지원하지 않는 지표입니다: {indicator}")
+
+    # 일목균형표 후행스팬처럼 이후 봉을 참조하는 값은 rewrite만큼 뒤쪽 봉이 필요
+    lead = spec["rewrite"](params) if "rewrite" in spec else 0
+    return spec["lookback"](params) + lead, lead
+
+def evaluate_range(indicator, inputs, start, stop, workspace=None, **params):
+    """
+    [start, stop) 구간의 지표 계산
+
+    준비 구간을 포함한 부분 데이터만 계산합니다.
+
+    Args:
+        indicator (str): analysis.indicators의 지표 함수 이름
+        inputs (list): 지표 함수와 같은 순서의 전체 입력 데이터
+        start (int): 구간 시작 위치
+        stop (int): 구간 끝 위치 (미포함)
+        workspace (Workspace): 임시 배열 저장소
+        **params: 지표 파라미터
+
+    Returns:
+        numpy.ndarray or tuple: 구간 길이의 지표 값
+    """
+    function = getattr(indicators, indicator)
+    length = len(inputs[0])
+    warmup = warmup_range(indicator, **params)
+
+    if warmup is None:
+        slice_start, slice_stop = 0, length
+    else:
+        lookback, lead = warmup
+        slice_start, slice_stop = max(start - lookback, 0), min(stop + lead, length)
+
+        # 일괄 계산이 값을 내는 최소 길이 확보 (뒤쪽 봉을 더해도 앞쪽 값은 바뀌지 않음)
+        spec = INCREMENTAL_SPECS.get(indicator)
+        if spec is not None and slice_stop - slice_start < spec["min_length"](params):
+            slice_stop = min(slice_start + spec["min_length"](params), length)
+
+    output = function(*[values[slice_start:slice_stop] for values in inputs], workspace=workspace, **params)
+    offset = start - slice_start
+    if isinstance(output, tuple):
+        return tuple(values[..., offset:offset+stop-start] for values in output)
+    return output[..., offset:offset+stop-start]
+
+class ViewportEvaluator:
+    """
+    화면 구간 지표 계산 클래스
+
+    보이는 구간보다 양쪽으로 margin 비율만큼 넓게 계산해 두고, 이후 요청 구간이
+    계산해 둔 구간 안에 있으면 잘라서 반환하므로 화면 이동(pan) 중에는 대부분 재계산 없이 응답합니다.
+    """
+
+    def __init__(self, margin=0.5):
+        """
+        초기화
+
+        Args:
+            margin (float): 보이는 구간 길이 대비 양쪽 여유 계산 비율
+        """
+        self.margin = margin
+        self.requests = {}   # 이름: (지표, 입력 컬럼, 파라미터)
+        self.data = {}
+        self.workspace = Workspace()
+        self._computed = {}  # 이름: (계산 시작, 계산 끝, 결과)
+
+    def set_data(self, data):
+        """
+        차트 데이터 설정 (이전 계산 결과는 폐기)
+
+        Args:
+            data (dict): 컬럼별 데이터
+        """
+        self.data = {column: np.asarray(values, dtype=np.float64) for column, values in data.items()}
+        self._computed.clear()
+
+    def add(self, name, indicator, columns, **params):
+        """
+        지표 요청 추가 (같은 이름이면 교체)
+
+        Args:
+            name (str): 결과 이름
+            indicator (str): analysis.indicators의 지표 함수 이름
+            columns (tuple): 지표 함수 입력 컬럼
+            **params: 지표 파라미터
+        """
+        warmup_range(indicator, **params)  # 지원 여부 확인
+        self.requests[name] = (indicator, tuple(columns), params)
+        self._computed.pop(name, None)
+
+    def remove(self, name):
+        """지표 요청 제거"""
+        self.requests.pop(name, None)
+        self._computed.pop(name, None)
+
+    def clear(self):
+        """모든 지표 요청 제거"""
+        self.requests.clear()
+        self._computed.clear()
+
+    @property
+    def length(self):
+        """데이터 길이"""
+        return len(next(iter(self.data.values()))) if self.data else 0
+
+    def evaluate(self, start, stop):
+        """
+        [start, stop) 구간의 지표 값 계산
+
+        Args:
+            start (int): 구간 시작 위치
+            stop (int): 구간 끝 위치 (미포함)
+
+        Returns:
+            dict: {이름: 구간 길이의 지표 값}. 구간은 데이터 범위로 잘림
+        """
+        length = self.length
+        start = min(max(int(start), 0), length)
+        stop = min(max(int(stop), start), length)
+
+        results = {}
+        for name, (indicator, columns, params) in self.requests.items():
+            computed = self._computed.get(name)
+            if computed is None or start < computed[0] or stop > computed[1]:
+                computed = self._compute(indicator, columns, params, start, stop)
+                self._computed[name] = computed
+
+            computed_start, _, values = computed
+            lo, hi = start - computed_start, stop - computed_start
+            if isinstance(values, tuple):
+                results[name] = tuple(array[..., lo:hi] for array in values)
+            else:
+                results[name] = values[..., lo:hi]
+
+        return results
+
+    def _compute(self, indicator, columns, params, start, stop):
+        """여유 구간을 포함해 계산"""
+        length = self.length
+        if warmup_range(indicator, **params) is None:
+            # 누적형 지표는 전체를 한 번 계산
+            start, stop = 0, length
+        else:
+            pad = int((stop - start) * self.margin)
+            start, stop = max(start - pad, 0), min(stop + pad, length)
+
+        inputs = [self.data[column] for column in columns]
+        values = evaluate_range(indicator, inputs, start, stop, self.workspace, **params)
+
+        # 결과는 다음 계산까지 보관하므로 임시 배열과 분리
+        if isinstance(values, tuple):
+            values = tuple(np.array(array) for array in values)
+        else:
+            values = np.array(values)
+        return start, stop, values
@@ -0,0 +1,256 @@
+"""
+매물대(volume profile) 계산 모듈
+
+저장된 봉 데이터의 거래량을 가격대별로 누적하여, opt10025(매물대집중) 등 TR 조회 없이
+매물대를 계산합니다.
+
+가격은 KRX 호가단위 격자의 정수 위치(tick index)로 변환하여 np.bincount로 누적합니다.
+봉의 거래량은 종가 한 호가에 모두 배분하거나(method="close"), 저가~고가 사이의 호가에
+균등 배분합니다(method="range"). 균등 배분은 저가 위치에 +v/n, 고가 다음 위치에 -v/n을
+bincount로 누적한 차분 배열의 누적합으로 계산하므로 봉 수와 호가 수에 선형입니다.
+
+VolumeProfile은 봉 추가/제거에 따라 호가별 거래량을 갱신하므로
+실시간 봉 추가나 최근 N봉 구간 매물대를 봉 하나당 짧은 시간에 갱신합니다.
+
+사용 예:
+    profile = VolumeProfile()
+    profile.add(high, low, close, volume)              # 과거 분봉
+    edges, volumes = profile.histogram(rows=50)        # 50개 가격대
+    profile.point_of_control()                         # 최대 거래 가격
+"""
+
+import numpy as np
+
+# KRX 호가단위 (유가증권/코스닥 주식, 2023년 1월 개편 기준): (가격대 하한, 호가단위)
+TICK_BANDS = (
+    (0, 1),
+    (2000, 5),
+    (5000, 10),
+    (20000, 50),
+    (50000, 100),
+    (200000, 500),
+    (500000, 1000),
+)
+
+_BAND_LOWER = np.array([lower for lower, _ in TICK_BANDS], dtype=np.int64)
+_BAND_TICK = np.array([tick for _, tick in TICK_BANDS], dtype=np.int64)
+# 가격대별 시작 호가 위치
+_BAND_OFFSET = np.concatenate(([0], np.cumsum(np.diff(_BAND_LOWER) // _BAND_TICK[:-1])))
+
+def tick_index(prices):
+    """
+    가격을 호가 격자 위치로 변환
+
+    호가단위에 맞지 않는 가격은 아래 호가로 내립니다.
+
+    Args:
+        prices (numpy.ndarray): 원 단위 가격
+
+    Returns:
+        numpy.ndarray: int64 호가 위치 (0원이 0)
+    """
+    values = np.rint(np.asarray(prices, dtype=np.float64)).astype(np.int64)
+    band = np.searchsorted(_BAND_LOWER, values, side="right") - 1
+    return _BAND_OFFSET[band] + (values - _BAND_LOWER[band]) // _BAND_TICK[band]
+
+def tick_price(indices):
+    """
+    호가 격자 위치를 가격으로 변환
+
+    Args:
+        indices (numpy.ndarray): 호가 위치
+
+    Returns:
+        numpy.ndarray: int64 원 단위 가격
+    """
+    values = np.asarray(indices, dtype=np.int64)
+    band = np.searchsorted(_BAND_OFFSET, values, side="right") - 1
+    return _BAND_LOWER[band] + (values - _BAND_OFFSET[band]) * _BAND_TICK[band]
+
+def _tick_weights(high_data, low_data, close_data, volume_data, method):
+    """
+    봉별 누적 위치와 가중치
+
+    Returns:
+        tuple: (호가 위치, 가중치) - range 방식은 차분 배열 위치/가중치
+    """
+    volume = np.asarray(volume_data, dtype=np.float64)
+    if method == "close":
+        return tick_index(close_data), volume
+    if method != "range":
+        raise ValueError(f"지원하지 않는 배분 방식입니다: {method}")
+
+    low = tick_index(low_data)
+    high = np.maximum(tick_index(high_data), low)
+    share = volume / (high - low + 1)
+    return np.concatenate((low, high + 1)), np.concatenate((share, -share))
+
+class VolumeProfile:
+    """
+    매물대 클래스
+
+    최저 호가 위치(base)부터의 호가별 거래량 배열을 보관하고, 봉이 추가/제거될 때
+    해당 봉의 거래량만 bincount로 더하거나 뺍니다. 가격 범위가 넓어지면 배열을 확장합니다.
+    """
+
+    def __init__(self, method="range"):
+        """
+        초기화
+
+        Args:
+            method (str): 거래량 배분 방식 ("range": 저가~고가 균등, "close": 종가)
+        """
+        self.method = method
+        self.base = 0
+        self._levels = np.zeros(0)   # 호가별 거래량 (range 방식은 차분 배열)
+        self.total_volume = 0.0
+        self._cache = None           # 호가별 거래량 (누적합 결과)
+
+    def _accumulate(self, high_data, low_data, close_data, volume_data, sign):
+        """봉 거래량 누적 (sign: 1 추가, -1 제거)"""
+        positions, weights = _tick_weights(high_data, low_data, close_data, volume_data, self.method)
+        if len(positions) == 0:
+            return
+
+        # 가격 범위 확장 (차분 배열은 고가 다음 위치까지 사용)
+        low, high = int(positions.min()), int(positions.max())
+        if len(self._levels) == 0:
+            self.base, self._levels = low, np.zeros(high - low + 1)
+        elif low < self.base or high >= self.base + len(self._levels):
+            base = min(low, self.base)
+            levels = np.zeros(max(high + 1, self.base + len(self._levels)) - base)
+            levels[self.base-base:self.base-base+len(self._levels)] = self._levels
+            self.base, self._levels = base, levels
+
+        counts = np.bincount(positions - self.base, weights=weights, minlength=len(self._levels))
+        if sign > 0:
+            self._levels += counts
+        else:
+            self._levels -= counts
+        self.total_volume += sign * float(np.sum(volume_data))
+        self._cache = None
+
+    def add(self, high_data, low_data, close_data, volume_data):
+        """
+        봉 추가
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터 (스칼라 가능)
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            volume_data (numpy.ndarray): 거래량 데이터
+        """
+        self._accumulate(np.atleast_1d(high_data), np.atleast_1d(low_data), np.atleast_1d(close_data),
+                         np.atleast_1d(volume_data), 1)
+
+    def remove(self, high_data, low_data, close_data, volume_data):
+        """
+        봉 제거 (최근 N봉 매물대에서 구간을 벗어난 봉)
+
+        Args:
+            high_data (numpy.ndarray): 고가 데이터 (스칼라 가능)
+            low_data (numpy.ndarray): 저가 데이터
+            close_data (numpy.ndarray): 종가 데이터
+            volume_data (numpy.ndarray): 거래량 데이터
+        """
+        self._accumulate(np.atleast_1d(high_data), np.atleast_1d(low_data), np.atleast_1d(close_data),
+                         np.atleast_1d(volume_data), -1)
+
+    def clear(self):
+        """모든 봉 제거"""
+        self.base = 0
+        self._levels = np.zeros(0)
+        self.total_volume = 0.0
+        self._cache = None
+
+    def levels(self):
+        """
+        호가별 거래량
+
+        Returns:
+            tuple: (호가 가격 배열, 거래량 배열) - 최저 호가부터
+        """
+        if self._cache is None:
+            volumes = np.cumsum(self._levels) if self.method == "range" else self._levels.copy()
+            # 차분 배열 누적합의 반올림 잔차 제거
+            np.maximum(volumes, 0.0, out=volumes)
+            if self.method == "range" and len(volumes):
+                volumes = volumes[:-1]
+            self._cache = (tick_price(np.arange(self.base, self.base + len(volumes))), volumes)
+        return self._cache
+
+    def histogram(self, rows=None, ticks_per_row=None):
+        """
+        가격대별 거래량
+
+        Args:
+            rows (int): 가격대 개수 (ticks_per_row가 없을 때 사용, 둘 다 없으면 호가별)
+            ticks_per_row (int): 가격대 하나의 호가 수
+
+        Returns:
+            tuple: (가격대 경계 배열(가격대 수 + 1), 가격대별 거래량 배열)
+        """
+        prices, volumes = self.levels()
+        if len(volumes) == 0:
+            return np.zeros(1, dtype=np.int64), np.zeros(0)
+
+        if ticks_per_row is None:
+            ticks_per_row = 1 if rows is None else max(-(-len(volumes) // rows), 1)
+
+        starts = np.arange(0, len(volumes), ticks_per_row)
+        row_volumes = np.add.reduceat(volumes, starts)
+        edges = tick_price(self.base + np.append(starts, len(volumes)))
+        return edges, row_volumes
+
+    def point_of_control(self):
+        """
+        최대 거래 가격 (POC)
+
+        Returns:
+            float: 거래량이 가장 많은 호가 가격 (데이터가 없으면 NaN)
+        """
+        prices, volumes = self.levels()
+        if len(volumes) == 0 or volumes.max() <= 0:
+            return np.nan
+        return float(prices[np.argmax(volumes)])
+
+    def value_area(self, fraction=0.7):
+        """
+        거래 집중 구간 (value area)
+
+        거래량이 많은 호가부터 전체 거래량의 fraction에 도달할 때까지 포함한 호가의 가격 범위입니다.
+
+        Args:
+            fraction (float): 포함할 거래량 비율
+
+        Returns:
+            tuple: (하단 가격, 상단 가격) - 데이터가 없으면 (NaN, NaN)
+        """
+        prices, volumes = self.levels()
+        total = volumes.sum() if len(volumes) else 0.0
+        if total <= 0:
+            return np.nan, np.nan
+
+        order = np.argsort(volumes)[::-1]
+        count = int(np.searchsorted(np.cumsum(volumes[order]), total * fraction)) + 1
+        selected = prices[order[:count]]
+        return float(selected.min()), float(selected.max())
+
+def volume_profile(high_data, low_data, close_data, volume_data, rows=None, method="range"):
+    """
+    매물대 일괄 계산
+
+    Args:
+        high_data (numpy.ndarray): 고가 데이터
+        low_data (numpy.ndarray): 저가 데이터
+        close_data (numpy.ndarray): 종가 데이터
+        volume_data (numpy.ndarray): 거래량 데이터
+        rows (int): 가격대 개수 (None이면 호가별)
+        method (str): 거래량 배분 방식 ("range" 또는 "close")
+
+    Returns:
+        tuple: (가격대 경계 배열, 가격대별 거래량 배열)
+    """
+    profile = VolumeProfile(method)
+    profile.add(high_data, low_data, close_data, volume_data)
+    return profile.histogram(rows)
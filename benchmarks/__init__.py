@@ -0,0 +1,5 @@
+"""
+벤치마크 패키지
+
+이 패키지는 AI 트레이딩 시스템 분석 모듈의 성능 측정 스크립트를 포함합니다.
+"""
@@ -0,0 +1,113 @@
+"""
+지표 함수 메모리 할당 벤치마크
+
+tracemalloc으로 지표 함수 1회 호출의 최대 할당량(peak)을 측정합니다.
+기본 호출, out 배열과 Workspace를 재사용하는 호출, Workspace를 재사용하는 float32 결과 호출을 비교하고,
+재사용 호출의 봉당 최대 할당량이 기준(--budget)을 넘거나, float32 호출이 새 float32 결과 배열 외에
+재사용 호출보다 봉당 --float32-slack 바이트 넘게 할당하면(float64 계산 버퍼를 매번 새로 할당하는 경우 등)
+종료 코드 1을 반환합니다.
+
+실행:
+    python -m benchmarks.allocation_benchmark [--bars 100000] [--budget 16] [--float32-slack 1]
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+import numpy as np
+
+from analysis import indicators
+from analysis.rolling import Workspace
+from benchmarks.cases import INDICATOR_CASES, synthetic_ohlcv
+
+def peak_allocation(function):
+    """
+    함수 1회 호출의 최대 할당량 측정
+
+    Args:
+        function (callable): 측정할 함수
+
+    Returns:
+        int: 최대 할당 바이트
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def output_buffers(result):
+    """결과와 같은 형태의 out 배열 생성"""
+    if isinstance(result, tuple):
+        return tuple(np.empty_like(array) for array in result)
+    return np.empty_like(result)
+
+def output_bytes(result):
+    """결과 배열의 전체 바이트"""
+    if isinstance(result, tuple):
+        return sum(array.nbytes for array in result)
+    return result.nbytes
+
+def measure(data):
+    """
+    지표별 최대 할당량 측정
+
+    Args:
+        data (dict): OHLCV 데이터
+
+    Returns:
+        list: (지표 이름, 기본 호출, 재사용 호출, float32 호출, float32 결과 배열) 바이트
+    """
+    rows = []
+    for name, columns in INDICATOR_CASES:
+        function = getattr(indicators, name)
+        inputs = [data[column] for column in columns]
+
+        out = output_buffers(function(*inputs))
+        workspace = Workspace()
+        function(*inputs, out=out, workspace=workspace)  # 임시 배열 준비
+        # float64 out에서는 결과 배열에 직접 계산하므로 float32 계산 버퍼는 따로 준비
+        float32_bytes = output_bytes(function(*inputs, dtype=np.float32, workspace=workspace))
+
+        rows.append((
+            name,
+            peak_allocation(lambda: function(*inputs)),
+            peak_allocation(lambda: function(*inputs, out=out, workspace=workspace)),
+            peak_allocation(lambda: function(*inputs, dtype=np.float32, workspace=workspace)),
+            float32_bytes,
+        ))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 함수 메모리 할당 벤치마크")
+    parser.add_argument("--bars", type=int, default=100000, help="봉 개수")
+    parser.add_argument("--budget", type=float, default=16.0, help="재사용 호출의 봉당 최대 할당 바이트")
+    parser.add_argument("--float32-slack", type=float, default=1.0,
+                        help="float32 호출이 결과 배열 외에 재사용 호출보다 더 할당할 수 있는 봉당 바이트")
+    args = parser.parse_args()
+
+    data = synthetic_ohlcv(args.bars)
+    rows = measure(data)
+
+    print(f"봉 개수: {args.bars:,} (단위: 봉당 바이트)")
+    print(f"{'지표':<28}{'기본':>10}{'재사용':>10}{'float32':>10}{'(결과)':>10}")
+    failed = []
+    for name, default, reused, float32, float32_bytes in rows:
+        print(f"{name:<28}{default / args.bars:>10.2f}{reused / args.bars:>10.2f}"
+              f"{float32 / args.bars:>10.2f}{float32_bytes / args.bars:>10.2f}")
+        if reused > args.budget * args.bars:
+            failed.append(name)
+        elif float32 - float32_bytes - reused > args.float32_slack * args.bars:
+            failed.append(f"{name}(float32)")
+
+    limits = f"재사용 {args.budget} 바이트/봉, float32 추가 {args.float32_slack} 바이트/봉"
+    if failed:
+        print(f"기준({limits}) 초과: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"모든 지표가 기준({limits}) 이내입니다.")
+
+if __name__ == "__main__":
+    main()
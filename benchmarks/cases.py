@@ -0,0 +1,53 @@
+"""
+벤치마크 공통 데이터
+
+합성 OHLCV 데이터와 벤치마크 대상 지표 목록을 정의합니다.
+"""
+
+import numpy as np
+
+# 벤치마크 대상 공개 지표 (지표 함수 이름, 입력 컬럼)
+INDICATOR_CASES = [
+    ("moving_average", ("close",)),
+    ("moving_average_bank", ("close",)),
+    ("exponential_moving_average", ("close",)),
+    ("bollinger_bands", ("close",)),
+    ("macd", ("close",)),
+    ("rsi", ("close",)),
+    ("stochastic", ("high", "low", "close")),
+    ("ichimoku_cloud", ("high", "low", "close")),
+    ("on_balance_volume", ("close", "volume")),
+    ("true_range", ("high", "low", "close")),
+    ("average_directional_index", ("high", "low", "close")),
+    ("parabolic_sar", ("high", "low", "close")),
+    ("average_true_range", ("high", "low", "close")),
+    ("vwap", ("high", "low", "close", "volume", "date")),
+    ("commodity_channel_index", ("high", "low", "close")),
+    ("williams_r", ("high", "low", "close")),
+    ("money_flow_index", ("high", "low", "close", "volume")),
+    ("keltner_channels", ("high", "low", "close")),
+]
+
+# 하루 1분봉 개수 (09:00 ~ 15:20)
+SESSION_BARS = 381
+
+def synthetic_ohlcv(bars, seed=0):
+    """
+    합성 OHLCV 데이터 생성
+
+    Args:
+        bars (int): 봉 개수
+        seed (int): 난수 시드
+
+    Returns:
+        dict: open, high, low, close, volume 배열과 date(SESSION_BARS개 봉마다 바뀌는 거래일 번호)
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(50000 + np.cumsum(rng.normal(0, 50, bars)))
+    close = np.maximum(close, 100)
+    open_price = np.round(close + rng.normal(0, 20, bars))
+    high = np.maximum(open_price, close) + np.round(rng.uniform(0, 50, bars))
+    low = np.minimum(open_price, close) - np.round(rng.uniform(0, 50, bars))
+    volume = rng.integers(100, 100000, bars).astype(np.float64)
+    date = np.arange(bars) // SESSION_BARS
+    return {"open": open_price, "high": high, "low": low, "close": close, "volume": volume, "date": date}
@@ -0,0 +1,112 @@
+"""
+차트 TR 파싱 벤치마크
+
+합성 차트 TR 페이지를 돌려주는 OCX 대용 객체로 KiwoomChart의 페이지 처리 시간과
+COM 호출(dynamicCall) 횟수를 GetCommDataEx 일괄 조회와 항목별 GetCommData 조회로 비교하고,
+두 방식의 결과가 같은지 확인합니다.
+
+실제 COM 호출은 파이썬 호출보다 훨씬 느리므로 --latency-us로 호출당 지연을 지정하면
+호출 횟수 × 지연을 더한 페이지당 예상 시간을 함께 출력합니다.
+
+실행:
+    python -m benchmarks.chart_parse_benchmark [--rows 600] [--repeat 20] [--latency-us 50]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from core.kiwoom_wrapper.kiwoom_chart import CHART_TRS, KiwoomChart
+from core.kiwoom_wrapper.tr_schema import get_schema
+from benchmarks.cases import synthetic_ohlcv
+
+class _Event:
+    """OnReceiveTrData 이벤트 대용 (연결만 받음)"""
+
+    def connect(self, handler):
+        pass
+
+class PageOcx:
+    """
+    합성 차트 TR 페이지를 반환하는 OCX 대용 객체
+
+    GetCommDataEx는 TR 스키마 layout 순서의 문자열 행 목록을, GetCommData는 같은 값에
+    키움 API처럼 앞뒤 공백을 붙여 반환하며 dynamicCall 횟수를 셉니다.
+    """
+
+    def __init__(self, trcode, rows, block=True, seed=0):
+        self.OnReceiveTrData = _Event()
+        self.block = block
+        self.calls = 0
+
+        chart = synthetic_ohlcv(rows, seed)
+        values = {
+            "종목코드": ["005930"] + [""] * (rows - 1),
+            "현재가": [f"{value:+d}" for value in chart["close"].astype(np.int64)],
+            "시가": [f"{value:+d}" for value in chart["open"].astype(np.int64)],
+            "고가": [f"{value:+d}" for value in chart["high"].astype(np.int64)],
+            "저가": [f"{-value:+d}" for value in chart["low"].astype(np.int64)],
+            "거래량": [str(value) for value in chart["volume"].astype(np.int64)],
+            "일자": [f"{20240101 + index:08d}" for index in range(rows)],
+            "체결시간": [f"{20240102 + index // 381:08d}{index % 381:04d}00" for index in range(rows)],
+        }
+        fields = get_schema(trcode).layout
+        self.rows = [[values.get(field, [""] * rows)[row] for field in fields] for row in range(rows)]
+        self.fields = {field: index for index, field in enumerate(fields)}
+
+    def dynamicCall(self, signature, *args):
+        self.calls += 1
+        if signature.startswith("GetRepeatCnt"):
+            return len(self.rows)
+        if signature.startswith("GetCommDataEx"):
+            return self.rows if self.block else None
+        if signature.startswith("GetCommData"):
+            _, _, row, field = args
+            index = self.fields.get(field)
+            return "" if index is None else f"   {self.rows[row][index]}   "
+        return None
+
+def run_page(trcode, rows, block, repeat):
+    """
+    페이지 처리 시간 측정
+
+    Returns:
+        tuple: (최소 처리 시간(초), 페이지당 COM 호출 수, 처리 결과)
+    """
+    ocx = PageOcx(trcode, rows, block)
+    chart = KiwoomChart(ocx)
+    rqname = f"{trcode}_req"
+
+    elapsed = []
+    for _ in range(repeat):
+        ocx.calls = 0
+        start = time.perf_counter()
+        chart._process_chart_data(trcode, rqname, "0")
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed), ocx.calls, chart.tr_data[rqname]
+
+def main():
+    parser = argparse.ArgumentParser(description="차트 TR 파싱 벤치마크")
+    parser.add_argument("--rows", type=int, default=600, help="페이지당 행 수")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--latency-us", type=float, default=0.0, help="COM 호출당 지연 (마이크로초, 예상 시간 계산용)")
+    args = parser.parse_args()
+
+    print(f"페이지당 행 수: {args.rows:,}")
+    for trcode in CHART_TRS:
+        block_time, block_calls, block_data = run_page(trcode, args.rows, True, args.repeat)
+        cell_time, cell_calls, cell_data = run_page(trcode, args.rows, False, args.repeat)
+
+        same = all(
+            np.array_equal(np.asarray(block_data[column]), np.asarray(cell_data[column]))
+            for column in ("date", "time", "open", "high", "low", "close", "volume") if column in cell_data
+        )
+        latency = args.latency_us / 1e6
+        print(f"{trcode} 일괄 조회: {block_time * 1000:8.2f} ms, COM 호출 {block_calls:>6,}회, "
+              f"예상 {(block_time + block_calls * latency) * 1000:8.2f} ms")
+        print(f"{trcode} 항목별 조회: {cell_time * 1000:8.2f} ms, COM 호출 {cell_calls:>6,}회, "
+              f"예상 {(cell_time + cell_calls * latency) * 1000:8.2f} ms  (결과 일치: {same})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+종목 전체 상관/베타 벤치마크
+
+합성 수익률 행렬로 다음을 측정하고 결과를 직접 계산한 값과 비교합니다.
+- rolling_beta: 전 종목의 시장 대비 이동 베타 (종목별 구간 반복 계산 대비)
+- RollingCovarianceMatrix: 봉 추가 시 상관행렬 갱신 (매 봉 구간 전체로 다시 계산 대비)
+
+실행:
+    python -m benchmarks.correlation_benchmark [--symbols 2000] [--bars 500] [--period 60]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from analysis.correlation import RollingCovarianceMatrix, correlation_matrix, rolling_beta
+
+def naive_beta(returns, market, period):
+    """종목/봉별 구간을 잘라 계산하는 베타 (마지막 steps개 봉)"""
+    steps = 20
+    beta = np.empty((len(returns), steps))
+    for column, end in enumerate(range(returns.shape[1] - steps + 1, returns.shape[1] + 1)):
+        window = market[end-period:end]
+        market_var = window.var()
+        for row, values in enumerate(returns):
+            beta[row, column] = np.mean((values[end-period:end] - values[end-period:end].mean()) * (window - window.mean())) / market_var
+    return beta
+
+def main():
+    parser = argparse.ArgumentParser(description="종목 전체 상관/베타 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2000, help="종목 수")
+    parser.add_argument("--bars", type=int, default=500, help="봉 개수")
+    parser.add_argument("--period", type=int, default=60, help="구간 길이")
+    parser.add_argument("--steps", type=int, default=50, help="상관행렬 갱신 봉 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    market = rng.normal(0, 0.01, args.bars)
+    returns = market * rng.uniform(0.5, 1.5, (args.symbols, 1)) + rng.normal(0, 0.01, (args.symbols, args.bars))
+    print(f"종목 수: {args.symbols:,}, 봉 개수: {args.bars:,}, 구간: {args.period}")
+
+    # 이동 베타 (전 종목 × 전 봉)
+    start = time.perf_counter()
+    beta = rolling_beta(returns, market, args.period)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = naive_beta(returns, market, args.period)
+    naive_elapsed = (time.perf_counter() - start) * args.bars / expected.shape[1]
+    error = np.abs(beta[:, -expected.shape[1]:] - expected).max()
+    print(f"rolling_beta      : {elapsed * 1000:9.2f} ms  (반복 계산 추정 {naive_elapsed * 1000:10.2f} ms, 최대 오차 {error:.2e})")
+
+    # 상관행렬 갱신
+    history = args.bars - args.steps
+    matrix = RollingCovarianceMatrix.from_history(returns[:, :history], args.period)
+    start = time.perf_counter()
+    for column in range(history, args.bars):
+        matrix.append(returns[:, column])
+    incremental = (time.perf_counter() - start) / args.steps
+
+    start = time.perf_counter()
+    for column in range(history, args.bars):
+        expected = correlation_matrix(returns, args.period, column + 1)
+    naive = (time.perf_counter() - start) / args.steps
+
+    error = np.abs(matrix.correlation() - expected).max()
+    print(f"상관행렬 봉당 갱신: {incremental * 1000:9.2f} ms  (구간 전체 재계산 {naive * 1000:10.2f} ms, 최대 오차 {error:.2e})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+다이버전스 탐지 벤치마크
+
+합성 종목 데이터의 (종목 × 봉) 행렬에서 RSI 다이버전스를 탐지하는 시간을
+종목별로 고점/저점을 반복하며 비교하는 방식과 비교하고 결과가 같은지 확인합니다.
+
+실행:
+    python -m benchmarks.divergence_benchmark [--symbols 2500] [--bars 500] [--order 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from analysis import universe
+from analysis.divergence import DIVERGENCES, divergences
+from analysis.rolling import Workspace
+from benchmarks.cases import synthetic_ohlcv
+
+def loop_divergences(high, low, indicator, order, max_distance):
+    """종목별로 고점/저점을 찾고 연속된 두 고점/저점을 비교하는 반복 계산"""
+    result = np.zeros((len(DIVERGENCES),) + high.shape, dtype=np.bool_)
+    for row in range(high.shape[0]):
+        for price, is_high in ((high[row], True), (low[row], False)):
+            previous = None
+            for i in range(order, len(price) - order):
+                left, right = price[i-order:i], price[i+1:i+order+1]
+                if is_high:
+                    swing = price[i] > left.max() and price[i] >= right.max()
+                else:
+                    swing = price[i] < left.min() and price[i] <= right.min()
+                if not swing:
+                    continue
+                if previous is not None and i - previous <= max_distance:
+                    price_up, price_down = price[i] > price[previous], price[i] < price[previous]
+                    indicator_up = indicator[row, i] > indicator[row, previous]
+                    indicator_down = indicator[row, i] < indicator[row, previous]
+                    if is_high:
+                        result[1, row, i+order] = price_up and indicator_down
+                        result[3, row, i+order] = price_down and indicator_up
+                    else:
+                        result[0, row, i+order] = price_down and indicator_up
+                        result[2, row, i+order] = price_up and indicator_down
+                previous = i
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="다이버전스 탐지 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2500, help="종목 수")
+    parser.add_argument("--bars", type=int, default=500, help="종목별 봉 개수")
+    parser.add_argument("--order", type=int, default=5, help="고점/저점 판별 앞뒤 봉 수")
+    parser.add_argument("--max-distance", type=int, default=60, help="비교할 두 고점/저점 사이 최대 봉 수")
+    args = parser.parse_args()
+
+    charts = [synthetic_ohlcv(args.bars, seed=index) for index in range(args.symbols)]
+    high, low, close = (np.array([chart[column] for chart in charts], dtype=np.float64) for column in ("high", "low", "close"))
+    indicator = universe.rsi(close)
+    workspace = Workspace()
+
+    print(f"종목 수: {args.symbols:,}, 봉 개수: {args.bars:,}, order: {args.order}")
+    start = time.perf_counter()
+    signals = divergences(high, low, indicator, order=args.order, max_distance=args.max_distance, workspace=workspace)
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = loop_divergences(high, low, indicator, args.order, args.max_distance)
+    loop = time.perf_counter() - start
+
+    print(f"행렬 탐지: {vectorized * 1000:9.1f} ms")
+    print(f"반복 탐지: {loop * 1000:9.1f} ms  (결과 일치: {np.array_equal(signals, expected)})")
+    for name, count in zip(DIVERGENCES, signals.sum(axis=(1, 2))):
+        print(f"  {name:<16} {count:>8,}건")
+
+if __name__ == "__main__":
+    main()
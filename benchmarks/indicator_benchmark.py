@@ -0,0 +1,245 @@
+"""
+지표 성능 벤치마크
+
+analysis.indicators의 공개 지표를 1e3 ~ 1e6개 봉의 합성 OHLCV 데이터로 계산하여
+실행 시간(최소값)과 최대 메모리 할당량(tracemalloc)을 측정하고, 결과를 기준 구현
+(benchmarks.reference)과 비교합니다. 결과는 JSON으로 저장하여 커밋 간 비교에 사용합니다.
+GUI 없이 실행됩니다.
+
+실행:
+    python -m benchmarks.indicator_benchmark [--bars 1000 10000 100000 1000000] [--output result.json]
+    python -m benchmarks.indicator_benchmark --compare baseline.json [--output result.json]
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from analysis import indicators
+from benchmarks import reference
+from benchmarks.cases import INDICATOR_CASES, synthetic_ohlcv
+
+DEFAULT_BARS = (1000, 10000, 100000, 1000000)
+
+def as_tuple(result):
+    """결과를 배열 튜플로 변환"""
+    if isinstance(result, tuple):
+        return result
+    if np.ndim(result) == 2:
+        return tuple(result)
+    return (result,)
+
+def best_time(function, repeat):
+    """
+    repeat회 실행 중 최소 시간
+
+    Args:
+        function (callable): 측정할 함수
+        repeat (int): 반복 횟수
+
+    Returns:
+        float: 최소 실행 시간 (초)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(function):
+    """
+    함수 1회 호출의 최대 메모리 할당량
+
+    Args:
+        function (callable): 측정할 함수
+
+    Returns:
+        int: 최대 할당 바이트
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def compare_results(actual, expected, rtol=1e-9, atol=1e-9):
+    """
+    지표 결과와 기준 구현 결과 비교
+
+    Args:
+        actual: 지표 결과
+        expected: 기준 구현 결과
+        rtol (float): 상대 허용 오차
+        atol (float): 절대 허용 오차
+
+    Returns:
+        dict: 일치 여부, 최대 절대/상대 오차
+    """
+    match = True
+    max_abs = 0.0
+    max_rel = 0.0
+
+    for actual_values, expected_values in zip(as_tuple(actual), as_tuple(expected)):
+        actual_values = np.asarray(actual_values, dtype=np.float64)
+        expected_values = np.asarray(expected_values, dtype=np.float64)
+
+        actual_nan = np.isnan(actual_values)
+        if not np.array_equal(actual_nan, np.isnan(expected_values)):
+            match = False
+
+        valid = ~actual_nan & ~np.isnan(expected_values)
+        if valid.any():
+            diff = np.abs(actual_values[valid] - expected_values[valid])
+            scale = np.maximum(np.abs(expected_values[valid]), 1.0)
+            max_abs = max(max_abs, float(diff.max()))
+            max_rel = max(max_rel, float((diff / scale).max()))
+            if not np.allclose(actual_values[valid], expected_values[valid], rtol=rtol, atol=atol):
+                match = False
+
+    return {"match": match, "max_abs_diff": max_abs, "max_rel_diff": max_rel}
+
+def repeat_count(bars):
+    """봉 개수에 따른 반복 횟수"""
+    if bars <= 10000:
+        return 20
+    if bars <= 100000:
+        return 5
+    return 2
+
+def run(bar_counts, reference_max_bars, indicator_names=None):
+    """
+    벤치마크 실행
+
+    Args:
+        bar_counts (list): 봉 개수 목록
+        reference_max_bars (int): 기준 구현과 비교할 최대 봉 개수
+        indicator_names (list): 측정할 지표 이름 (None이면 전체)
+
+    Returns:
+        list: 지표별/봉 개수별 측정 결과
+    """
+    results = []
+    for bars in bar_counts:
+        data = synthetic_ohlcv(bars)
+        for name, columns in INDICATOR_CASES:
+            if indicator_names and name not in indicator_names:
+                continue
+
+            function = getattr(indicators, name)
+            inputs = [data[column] for column in columns]
+
+            output = function(*inputs)  # 준비 실행 (JIT 컴파일 등)
+            entry = {
+                "indicator": name,
+                "bars": bars,
+                "time_ms": best_time(lambda: function(*inputs), repeat_count(bars)) * 1000,
+                "peak_bytes": peak_memory(lambda: function(*inputs)),
+            }
+
+            if bars <= reference_max_bars:
+                reference_function = getattr(reference, name)
+                start = time.perf_counter()
+                expected = reference_function(*inputs)
+                entry["reference_time_ms"] = (time.perf_counter() - start) * 1000
+                entry["reference"] = compare_results(output, expected)
+
+            results.append(entry)
+            print(format_entry(entry), flush=True)
+    return results
+
+def format_entry(entry):
+    """측정 결과 한 줄 출력 형식"""
+    line = (f"{entry['indicator']:<28}{entry['bars']:>10,}"
+            f"{entry['time_ms']:>12.2f} ms{entry['peak_bytes'] / 1024 / 1024:>10.2f} MiB")
+    if "reference" in entry:
+        status = "일치" if entry["reference"]["match"] else "불일치"
+        line += f"  기준 {entry['reference_time_ms']:>10.1f} ms  {status} (상대 오차 {entry['reference']['max_rel_diff']:.1e})"
+    return line
+
+def git_revision():
+    """현재 git 커밋 (확인할 수 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare_with_baseline(results, baseline_path, threshold):
+    """
+    이전 결과와 실행 시간 비교
+
+    Args:
+        results (list): 현재 측정 결과
+        baseline_path (str): 이전 결과 JSON 경로
+        threshold (float): 느려짐으로 판단할 시간 비율
+
+    Returns:
+        list: 기준보다 느려진 (지표, 봉 개수, 비율) 목록
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    previous = {(entry["indicator"], entry["bars"]): entry for entry in baseline["results"]}
+    regressions = []
+
+    print(f"\n이전 결과와 비교: {baseline_path} ({baseline['meta'].get('git_revision')})")
+    for entry in results:
+        old = previous.get((entry["indicator"], entry["bars"]))
+        if old is None:
+            continue
+        ratio = entry["time_ms"] / old["time_ms"] if old["time_ms"] > 0 else float("inf")
+        marker = " <- 느려짐" if ratio > threshold else ""
+        print(f"{entry['indicator']:<28}{entry['bars']:>10,}  x{ratio:.2f}{marker}")
+        if ratio > threshold:
+            regressions.append((entry["indicator"], entry["bars"], ratio))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 성능 벤치마크")
+    parser.add_argument("--bars", type=int, nargs="+", default=list(DEFAULT_BARS), help="봉 개수 목록")
+    parser.add_argument("--indicators", nargs="+", help="측정할 지표 이름 (기본: 전체)")
+    parser.add_argument("--reference-max-bars", type=int, default=100000, help="기준 구현과 비교할 최대 봉 개수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일 경로")
+    parser.add_argument("--threshold", type=float, default=1.25, help="느려짐으로 판단할 시간 비율")
+    args = parser.parse_args()
+
+    print(f"백엔드: {indicators.get_backend()}")
+    results = run(args.bars, args.reference_max_bars, args.indicators)
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "backend": indicators.get_backend(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+        print(f"결과 저장: {args.output}")
+
+    mismatched = [entry for entry in results if "reference" in entry and not entry["reference"]["match"]]
+    regressions = compare_with_baseline(results, args.compare, args.threshold) if args.compare else []
+
+    if mismatched or regressions:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+캔들 패턴 스캔 벤치마크
+
+합성 종목 데이터의 (종목 × 봉) OHLC 행렬에서 모든 캔들 패턴을 판별하는 시간을
+전체 봉과 마지막 봉(장 마감 스캔) 기준으로 측정합니다.
+
+실행:
+    python -m benchmarks.pattern_benchmark [--symbols 2500] [--bars 500] [--repeat 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from analysis.candlestick import PATTERNS, candle_patterns
+from analysis.rolling import Workspace
+from benchmarks.cases import synthetic_ohlcv
+
+def best_time(function, repeat):
+    """repeat회 실행 중 최소 시간"""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed.append(time.perf_counter() - start)
+    return min(elapsed)
+
+def main():
+    parser = argparse.ArgumentParser(description="캔들 패턴 스캔 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2500, help="종목 수")
+    parser.add_argument("--bars", type=int, default=500, help="종목별 봉 개수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    charts = [synthetic_ohlcv(args.bars, seed=index) for index in range(args.symbols)]
+    inputs = [np.array([chart[column] for chart in charts]) for column in ("open", "high", "low", "close")]
+    workspace = Workspace()
+
+    print(f"종목 수: {args.symbols:,}, 봉 개수: {args.bars:,}, 패턴 수: {len(PATTERNS)}")
+    full = best_time(lambda: candle_patterns(*inputs, workspace=workspace), args.repeat)
+    latest = best_time(lambda: candle_patterns(*inputs, tail=1, workspace=workspace), args.repeat)
+    signals = candle_patterns(*inputs, tail=1)
+
+    print(f"전체 봉 판별  : {full * 1000:8.1f} ms")
+    print(f"마지막 봉 판별: {latest * 1000:8.1f} ms")
+    for name, count in zip(PATTERNS, signals.sum(axis=(1, 2))):
+        print(f"  {name:<22} {count:>6,}종목")
+
+if __name__ == "__main__":
+    main()
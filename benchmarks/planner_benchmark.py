@@ -0,0 +1,73 @@
+"""
+지표 계산 계획(planner) 벤치마크
+
+차트 패널의 일반적인 구성(이동평균 5/10/20/60/120, 볼린저밴드, MACD, RSI, 스토캐스틱,
+EMA 12/26)을 지표 함수 개별 호출과 IndicatorPlan으로 각각 계산하여 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.planner_benchmark [--bars 100000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+from analysis import indicators
+from analysis.planner import IndicatorPlan
+from benchmarks.cases import synthetic_ohlcv
+
+def panel_plan():
+    """일반적인 차트 패널 구성의 계산 계획"""
+    plan = IndicatorPlan()
+    for period in (5, 10, 20, 60, 120):
+        plan.add("moving_average", name=f"ma{period}", period=period)
+    plan.add("exponential_moving_average", name="ema12", period=12)
+    plan.add("exponential_moving_average", name="ema26", period=26)
+    plan.add("bollinger_bands", name="bb")
+    plan.add("macd", name="macd")
+    plan.add("rsi", name="rsi")
+    plan.add("stochastic", name="stoch")
+    return plan
+
+def panel_direct(data):
+    """같은 구성을 지표 함수 개별 호출로 계산"""
+    close = data["close"]
+    results = {}
+    for period in (5, 10, 20, 60, 120):
+        results[f"ma{period}"] = indicators.moving_average(close, period)
+    results["ema12"] = indicators.exponential_moving_average(close, 12)
+    results["ema26"] = indicators.exponential_moving_average(close, 26)
+    results["bb"] = indicators.bollinger_bands(close)
+    results["macd"] = indicators.macd(close)
+    results["rsi"] = indicators.rsi(close)
+    results["stoch"] = indicators.stochastic(data["high"], data["low"], close)
+    return results
+
+def best_time(function, repeat):
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="지표 계산 계획 벤치마크")
+    parser.add_argument("--bars", type=int, default=100000, help="봉 개수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    data = synthetic_ohlcv(args.bars)
+    plan = panel_plan()
+    plan.build()
+
+    direct = best_time(lambda: panel_direct(data), args.repeat)
+    planned = best_time(lambda: plan.evaluate(data), args.repeat)
+
+    print(f"봉 개수: {args.bars:,}, 계산 노드 수: {plan.node_count}")
+    print(f"개별 호출: {direct * 1000:.1f} ms")
+    print(f"계산 계획: {planned * 1000:.1f} ms")
+    print(f"절감: {(1 - planned / direct) * 100:.1f}% (x{direct / planned:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""
+기준(reference) 지표 구현
+
+성능을 고려하지 않은 단순한 구현으로, 벤치마크에서 analysis.indicators의 결과를 검증하는 데 사용합니다.
+구간 계산은 pandas rolling을, 재귀 계산은 봉 단위 파이썬 루프를 사용합니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+def moving_average(data, period=20):
+    """단순 이동평균"""
+    return pd.Series(data).rolling(period).mean().to_numpy()
+
+def moving_average_bank(data, periods=(5, 10, 20, 60, 120)):
+    """여러 기간의 단순 이동평균"""
+    return np.array([moving_average(data, period) for period in periods])
+
+def exponential_moving_average(data, period=20):
+    """지수 이동평균 (첫 값은 기간 평균)"""
+    ema = np.full(len(data), np.nan)
+    if len(data) < period:
+        return ema
+
+    k = 2 / (period + 1)
+    ema[period-1] = np.mean(data[:period])
+    for i in range(period, len(data)):
+        ema[i] = data[i] * k + ema[i-1] * (1 - k)
+    return ema
+
+def bollinger_bands(data, period=20, std_dev=2):
+    """볼린저 밴드 (모표준편차)"""
+    series = pd.Series(data).rolling(period)
+    middle = series.mean().to_numpy()
+    std = series.std(ddof=0).to_numpy()
+    return middle, middle + std_dev * std, middle - std_dev * std
+
+def macd(data, fast_period=12, slow_period=26, signal_period=9):
+    """MACD (시그널은 MACD 라인이 유효한 구간부터 계산)"""
+    macd_line = exponential_moving_average(data, fast_period) - exponential_moving_average(data, slow_period)
+    start = max(fast_period, slow_period) - 1
+    signal_line = np.full(len(data), np.nan)
+    signal_line[start:] = exponential_moving_average(macd_line[start:], signal_period)
+    return macd_line, signal_line, macd_line - signal_line
+
+def rsi(data, period=14):
+    """RSI (Wilder 평활)"""
+    result = np.full(len(data), np.nan)
+    if len(data) < period + 1:
+        return result
+
+    delta = np.diff(data)
+    gains = [max(change, 0.0) for change in delta]
+    losses = [max(-change, 0.0) for change in delta]
+
+    avg_gain = np.mean(gains[:period])
+    avg_loss = np.mean(losses[:period])
+    for i in range(period, len(data)):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + gains[i-1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[i-1]) / period
+        rs = 100 if avg_loss == 0 else avg_gain / avg_loss
+        result[i] = 100 - 100 / (1 + rs)
+    return result
+
+def stochastic(high_data, low_data, close_data, k_period=14, d_period=3):
+    """스토캐스틱 (%K 구간 폭이 0이면 50)"""
+    high_max = pd.Series(high_data).rolling(k_period).max().to_numpy()
+    low_min = pd.Series(low_data).rolling(k_period).min().to_numpy()
+    price_range = high_max - low_min
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * (close_data - low_min) / price_range
+    k[price_range == 0] = 50
+    d = pd.Series(k).rolling(d_period).mean().to_numpy()
+    return k, d
+
+def ichimoku_cloud(high_data, low_data, close_data, tenkan_period=9, kijun_period=26, senkou_span_b_period=52, displacement=26):
+    """일목균형표 (선행스팬 앞부분과 후행스팬 뒷부분은 0)"""
+    def midpoint(period):
+        high_max = pd.Series(high_data).rolling(period).max().to_numpy()
+        low_min = pd.Series(low_data).rolling(period).min().to_numpy()
+        return (high_max + low_min) / 2
+
+    length = len(close_data)
+    tenkan_sen = midpoint(tenkan_period)
+    kijun_sen = midpoint(kijun_period)
+    span_b = midpoint(senkou_span_b_period)
+
+    senkou_span_a = np.zeros(length)
+    senkou_span_b = np.zeros(length)
+    chikou_span = np.zeros(length)
+    for i in range(length - displacement):
+        if i >= kijun_period - 1:
+            senkou_span_a[i + displacement] = (tenkan_sen[i] + kijun_sen[i]) / 2
+        if i >= senkou_span_b_period - 1:
+            senkou_span_b[i + displacement] = span_b[i]
+        chikou_span[i] = close_data[i + displacement]
+    return tenkan_sen, kijun_sen, senkou_span_a, senkou_span_b, chikou_span
+
+def on_balance_volume(close_data, volume_data):
+    """OBV"""
+    obv = np.zeros(len(close_data))
+    obv[0] = volume_data[0]
+    for i in range(1, len(close_data)):
+        obv[i] = obv[i-1] + np.sign(close_data[i] - close_data[i-1]) * volume_data[i]
+    return obv
+
+def true_range(high_data, low_data, close_data):
+    """True Range (첫 값은 고가 - 저가)"""
+    tr = np.array(high_data - low_data, dtype=np.float64)
+    for i in range(1, len(tr)):
+        tr[i] = max(high_data[i] - low_data[i], abs(high_data[i] - close_data[i-1]), abs(low_data[i] - close_data[i-1]))
+    return tr
+
+def average_directional_index(high_data, low_data, close_data, period=14):
+    """ADX, +DI, -DI (Wilder 평활)"""
+    length = len(close_data)
+    adx = np.full(length, np.nan)
+    plus_di = np.full(length, np.nan)
+    minus_di = np.full(length, np.nan)
+
+    tr = true_range(high_data, low_data, close_data)
+    smoothed_tr = smoothed_plus = smoothed_minus = 0.0
+    dx_values = []
+    for i in range(1, length):
+        up_move = high_data[i] - high_data[i-1]
+        down_move = low_data[i-1] - low_data[i]
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        if i <= period:
+            smoothed_tr += tr[i]
+            smoothed_plus += plus_dm
+            smoothed_minus += minus_dm
+            if i < period:
+                continue
+        else:
+            smoothed_tr = smoothed_tr - smoothed_tr / period + tr[i]
+            smoothed_plus = smoothed_plus - smoothed_plus / period + plus_dm
+            smoothed_minus = smoothed_minus - smoothed_minus / period + minus_dm
+
+        plus_di[i] = 0.0 if smoothed_tr == 0 else 100 * smoothed_plus / smoothed_tr
+        minus_di[i] = 0.0 if smoothed_tr == 0 else 100 * smoothed_minus / smoothed_tr
+        di_sum = plus_di[i] + minus_di[i]
+        dx_values.append(0.0 if di_sum == 0 else 100 * abs(plus_di[i] - minus_di[i]) / di_sum)
+
+        if len(dx_values) == period:
+            adx[i] = np.mean(dx_values)
+        elif len(dx_values) > period:
+            adx[i] = (adx[i-1] * (period - 1) + dx_values[-1]) / period
+    return adx, plus_di, minus_di
+
+def parabolic_sar(high_data, low_data, close_data, af_start=0.02, af_increment=0.02, af_max=0.2):
+    """Parabolic SAR"""
+    sar = np.zeros(len(close_data))
+    trend, ep, af = 1, high_data[0], af_start
+    sar[0] = low_data[0]
+    for i in range(1, len(close_data)):
+        sar[i] = sar[i-1] + af * (ep - sar[i-1])
+        if trend == 1:
+            if sar[i] > min(low_data[i], low_data[i-1]):
+                trend, sar[i], ep, af = -1, max(high_data[i], high_data[i-1]), low_data[i], af_start
+            elif high_data[i] > ep:
+                ep, af = high_data[i], min(af + af_increment, af_max)
+        else:
+            if sar[i] < max(high_data[i], high_data[i-1]):
+                trend, sar[i], ep, af = 1, min(low_data[i], low_data[i-1]), high_data[i], af_start
+            elif low_data[i] < ep:
+                ep, af = low_data[i], min(af + af_increment, af_max)
+    return sar
+
+def average_true_range(high_data, low_data, close_data, period=14):
+    """ATR (두 번째 봉부터 period개 True Range 평균 이후 Wilder 평활)"""
+    atr = np.full(len(close_data), np.nan)
+    if len(close_data) < period + 1:
+        return atr
+
+    tr = true_range(high_data, low_data, close_data)
+    atr[period] = np.mean(tr[1:period+1])
+    for i in range(period + 1, len(close_data)):
+        atr[i] = (atr[i-1] * (period - 1) + tr[i]) / period
+    return atr
+
+def vwap(high_data, low_data, close_data, volume_data, date_data=None):
+    """거래일별 VWAP"""
+    frame = pd.DataFrame({
+        "price_volume": (high_data + low_data + close_data) / 3 * volume_data,
+        "volume": volume_data,
+        "date": 0 if date_data is None else date_data,
+    })
+    sessions = frame.groupby("date", sort=False)
+    return (sessions["price_volume"].cumsum() / sessions["volume"].cumsum()).to_numpy()
+
+def commodity_channel_index(high_data, low_data, close_data, period=20):
+    """CCI"""
+    price = pd.Series((high_data + low_data + close_data) / 3)
+    window = price.rolling(period)
+    deviation = window.apply(lambda values: np.abs(values - values.mean()).mean(), raw=True)
+    cci = ((price - window.mean()) / (0.015 * deviation)).to_numpy().copy()
+    cci[deviation.to_numpy() == 0] = 0
+    return cci
+
+def williams_r(high_data, low_data, close_data, period=14):
+    """Williams %R"""
+    high_max = pd.Series(high_data).rolling(period).max().to_numpy()
+    low_min = pd.Series(low_data).rolling(period).min().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        williams = -100 * (high_max - close_data) / (high_max - low_min)
+    williams[high_max == low_min] = -50
+    return williams
+
+def money_flow_index(high_data, low_data, close_data, volume_data, period=14):
+    """MFI"""
+    price = (high_data + low_data + close_data) / 3
+    money_flow = price * volume_data
+    change = np.diff(price, prepend=np.nan)
+    positive = pd.Series(np.where(change > 0, money_flow, 0.0)).rolling(period).sum().to_numpy()
+    negative = pd.Series(np.where(change < 0, money_flow, 0.0)).rolling(period).sum().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mfi = 100 * positive / (positive + negative)
+    mfi[positive + negative == 0] = 50
+    mfi[:period] = np.nan
+    return mfi
+
+def keltner_channels(high_data, low_data, close_data, ema_period=20, atr_period=10, multiplier=2):
+    """켈트너 채널 (종가 EMA ± 배수 × ATR)"""
+    middle = exponential_moving_average(close_data, ema_period)
+    band = multiplier * average_true_range(high_data, low_data, close_data, atr_period)
+    return middle, middle + band, middle - band
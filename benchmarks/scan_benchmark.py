@@ -0,0 +1,75 @@
+"""
+종목 전체 스캔 확장성 벤치마크
+
+합성 종목 데이터를 공유 메모리에 올리고, 수십 개의 지표/파라미터 조합을
+워커 수를 바꿔 가며 UniverseScanner로 계산하여 속도 향상과 병렬 효율을 측정합니다.
+
+실행:
+    python -m benchmarks.scan_benchmark [--symbols 2500] [--bars 500] [--workers 1 2 4 8 16]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from analysis.scan import SharedOHLCV, UniverseScanner
+from benchmarks.cases import synthetic_ohlcv
+
+def scan_requests(scanner):
+    """일반적인 장 마감 스캔 구성 (지표/파라미터 조합)"""
+    for period in (5, 10, 20, 60, 120):
+        scanner.add("moving_average", period=period)
+    for period in (12, 26, 50):
+        scanner.add("exponential_moving_average", period=period)
+    for period in (7, 14, 21):
+        scanner.add("rsi", period=period)
+        scanner.add("average_true_range", period=period)
+        scanner.add("williams_r", period=period)
+    for period, std_dev in ((20, 2), (20, 2.5), (60, 2)):
+        scanner.add("bollinger_bands", period=period, std_dev=std_dev)
+    scanner.add("macd")
+    scanner.add("macd", fast_period=5, slow_period=35, signal_period=5)
+    scanner.add("stochastic")
+    scanner.add("stochastic", k_period=5, d_period=3)
+    scanner.add("ichimoku_cloud")
+    scanner.add("on_balance_volume")
+    scanner.add("average_directional_index")
+    scanner.add("parabolic_sar")
+    scanner.add("commodity_channel_index")
+    scanner.add("money_flow_index")
+    return scanner
+
+def main():
+    parser = argparse.ArgumentParser(description="종목 전체 스캔 확장성 벤치마크")
+    parser.add_argument("--symbols", type=int, default=2500, help="종목 수")
+    parser.add_argument("--bars", type=int, default=500, help="종목별 봉 개수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="워커 수 목록")
+    args = parser.parse_args()
+
+    chart_data = {f"{index:06d}": synthetic_ohlcv(args.bars, seed=index) for index in range(args.symbols)}
+
+    print(f"종목 수: {args.symbols:,}, 봉 개수: {args.bars:,}, CPU 수: {os.cpu_count()}")
+    with SharedOHLCV.from_chart_data(chart_data) as shared:
+        scan_requests(UniverseScanner(workers=1)).run(shared)  # 준비 실행 (JIT 컴파일 등)
+
+        baseline = None
+        expected = None
+        for workers in args.workers:
+            scanner = scan_requests(UniverseScanner(workers=workers))
+            start = time.perf_counter()
+            values = scanner.run(shared)
+            elapsed = time.perf_counter() - start
+
+            if baseline is None:
+                baseline, expected = elapsed * workers, values
+                print(f"지표 조합 수: {len(scanner.requests)}, 출력 수: {len(scanner.output_names)}")
+            elif not np.array_equal(values, expected, equal_nan=True):
+                raise SystemExit(f"워커 {workers}개 결과가 첫 실행과 다릅니다.")
+
+            speedup = baseline / elapsed
+            print(f"워커 {workers:>3}개: {elapsed:8.2f} s  속도 향상 x{speedup:5.2f}  효율 {speedup / workers * 100:5.1f}%")
+
+if __name__ == "__main__":
+    main()
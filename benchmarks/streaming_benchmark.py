@@ -0,0 +1,131 @@
+"""
+실시간 지표 상태 벤치마크
+
+analysis.streaming의 상태 클래스를 합성 OHLCV 데이터로 한 봉씩 갱신하여
+길이 1부터 최소 데이터 길이의 3배(60개 이상)까지 모든 길이에서 일괄 계산 함수의 마지막 값과
+비트 단위로 같은지 확인합니다 (봉 추가, from_history 두 경로).
+전체 데이터에 대해서는 봉당 갱신 시간과 일괄 재계산 시간을 비교합니다.
+
+실행:
+    python -m benchmarks.streaming_benchmark [--bars 2000] [--seed 0]
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from analysis import indicators, streaming
+from benchmarks.cases import synthetic_ohlcv
+
+# (지표 함수 이름, 상태 클래스 이름, 입력 컬럼, 파라미터, 일괄 계산 최소 데이터 길이)
+# 기본값에서는 드러나지 않는 최소 길이 차이를 확인하도록 기본값 외의 파라미터 조합도 포함합니다.
+STREAMING_CASES = [
+    ("exponential_moving_average", "EMAState", ("close",), {}, 20),
+    ("exponential_moving_average", "EMAState", ("close",), {"period": 3}, 3),
+    ("rsi", "RSIState", ("close",), {}, 15),
+    ("rsi", "RSIState", ("close",), {"period": 5}, 6),
+    ("macd", "MACDState", ("close",), {}, 35),
+    ("macd", "MACDState", ("close",), {"fast_period": 5, "slow_period": 35, "signal_period": 5}, 40),
+    ("macd", "MACDState", ("close",), {"fast_period": 20, "slow_period": 8, "signal_period": 3}, 11),
+    ("on_balance_volume", "OBVState", ("close", "volume"), {}, 2),
+    ("average_directional_index", "ADXState", ("high", "low", "close"), {}, 28),
+    ("average_directional_index", "ADXState", ("high", "low", "close"), {"period": 5}, 10),
+    ("parabolic_sar", "ParabolicSARState", ("high", "low", "close"), {}, 2),
+    ("average_true_range", "ATRState", ("high", "low", "close"), {}, 15),
+    ("average_true_range", "ATRState", ("high", "low", "close"), {"period": 30}, 31),
+    ("vwap", "VWAPState", ("high", "low", "close", "volume", "date"), {}, 1),
+    ("commodity_channel_index", "CCIState", ("high", "low", "close"), {}, 20),
+    ("commodity_channel_index", "CCIState", ("high", "low", "close"), {"period": 7}, 7),
+    ("williams_r", "WilliamsRState", ("high", "low", "close"), {}, 14),
+    ("money_flow_index", "MFIState", ("high", "low", "close", "volume"), {}, 15),
+    ("money_flow_index", "MFIState", ("high", "low", "close", "volume"), {"period": 4}, 5),
+    ("keltner_channels", "KeltnerState", ("high", "low", "close"), {}, 20),
+    ("keltner_channels", "KeltnerState", ("high", "low", "close"), {"ema_period": 5, "atr_period": 20}, 21),
+    ("keltner_channels", "KeltnerState", ("high", "low", "close"), {"ema_period": 30, "atr_period": 5}, 30),
+]
+
+def as_tuple(value):
+    """값을 튜플로 변환"""
+    return value if isinstance(value, tuple) else (value,)
+
+def same_values(actual, expected):
+    """NaN 위치까지 비트 단위로 같은지 비교"""
+    return all(
+        (np.isnan(a) and np.isnan(b)) or a == b
+        for a, b in zip(as_tuple(actual), as_tuple(expected))
+    )
+
+def check_lengths(function, state_class, inputs, params, max_length):
+    """
+    길이별 상태 값과 일괄 계산 마지막 값 비교
+
+    Returns:
+        list: 값이 다른 (경로, 길이) 목록
+    """
+    mismatches = []
+    state = state_class(**params)
+    for length in range(1, max_length + 1):
+        prefix = [values[:length] for values in inputs]
+        expected = tuple(np.asarray(values)[-1] for values in as_tuple(function(*prefix, **params)))
+
+        state.append(*[values[length-1] for values in inputs])
+        if not same_values(state.value, expected):
+            mismatches.append(("append", length))
+        if not same_values(state_class.from_history(*prefix, **params).value, expected):
+            mismatches.append(("from_history", length))
+    return mismatches
+
+def time_updates(function, state_class, inputs, params):
+    """
+    봉당 갱신 시간과 일괄 재계산 시간 측정
+
+    Returns:
+        tuple: (봉당 update 시간(초), 일괄 재계산 시간(초))
+    """
+    history = [values[:-1] for values in inputs]
+    state = state_class.from_history(*history, **params)
+    last = [values[-1] for values in inputs]
+
+    start = time.perf_counter()
+    for _ in range(100):
+        state.update(*last)
+        state.rollback()
+    update_time = (time.perf_counter() - start) / 100
+
+    start = time.perf_counter()
+    function(*inputs, **params)
+    batch_time = time.perf_counter() - start
+    return update_time, batch_time
+
+def main():
+    parser = argparse.ArgumentParser(description="실시간 지표 상태 벤치마크")
+    parser.add_argument("--bars", type=int, default=2000, help="시간 측정용 봉 개수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    data = synthetic_ohlcv(args.bars, args.seed)
+    failed = False
+
+    print(f"봉 개수: {args.bars:,}")
+    for name, state_name, columns, params, min_length in STREAMING_CASES:
+        function = getattr(indicators, name)
+        state_class = getattr(streaming, state_name)
+        inputs = [data[column] for column in columns]
+
+        max_length = max(min_length * 3, 60)
+        mismatches = check_lengths(function, state_class, inputs, params, max_length)
+        update_time, batch_time = time_updates(function, state_class, inputs, params)
+        failed |= bool(mismatches)
+
+        label = state_name + (f"({','.join(str(value) for value in params.values())})" if params else "")
+        print(f"{label:<24} 길이 1~{max_length:<4} 일치: {not mismatches!s:<5} "
+              f"봉당 갱신 {update_time * 1e6:8.1f} us, 일괄 재계산 {batch_time * 1000:8.2f} ms")
+        for path, length in mismatches[:5]:
+            print(f"  불일치: {path} 길이 {length}")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,8 @@ import logging
 from PyQt5.QtCore import QObject, pyqtSignal, QEventLoop
 from PyQt5.QAxContainer import QAxWidget
 
+from .tr_schema import parse_tr
+
 class KiwoomData(QObject):
     """
     키움 API 데이터 조회 클래스
@@ -272,25 +274,8 @@ class KiwoomData(QObject):
             self.logger.debug(f"TR 데이터 수신: {rqname}, {trcode}")
             
             if rqname == "주식기본정보요청" and trcode == "opt10001":
-                # OPT10001 TR 응답 처리
-                columns = [
-                    "종목코드", "종목명", "결산월", "액면가", "자본금", "상장주식", "신용비율", 
-                    "연중최고", "시가총액", "시가총액비중", "외인소진률", "대용가", "PER", "EPS", 
-                    "ROE", "PBR", "EV", "BPS", "매출액", "영업이익", "당기순이익", "250최고", 
-                    "250최저", "시가", "고가", "저가", "상한가", "하한가", "기준가", "예상체결가", 
-                    "예상체결수량", "250최고가일", "250최고가대비율", "250최저가일", "250최저가대비율", 
-                    "현재가", "대비기호", "전일대비", "등락율", "거래량", "거래대비", "액면가단위", 
-                    "유통주식", "유통비율"
-                ]
-                
-                self.tr_data = {}
-                for col in columns:
-                    value = self.ocx.dynamicCall(
-                        "GetCommData(QString, QString, int, QString)", 
-                        trcode, rqname, 0, col
-                    ).strip()
-                    self.tr_data[col] = value
-                    self.logger.debug(f"{col}: {value}")
+                # OPT10001 TR 응답 처리 (tr_schema에 등록된 스키마로 변환)
+                self.tr_data = parse_tr(self.ocx, trcode, rqname)
                     
                 self.logger.debug(f"종목 정보 수신 완료: {self.tr_data}")
                 
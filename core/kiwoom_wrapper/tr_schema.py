@@ -0,0 +1,324 @@
+"""
+키움 API TR 스키마 모듈
+
+TR별 출력 항목, 결과 컬럼 이름, 자료형, 부호 제거 여부와 단일/반복(멀티) 데이터 구분을
+선언적으로 등록하고, 등록된 스키마로 TR 응답을 numpy 컬럼으로 변환하는 범용 파서를 제공합니다.
+
+스키마는 처음 사용할 때 한 번 컴파일되어 항목별 열 위치와 변환 함수를 미리 계산합니다.
+반복 데이터는 GetCommDataEx로 전체 블록을 한 번에 받고, 블록을 사용할 수 없으면
+같은 변환 함수로 항목별 GetCommData 결과를 변환하므로 두 경로의 결과 자료형이 같습니다.
+
+새 TR은 kiwoomtr.md의 출력 항목으로 스키마를 등록하기만 하면 됩니다.
+    register_schema(TRSchema("opt10004", "주식호가요청", single=(TRField("매도최우선호가", "ask", "abs"), ...)))
+    data = parse_tr(ocx, "opt10004", rqname)
+"""
+
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 변환 방식: numpy 자료형
+FIELD_KINDS = {
+    "str": str,           # 앞뒤 공백을 제거한 문자열
+    "int": np.int64,      # 정수
+    "abs": np.int64,      # 부호(+/-, 등락 표시)를 제거한 정수
+    "float": np.float64,  # 실수
+}
+
+class TRField:
+    """
+    TR 출력 항목
+    
+    같은 출력 항목을 part로 나누어 여러 결과 컬럼에 사용할 수 있습니다 (예: 체결시간 → 날짜, 시간).
+    """
+    
+    def __init__(self, name, column=None, kind="str", part=None):
+        """
+        초기화
+        
+        Args:
+            name (str): 출력 항목명 (KOA Studio 항목명)
+            column (str): 결과 컬럼 이름 (None이면 항목명)
+            kind (str): 변환 방식 ("str", "int", "abs", "float")
+            part (tuple): 문자열에서 사용할 구간 (시작, 끝) - str 방식에서만 사용
+        """
+        if kind not in FIELD_KINDS:
+            raise ValueError(f"지원하지 않는 변환 방식입니다: {kind}")
+        
+        self.name = name
+        self.column = name if column is None else column
+        self.kind = kind
+        self.part = part
+    
+    def convert(self, values):
+        """
+        문자열 배열 변환
+        
+        Args:
+            values (numpy.ndarray): 앞뒤 공백을 제거한 문자열 배열
+        
+        Returns:
+            numpy.ndarray: 변환된 배열
+        """
+        if self.kind == "str":
+            if self.part is None:
+                return values
+            start, stop = self.part
+            if start == 0:
+                return values.astype(f"U{stop}")
+            return np.array([value[start:stop] for value in values.tolist()], dtype=str)
+        
+        # 빈 값은 0
+        values = np.where(values == "", "0", values)
+        result = values.astype(FIELD_KINDS[self.kind])
+        if self.kind == "abs":
+            np.abs(result, out=result)
+        return result
+
+class TRSchema:
+    """
+    TR 스키마
+    
+    단일 데이터 항목은 스칼라로, 반복 데이터 항목은 행 수 길이의 numpy 배열로 변환됩니다.
+    layout은 GetCommDataEx 블록의 열 순서(반복 데이터 전체 출력 항목)이며, 없으면 항목별로 조회합니다.
+    """
+    
+    def __init__(self, trcode, name, single=(), multi=(), layout=None):
+        """
+        초기화
+        
+        Args:
+            trcode (str): TR 코드
+            name (str): TR 이름
+            single (tuple): 단일 데이터 TRField 목록
+            multi (tuple): 반복 데이터 TRField 목록
+            layout (tuple): 반복 데이터 전체 출력 항목명 (GetCommDataEx 열 순서)
+        """
+        self.trcode = trcode
+        self.name = name
+        self.single = tuple(single)
+        self.multi = tuple(multi)
+        self.layout = None if layout is None else tuple(layout)
+        self._compiled = None
+    
+    @property
+    def columns(self):
+        """결과 컬럼 이름 목록"""
+        return tuple(field.column for field in self.single + self.multi)
+    
+    def compile(self):
+        """
+        스키마 컴파일 (한 번만 수행)
+        
+        반복 데이터 항목을 출력 항목명별로 묶고 블록 열 위치를 미리 계산합니다.
+        
+        Returns:
+            tuple: ((출력 항목명, 블록 열 위치, 해당 항목의 TRField 목록), ...)
+        """
+        if self._compiled is None:
+            sources = {}
+            for field in self.multi:
+                sources.setdefault(field.name, []).append(field)
+            
+            positions = {}
+            if self.layout is not None:
+                missing = [name for name in sources if name not in self.layout]
+                if missing:
+                    raise ValueError(f"{self.trcode} 블록 항목 순서에 없는 항목입니다: {', '.join(missing)}")
+                positions = {name: self.layout.index(name) for name in sources}
+            
+            self._compiled = tuple((name, positions.get(name), tuple(fields)) for name, fields in sources.items())
+        return self._compiled
+    
+    def _read_block(self, ocx, trcode, rqname):
+        """
+        반복 데이터 일괄 조회 (GetCommDataEx)
+        
+        첫 행 값을 GetCommData 결과와 비교하여 열 순서가 다르거나 행의 열 수가 부족하면 사용하지 않습니다.
+        
+        Returns:
+            dict: {출력 항목명: 문자열 배열} (사용할 수 없으면 None)
+        """
+        if self.layout is None:
+            return None
+        
+        try:
+            block = ocx.dynamicCall("GetCommDataEx(QString, QString)", trcode, rqname)
+        except Exception as e:
+            logger.warning(f"{trcode} 일괄 조회 실패, 항목별 조회로 처리합니다: {str(e)}")
+            return None
+        if not block:
+            return None
+        
+        values = {}
+        for name, position, _ in self.compile():
+            try:
+                column = np.char.strip(np.array([row[position] for row in block], dtype=str))
+            except IndexError:
+                logger.warning(f"{trcode} 일괄 조회 행의 열 수가 항목 순서보다 적습니다: {name}")
+                return None
+            expected = ocx.dynamicCall("GetCommData(QString, QString, int, QString)", trcode, rqname, 0, name).strip()
+            if column[0] != expected:
+                logger.warning(f"{trcode} 일괄 조회 항목 순서가 다릅니다: {name}")
+                return None
+            values[name] = column
+        return values
+    
+    def _read_cells(self, ocx, trcode, rqname):
+        """
+        반복 데이터 항목별 조회 (GetCommData)
+        
+        Returns:
+            dict: {출력 항목명: 문자열 배열}
+        """
+        count = ocx.dynamicCall("GetRepeatCnt(QString, QString)", trcode, rqname)
+        values = {}
+        for name, _, _ in self.compile():
+            cells = [ocx.dynamicCall("GetCommData(QString, QString, int, QString)", trcode, rqname, row, name)
+                     for row in range(count)]
+            values[name] = np.char.strip(np.array(cells, dtype=str))
+        return values
+    
+    def parse(self, ocx, trcode, rqname):
+        """
+        TR 응답 변환
+        
+        Args:
+            ocx: 키움 API OCX 객체
+            trcode (str): TR 코드
+            rqname (str): 사용자 구분명
+        
+        Returns:
+            dict: {결과 컬럼: 값} - 단일 데이터는 스칼라, 반복 데이터는 numpy 배열
+        """
+        result = {}
+        for field in self.single:
+            value = ocx.dynamicCall("GetCommData(QString, QString, int, QString)", trcode, rqname, 0, field.name).strip()
+            try:
+                result[field.column] = field.convert(np.array([value], dtype=str))[0].item()
+            except ValueError:
+                # 변환할 수 없는 값은 빈 값과 같이 0 (다른 항목은 그대로 변환)
+                logger.warning(f"{trcode} {field.name} 값을 변환할 수 없어 0으로 처리합니다: {value!r}")
+                result[field.column] = FIELD_KINDS[field.kind](0).item()
+        
+        if self.multi:
+            values = self._read_block(ocx, trcode, rqname)
+            if values is not None:
+                try:
+                    result.update(self._convert(values))
+                    return result
+                except ValueError as e:
+                    logger.warning(f"{trcode} 일괄 조회 변환 실패, 항목별 조회로 처리합니다: {str(e)}")
+            result.update(self._convert(self._read_cells(ocx, trcode, rqname)))
+        
+        return result
+    
+    def _convert(self, values):
+        """출력 항목별 문자열 배열을 결과 컬럼으로 변환"""
+        return {
+            field.column: field.convert(values[name])
+            for name, _, fields in self.compile() for field in fields
+        }
+
+# 등록된 TR 스키마 (TR 코드: TRSchema)
+TR_SCHEMAS = {}
+
+def register_schema(schema):
+    """
+    TR 스키마 등록
+    
+    Args:
+        schema (TRSchema): 등록할 스키마 (같은 TR 코드는 교체)
+    
+    Returns:
+        TRSchema: 등록한 스키마
+    """
+    TR_SCHEMAS[schema.trcode] = schema
+    return schema
+
+def get_schema(trcode):
+    """
+    TR 스키마 조회
+    
+    Args:
+        trcode (str): TR 코드
+    
+    Returns:
+        TRSchema: 등록된 스키마 (없으면 None)
+    """
+    return TR_SCHEMAS.get(trcode)
+
+def parse_tr(ocx, trcode, rqname):
+    """
+    등록된 스키마로 TR 응답 변환
+    
+    Args:
+        ocx: 키움 API OCX 객체
+        trcode (str): TR 코드
+        rqname (str): 사용자 구분명
+    
+    Returns:
+        dict: {결과 컬럼: 값}
+    """
+    schema = TR_SCHEMAS.get(trcode)
+    if schema is None:
+        raise KeyError(f"등록되지 않은 TR입니다: {trcode}")
+    return schema.parse(ocx, trcode, rqname)
+
+# 차트 TR 공통 항목
+_CHART_PRICES = (
+    TRField("시가", "open", "abs"),
+    TRField("고가", "high", "abs"),
+    TRField("저가", "low", "abs"),
+    TRField("현재가", "close", "abs"),
+    TRField("거래량", "volume", "int"),
+)
+_CHART_TIME = (
+    TRField("체결시간", "date", "str", (0, 8)),    # YYYYMMDD
+    TRField("체결시간", "time", "str", (8, 12)),   # HHMM
+)
+_CHART_DATE = (TRField("일자", "date", "str"),)
+_CHART_CODE = (TRField("종목코드", "code", "str"),)
+_CHART_ADJUSTMENT = ("수정주가구분", "수정비율", "대업종구분", "소업종구분", "종목정보", "수정주가이벤트", "전일종가")
+
+# 차트 TR (KOA Studio 반복 데이터 출력 항목 순서)
+register_schema(TRSchema(
+    "opt10079", "주식틱차트조회요청", single=_CHART_CODE, multi=_CHART_TIME + _CHART_PRICES,
+    layout=("현재가", "거래량", "체결시간", "시가", "고가", "저가") + _CHART_ADJUSTMENT
+))
+register_schema(TRSchema(
+    "opt10080", "주식분봉차트조회요청", single=_CHART_CODE, multi=_CHART_TIME + _CHART_PRICES,
+    layout=("현재가", "거래량", "체결시간", "시가", "고가", "저가") + _CHART_ADJUSTMENT
+))
+register_schema(TRSchema(
+    "opt10081", "주식일봉차트조회요청", single=_CHART_CODE, multi=_CHART_DATE + _CHART_PRICES,
+    layout=("종목코드", "현재가", "거래량", "거래대금", "일자", "시가", "고가", "저가") + _CHART_ADJUSTMENT
+))
+register_schema(TRSchema(
+    "opt10082", "주식주봉차트조회요청", single=_CHART_CODE, multi=_CHART_DATE + _CHART_PRICES,
+    layout=("현재가", "거래량", "거래대금", "일자", "시가", "고가", "저가") + _CHART_ADJUSTMENT
+))
+register_schema(TRSchema(
+    "opt10083", "주식월봉차트조회요청", single=_CHART_CODE, multi=_CHART_DATE + _CHART_PRICES,
+    layout=("현재가", "거래량", "거래대금", "일자", "시가", "고가", "저가") + _CHART_ADJUSTMENT
+))
+
+# 주식기본정보 (결과 컬럼은 항목명, 가격은 부호 제거 정수, 표시용 재무 항목은 문자열)
+register_schema(TRSchema("opt10001", "주식기본정보요청", single=(
+    TRField("종목코드"), TRField("종목명"), TRField("결산월"), TRField("액면가"), TRField("자본금"),
+    TRField("상장주식"), TRField("신용비율"), TRField("연중최고", kind="abs"), TRField("연중최저", kind="abs"),
+    TRField("시가총액"), TRField("시가총액비중"), TRField("외인소진률"), TRField("대용가"),
+    TRField("PER"), TRField("EPS"), TRField("ROE"), TRField("PBR"), TRField("EV"), TRField("BPS"),
+    TRField("매출액"), TRField("영업이익"), TRField("당기순이익"),
+    TRField("250최고", kind="abs"), TRField("250최저", kind="abs"),
+    TRField("시가", kind="abs"), TRField("고가", kind="abs"), TRField("저가", kind="abs"),
+    TRField("상한가", kind="abs"), TRField("하한가", kind="abs"), TRField("기준가", kind="abs"),
+    TRField("예상체결가", kind="abs"), TRField("예상체결수량", kind="int"),
+    TRField("250최고가일"), TRField("250최고가대비율", kind="float"),
+    TRField("250최저가일"), TRField("250최저가대비율", kind="float"),
+    TRField("현재가", kind="abs"), TRField("대비기호"), TRField("전일대비", kind="int"),
+    TRField("등락율", kind="float"), TRField("거래량", kind="int"), TRField("거래대비", kind="float"),
+    TRField("액면가단위"), TRField("유통주식"), TRField("유통비율"),
+)))
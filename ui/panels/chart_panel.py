@@ -14,6 +14,14 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QDate
 import pyqtgraph as pg
 
+from analysis.indicators import moving_average_bank
+from analysis.cache import cached_indicator
+from analysis.viewport import ViewportEvaluator
+from analysis.volume_profile import VolumeProfile
+from analysis.transforms import (
+    CHART_COLUMNS, HeikinAshiTransform, LineBreakTransform, RenkoTransform, TransformPipeline
+)
+
 class CandlestickItem(pg.GraphicsObject):
     """캔들스틱 차트 아이템 클래스"""
     
@@ -92,6 +100,20 @@ class ChartPanel(QWidget):
     # 시그널 정의
     chart_request_signal = pyqtSignal(str, str, int)  # 종목코드, 차트 타입, 틱 범위
     
+    # 화면 구간 지표 계산을 사용하는 최소 봉 개수 (이보다 짧으면 전체를 계산해 캐시)
+    VIEWPORT_MIN_BARS = 5000
+    
+    # 매물대 가격대 개수와 최대 막대 길이 (보이는 X축 범위 대비 비율)
+    VOLUME_PROFILE_ROWS = 50
+    VOLUME_PROFILE_WIDTH = 0.25
+    
+    # 캔들 변환 (콤보박스 항목: 변환 단계 생성 함수) - 받은 봉 데이터를 로컬에서 변환
+    CHART_TRANSFORMS = {
+        "헤이킨아시": lambda: [HeikinAshiTransform()],
+        "렌코": lambda: [RenkoTransform()],
+        "삼선전환도": lambda: [LineBreakTransform()],
+    }
+    
     def __init__(self, kiwoom, parent=None):
         """
         초기화
@@ -121,6 +143,18 @@ class ChartPanel(QWidget):
             "volume": []
         }
         
+        # 화면 구간 지표 계산 (긴 이력에서 보이는 구간만 계산)
+        self.viewport = ViewportEvaluator()
+        self.viewport_active = False
+        
+        # 매물대 (저장된 봉으로 계산, 가격대 경계와 거래량)
+        self.volume_profile = VolumeProfile()
+        self.volume_profile_rows = None
+        
+        # 캔들 변환 (None이면 원본 봉, 파이프라인은 새 봉만 이어서 변환)
+        self.current_transform = None
+        self.transform_pipeline = None
+        
         # UI 초기화
         self._init_ui()
         
@@ -148,6 +182,10 @@ class ChartPanel(QWidget):
         self.tick_range_combo.addItems(["1분", "3분", "5분", "10분", "15분", "30분", "60분"])
         self.tick_range_combo.setEnabled(False)  # 기본적으로 비활성화
         
+        # 캔들 변환 선택
+        self.transform_combo = QComboBox()
+        self.transform_combo.addItems(["일반"] + list(self.CHART_TRANSFORMS))
+        
         # 조회 기간 설정
         self.date_from_label = QLabel("시작일:")
         self.date_from_edit = QDateEdit()
@@ -163,6 +201,10 @@ class ChartPanel(QWidget):
         self.indicator_combo = QComboBox()
         self.indicator_combo.addItems(["없음", "이동평균선", "볼린저밴드", "MACD", "RSI", "스토캐스틱"])
         
+        # 매물대 표시
+        self.volume_profile_checkbox = QCheckBox("매물대")
+        self.volume_profile_checkbox.setChecked(False)
+        
         # 새로고침 버튼
         self.refresh_button = QPushButton("새로고침")
         
@@ -171,12 +213,15 @@ class ChartPanel(QWidget):
         control_layout.addWidget(self.chart_type_combo)
         control_layout.addWidget(QLabel("분봉:"))
         control_layout.addWidget(self.tick_range_combo)
+        control_layout.addWidget(QLabel("캔들:"))
+        control_layout.addWidget(self.transform_combo)
         control_layout.addWidget(self.date_from_label)
         control_layout.addWidget(self.date_from_edit)
         control_layout.addWidget(self.date_to_label)
         control_layout.addWidget(self.date_to_edit)
         control_layout.addWidget(QLabel("지표:"))
         control_layout.addWidget(self.indicator_combo)
+        control_layout.addWidget(self.volume_profile_checkbox)
         control_layout.addStretch(1)
         control_layout.addWidget(self.refresh_button)
         
@@ -197,6 +242,11 @@ class ChartPanel(QWidget):
         self.candle_item = CandlestickItem()
         self.price_plot.addItem(self.candle_item)
         
+        # 매물대 가로 막대 아이템 (보이는 구간 왼쪽에 표시)
+        self.volume_profile_item = pg.BarGraphItem(x0=[], y0=[], width=[], height=[], brush=(128, 128, 128, 80), pen=None)
+        self.volume_profile_item.hide()
+        self.price_plot.addItem(self.volume_profile_item)
+        
         # 이동평균선 아이템들
         self.ma_items = {}
         
@@ -259,12 +309,18 @@ class ChartPanel(QWidget):
             # 분봉 범위 변경 시그널
             self.tick_range_combo.currentIndexChanged.connect(self._on_tick_range_changed)
             
+            # 캔들 변환 변경 시그널
+            self.transform_combo.currentIndexChanged.connect(self._on_transform_changed)
+            
             # 지표 변경 시그널
             self.indicator_combo.currentIndexChanged.connect(self._on_indicator_changed)
             
             # 새로고침 버튼 클릭 시그널
             self.refresh_button.clicked.connect(self._on_refresh_clicked)
             
+            # 매물대 표시 시그널
+            self.volume_profile_checkbox.stateChanged.connect(self._on_volume_profile_changed)
+            
             # 이동평균선 체크박스 시그널
             for period, checkbox in self.ma_checkboxes.items():
                 checkbox.stateChanged.connect(lambda state, p=period: self._on_ma_checkbox_changed(p, state))
@@ -280,6 +336,9 @@ class ChartPanel(QWidget):
             self.date_from_edit.dateChanged.connect(self._on_date_changed)
             self.date_to_edit.dateChanged.connect(self._on_date_changed)
             
+            # 화면 범위 변경 시그널 (확대/이동 시 보이는 구간의 지표 재계산)
+            self.price_plot.getViewBox().sigXRangeChanged.connect(self._on_view_range_changed)
+            
         except Exception as e:
             self.logger.error(f"시그널 연결 중 오류 발생: {str(e)}")
             import traceback
@@ -368,8 +427,14 @@ class ChartPanel(QWidget):
                 
             self.logger.info(f"차트 데이터 수신: {code}, 타입: {chart_type}")
             
+            # 기존 봉에 이어진 데이터가 아니면 캔들 변환을 처음부터 다시 계산
+            merged = self._merge_chart_data(data)
+            if merged is None:
+                self.transform_pipeline = None
+                merged = data
+                
             # 차트 데이터 저장
-            self.chart_data = data
+            self.chart_data = merged
             
             # 차트 업데이트
             self._update_chart()
@@ -382,15 +447,18 @@ class ChartPanel(QWidget):
     def _update_chart(self):
         """차트 업데이트"""
         try:
-            if not self.chart_data or not self.chart_data.get("date"):
+            if not self.chart_data or len(self.chart_data.get("date", [])) == 0:
                 self.logger.warning("업데이트할 차트 데이터가 없습니다.")
                 return
                 
             self.logger.info("차트 업데이트 시작")
             
+            # 표시할 봉 (캔들 변환 선택 시 변환 결과)
+            chart_data = self._display_data()
+            
             # 날짜/시간 데이터 변환
-            dates = self.chart_data["date"]
-            times = self.chart_data.get("time", ["" for _ in dates])
+            dates = chart_data["date"]
+            times = chart_data.get("time", ["" for _ in dates])
             
             # X축 인덱스 생성
             x_data = np.arange(len(dates))
@@ -398,21 +466,21 @@ class ChartPanel(QWidget):
             # 캔들스틱 데이터 설정
             candle_data = {
                 "time": x_data,
-                "open": self.chart_data["open"],
-                "high": self.chart_data["high"],
-                "low": self.chart_data["low"],
-                "close": self.chart_data["close"]
+                "open": chart_data["open"],
+                "high": chart_data["high"],
+                "low": chart_data["low"],
+                "close": chart_data["close"]
             }
             self.candle_item.set_data(candle_data)
             
             # 거래량 데이터 설정
-            volume_data = self.chart_data["volume"]
+            volume_data = chart_data["volume"]
             self.volume_bars.setOpts(x=x_data, height=volume_data, width=0.6)
             
             # 거래량 색상 설정 (양봉: 빨간색, 음봉: 파란색)
             colors = []
             for i in range(len(x_data)):
-                if i > 0 and self.chart_data["close"][i] >= self.chart_data["close"][i-1]:
+                if i > 0 and chart_data["close"][i] >= chart_data["close"][i-1]:
                     colors.append('r')
                 else:
                     colors.append('b')
@@ -432,23 +500,26 @@ class ChartPanel(QWidget):
             x_axis.setTicks([[(i, format_x_tick(i)) for i in range(0, len(dates), max(1, len(dates)//10))]])
             
             # 이동평균선 계산 및 표시
-            self._calculate_moving_averages(x_data)
+            self._calculate_moving_averages(x_data, chart_data)
+            
+            # 매물대 계산
+            self._calculate_volume_profile()
             
             # 차트 범위 설정 - Y축 자동 조정
             self.price_plot.autoRange()
             self.volume_plot.autoRange()
             
             # Y축 범위 고정 (최고가와 최저가 기준으로 여유 공간 추가)
-            if len(self.chart_data["high"]) > 0 and len(self.chart_data["low"]) > 0:
-                max_price = max(self.chart_data["high"])
-                min_price = min(self.chart_data["low"])
+            if len(chart_data["high"]) > 0 and len(chart_data["low"]) > 0:
+                max_price = max(chart_data["high"])
+                min_price = min(chart_data["low"])
                 price_range = max_price - min_price
                 
                 # 여유 공간 10% 추가
                 self.price_plot.setYRange(min_price - price_range * 0.1, max_price + price_range * 0.1)
                 
                 # 거래량 차트도 여유 공간 추가
-                max_volume = max(volume_data) if volume_data else 0
+                max_volume = max(volume_data) if len(volume_data) else 0
                 self.volume_plot.setYRange(0, max_volume * 1.1)
             
             self.logger.info("차트 업데이트 완료")
@@ -458,31 +529,44 @@ class ChartPanel(QWidget):
             import traceback
             self.logger.error(traceback.format_exc())
     
-    def _calculate_moving_averages(self, x_data):
+    def _calculate_moving_averages(self, x_data, chart_data):
         """
         이동평균선 계산
         
         Args:
             x_data (numpy.ndarray): X축 데이터
+            chart_data (dict): 표시할 차트 데이터
         """
         try:
-            if not self.chart_data or not self.chart_data.get("close"):
+            if not chart_data or len(chart_data.get("close", [])) == 0:
                 return
                 
-            close_prices = np.array(self.chart_data["close"])
+            close_prices = np.array(chart_data["close"])
+            
+            # 선택된 이동평균선을 한 번에 계산
+            checked_periods = [period for period in self.ma_items if self.ma_checkboxes[period].isChecked()]
+            
+            # 긴 이력은 보이는 구간만 계산
+            self.viewport.clear()
+            self.viewport_active = len(close_prices) >= self.VIEWPORT_MIN_BARS
+            if self.viewport_active:
+                self.viewport.set_data({"close": close_prices})
+                if checked_periods:
+                    self.viewport.add("ma", "moving_average_bank", ("close",), periods=tuple(checked_periods))
+                for period, item in self.ma_items.items():
+                    item.setVisible(period in checked_periods)
+                self._update_visible_indicators()
+                return
+            
+            ma_bank = cached_indicator(
+                self.current_code, self._cache_timeframe(), moving_average_bank,
+                [close_prices], periods=tuple(checked_periods)
+            )
             
             for period, item in self.ma_items.items():
-                if self.ma_checkboxes[period].isChecked():
-                    # 이동평균 계산
-                    ma_values = np.zeros_like(close_prices)
-                    for i in range(len(close_prices)):
-                        if i < period - 1:
-                            ma_values[i] = np.nan
-                        else:
-                            ma_values[i] = np.mean(close_prices[max(0, i-period+1):i+1])
-                    
+                if period in checked_periods:
                     # 이동평균선 데이터 설정
-                    item.setData(x=x_data, y=ma_values)
+                    item.setData(x=x_data, y=ma_bank[checked_periods.index(period)])
                     item.show()
                 else:
                     item.hide()
@@ -492,6 +576,194 @@ class ChartPanel(QWidget):
             import traceback
             self.logger.error(traceback.format_exc())
     
+    def _visible_index_range(self):
+        """
+        화면에 보이는 봉 인덱스 구간
+        
+        Returns:
+            tuple: (시작, 끝) - 끝은 미포함
+        """
+        x_min, x_max = self.price_plot.getViewBox().viewRange()[0]
+        return int(np.floor(x_min)), int(np.ceil(x_max)) + 1
+    
+    def _update_visible_indicators(self):
+        """보이는 구간의 지표 계산 및 표시"""
+        if not self.viewport_active or not self.viewport.requests:
+            return
+            
+        start, stop = self._visible_index_range()
+        results = self.viewport.evaluate(start, stop)
+        
+        # 데이터 범위로 잘린 구간
+        start = min(max(start, 0), self.viewport.length)
+        x_data = np.arange(start, start + results["ma"].shape[-1])
+        
+        periods = self.viewport.requests["ma"][2]["periods"]
+        for row, period in enumerate(periods):
+            self.ma_items[period].setData(x=x_data, y=results["ma"][row])
+    
+    def _on_view_range_changed(self, view_box, x_range):
+        """
+        화면 범위 변경 시 처리
+        
+        Args:
+            view_box (pg.ViewBox): 뷰 박스
+            x_range (tuple): X축 범위
+        """
+        try:
+            self._update_visible_indicators()
+            self._update_volume_profile_item()
+            
+        except Exception as e:
+            self.logger.error(f"화면 구간 지표 계산 중 오류 발생: {str(e)}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+    
+    def _calculate_volume_profile(self):
+        """저장된 봉으로 매물대 계산 (TR 조회 없음)"""
+        self.volume_profile.clear()
+        self.volume_profile_rows = None
+        
+        if self.volume_profile_checkbox.isChecked() and len(self.chart_data.get("close", [])):
+            self.volume_profile.add(
+                np.asarray(self.chart_data["high"], dtype=np.float64),
+                np.asarray(self.chart_data["low"], dtype=np.float64),
+                np.asarray(self.chart_data["close"], dtype=np.float64),
+                np.asarray(self.chart_data["volume"], dtype=np.float64)
+            )
+            self.volume_profile_rows = self.volume_profile.histogram(rows=self.VOLUME_PROFILE_ROWS)
+            
+        self._update_volume_profile_item()
+    
+    def _update_volume_profile_item(self):
+        """매물대 막대를 보이는 구간 왼쪽에 배치"""
+        if self.volume_profile_rows is None or len(self.volume_profile_rows[1]) == 0:
+            self.volume_profile_item.hide()
+            return
+            
+        edges, volumes = self.volume_profile_rows
+        x_min, x_max = self.price_plot.getViewBox().viewRange()[0]
+        max_volume = volumes.max()
+        scale = (x_max - x_min) * self.VOLUME_PROFILE_WIDTH / max_volume if max_volume > 0 else 0
+        
+        self.volume_profile_item.setOpts(
+            x0=np.full(len(volumes), x_min), y0=edges[:-1], width=volumes * scale, height=np.diff(edges)
+        )
+        self.volume_profile_item.show()
+    
+    def _on_volume_profile_changed(self, state):
+        """
+        매물대 표시 변경 시 처리
+        
+        Args:
+            state (int): 체크박스 상태
+        """
+        try:
+            self._calculate_volume_profile()
+            
+        except Exception as e:
+            self.logger.error(f"매물대 계산 중 오류 발생: {str(e)}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+    
+    def _cache_timeframe(self):
+        """
+        지표 캐시 키에 사용할 시간단위
+        
+        Returns:
+            str: 차트 타입 (분봉은 틱 범위, 캔들 변환은 변환 이름 포함)
+        """
+        timeframe = self.current_chart_type
+        if self.current_chart_type == "minute":
+            timeframe = f"minute:{self.current_tick_range}"
+        if self.current_transform:
+            timeframe = f"{timeframe}|{self.current_transform}"
+        return timeframe
+    
+    def _merge_chart_data(self, data):
+        """
+        수신 데이터를 현재 봉 뒤에 이어 붙이기
+        
+        조회 결과는 봉 개수가 정해져 있어 새 봉이 추가되면 가장 오래된 봉이 빠지므로,
+        수신 데이터의 첫 봉부터 현재 봉의 끝까지 겹치는 봉이 모두 같으면
+        겹치지 않는 뒤쪽 봉만 현재 봉에 추가합니다.
+        
+        Args:
+            data (dict): 수신한 차트 데이터 (과거 → 최근 순)
+            
+        Returns:
+            dict: 현재 봉 뒤에 새 봉을 추가한 차트 데이터 (이어지지 않으면 None)
+        """
+        length = len(self.chart_data.get("close", []))
+        if length == 0 or len(data.get("close", [])) == 0:
+            return None
+            
+        columns = [column for column in CHART_COLUMNS if column in self.chart_data and column in data]
+        current = {column: np.asarray(self.chart_data[column]) for column in columns}
+        received = {column: np.asarray(data[column]) for column in columns}
+        
+        # 수신 데이터의 첫 봉과 날짜/시간이 같은 현재 봉 위치 (틱 차트는 같은 시간이 여러 번 나올 수 있음)
+        same_bar = np.ones(length, dtype=bool)
+        for column in ("date", "time"):
+            if column in current:
+                same_bar &= current[column] == received[column][0]
+                
+        for start in np.flatnonzero(same_bar):
+            overlap = length - start
+            if len(received["close"]) >= overlap and all(
+                np.array_equal(current[column][start:], received[column][:overlap]) for column in columns
+            ):
+                merged = dict(data)
+                for column in columns:
+                    merged[column] = np.concatenate([current[column], received[column][overlap:]])
+                return merged
+        return None
+    
+    def _display_data(self):
+        """
+        표시할 차트 데이터
+        
+        캔들 변환을 선택하면 저장된 봉을 로컬에서 변환하며 (TR 조회 없음),
+        새 봉이 추가된 경우 추가된 봉만 이어서 변환합니다.
+        
+        Returns:
+            dict: 컬럼별 리스트 차트 데이터
+        """
+        if self.current_transform is None or len(self.chart_data.get("close", [])) == 0:
+            return self.chart_data
+            
+        if self.transform_pipeline is None:
+            self.transform_pipeline = TransformPipeline(self.CHART_TRANSFORMS[self.current_transform]())
+            self.transform_pipeline.transform(self.chart_data)
+        else:
+            length = self.transform_pipeline.stages[0].source_length
+            if len(self.chart_data["close"]) > length:
+                self.transform_pipeline.append({
+                    column: self.chart_data[column][length:]
+                    for column in CHART_COLUMNS if column in self.chart_data
+                })
+                
+        return {column: values.tolist() for column, values in self.transform_pipeline.output.items()}
+    
+    def _on_transform_changed(self, index):
+        """
+        캔들 변환 변경 시 처리 (저장된 봉을 다시 변환, TR 조회 없음)
+        
+        Args:
+            index (int): 콤보박스 인덱스
+        """
+        try:
+            name = self.transform_combo.currentText()
+            self.current_transform = name if name in self.CHART_TRANSFORMS else None
+            self.transform_pipeline = None
+            
+            self._update_chart()
+            
+        except Exception as e:
+            self.logger.error(f"캔들 변환 변경 중 오류 발생: {str(e)}")
+            import traceback
+            self.logger.error(traceback.format_exc())
+    
     def _on_chart_type_changed(self, index):
         """
         차트 타입 변경 시 처리
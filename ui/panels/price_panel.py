@@ -664,12 +664,12 @@ class PricePanel(QWidget):
             if "종목명" in stock_info:
                 self.name_label.setText(stock_info["종목명"])
             
-            # 현재가 정보 업데이트
+            # 현재가 정보 업데이트 (TR 스키마에서 숫자로 변환된 값)
             try:
-                current_price = abs(int(stock_info.get("현재가", "0").replace(",", "")))
-                price_change = int(stock_info.get("전일대비", "0").replace(",", ""))
-                change_rate = float(stock_info.get("등락율", "0").replace(",", ""))
-                volume = int(stock_info.get("거래량", "0").replace(",", ""))
+                current_price = stock_info.get("현재가", 0)
+                price_change = stock_info.get("전일대비", 0)
+                change_rate = stock_info.get("등락율", 0.0)
+                volume = stock_info.get("거래량", 0)
                 
                 self.current_price.setText(f"{current_price:,}")
                 self.price_change.setText(f"{price_change:+,}")
@@ -717,11 +717,11 @@ class PricePanel(QWidget):
                 
             # 가격 정보 업데이트
             try:
-                self.open_price.setText(f"{abs(int(stock_info.get('시가', '0').replace(',', ''))):,}")
-                self.high_price.setText(f"{abs(int(stock_info.get('고가', '0').replace(',', ''))):,}")
-                self.low_price.setText(f"{abs(int(stock_info.get('저가', '0').replace(',', ''))):,}")
-                self.upper_limit.setText(f"{abs(int(stock_info.get('상한가', '0').replace(',', ''))):,}")
-                self.lower_limit.setText(f"{abs(int(stock_info.get('하한가', '0').replace(',', ''))):,}")
+                self.open_price.setText(f"{stock_info.get('시가', 0):,}")
+                self.high_price.setText(f"{stock_info.get('고가', 0):,}")
+                self.low_price.setText(f"{stock_info.get('저가', 0):,}")
+                self.upper_limit.setText(f"{stock_info.get('상한가', 0):,}")
+                self.lower_limit.setText(f"{stock_info.get('하한가', 0):,}")
             except (ValueError, TypeError) as e:
                 self.logger.error(f"가격 정보 처리 중 오류: {str(e)}")
             